@@ -72,6 +72,17 @@ def create_app(config_name=None):
     else:
         app.service_status_scheduler = None
 
+    # Watch the pages directory so sync status lookups can be served from cache.
+    # Started on the first request each process serves (so every gunicorn
+    # worker gets its own observer), never by CLI commands that only build an app.
+    if not app.config.get("TESTING") and app.config.get("SYNC_STATUS_CACHE_ENABLED"):
+        from app.sync.sync_status_cache import sync_status_cache
+
+        @app.before_request
+        def start_sync_status_cache():
+            if not sync_status_cache.active:
+                sync_status_cache.start(app.config["WIKI_PAGES_DIR"])
+
     # Root route
     @app.route("/")
     def root():
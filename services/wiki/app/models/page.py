@@ -2,9 +2,12 @@
 
 import uuid
 from datetime import datetime, timezone
+from typing import Optional
 
 from app import db
+from app.utils.content_token import compute_content_token
 from sqlalchemy import (
+    BigInteger,
     Boolean,
     Column,
     DateTime,
@@ -13,10 +16,35 @@ from sqlalchemy import (
     Integer,
     String,
     Text,
+    event,
 )
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def datetime_to_ns(value: Optional[datetime]) -> Optional[int]:
+    """
+    Convert a datetime to integer nanoseconds since the Unix epoch.
+
+    Naive datetimes are treated as UTC (timestamps are stored as UTC wall time).
+    Uses integer arithmetic only, so the result is exact to the microsecond.
+    """
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    delta = value - _EPOCH
+    return (delta.days * 86400 + delta.seconds) * 1_000_000_000 + (
+        delta.microseconds * 1000
+    )
+
+
+def _updated_at_ns(context) -> Optional[int]:
+    """Column default: derive updated_at_ns from the updated_at being written"""
+    return datetime_to_ns(context.get_current_parameters().get("updated_at"))
+
 
 class Page(db.Model):
     """Wiki page model"""
@@ -28,6 +56,10 @@ class Page(db.Model):
     slug = Column(String(255), unique=True, nullable=False, index=True)
     file_path = Column(String(500), nullable=False)
     content = Column(Text, nullable=False)
+    # 64-bit change token of content, kept in step by the content set event below
+    content_token = Column(BigInteger, nullable=True)
+    # st_mtime_ns of the file when content was last synced from it
+    file_mtime_ns = Column(BigInteger, nullable=True)
 
     # Relationships
     parent_id = Column(UUID(as_uuid=True), ForeignKey("pages.id"), nullable=True)
@@ -61,13 +93,35 @@ class Page(db.Model):
         default=lambda: datetime.now(timezone.utc),
         onupdate=lambda: datetime.now(timezone.utc),
     )
+    # updated_at as integer nanoseconds, for exact comparison with st_mtime_ns
+    # Must stay declared after updated_at so its default sees the new value
+    updated_at_ns = Column(BigInteger, default=_updated_at_ns, onupdate=_updated_at_ns)
     created_by = Column(UUID(as_uuid=True), nullable=False)
     updated_by = Column(UUID(as_uuid=True), nullable=False)
     version = Column(Integer, default=1)
+    # Number of PageVersion rows, maintained by PageVersion insert/delete events
+    version_count = Column(Integer, default=0, nullable=False)
 
     def __repr__(self):
         return f"<Page {self.slug}>"
 
+    @property
+    def content_bytes(self) -> bytes:
+        """
+        Content encoded as UTF-8, memoized per content string.
+
+        The cache is keyed on the identity of the content string, so assigning
+        new content or reloading the row from the database re-encodes.
+        """
+        content = self.content
+        cached = getattr(self, "_content_bytes_cache", None)
+        if cached is not None and cached[0] is content:
+            return cached[1]
+        encoded = content.encode("utf-8")
+        # Not a mapped column, never persisted
+        self._content_bytes_cache = (content, encoded)
+        return encoded
+
     def to_dict(self):
         """Convert page to dictionary"""
         return {
@@ -88,3 +142,16 @@ class Page(db.Model):
             "updated_by": str(self.updated_by),
             "version": self.version,
         }
+
+
+# Recompute the change token whenever content is assigned through the ORM
+# (constructor or attribute set); loading a row from the database does not fire this
+@event.listens_for(Page.content, "set")
+def _update_content_token(target, value, oldvalue, initiator):
+    if value is None:
+        target.content_token = None
+        return
+    # Encode once: the bytes are kept for content_bytes as well
+    encoded = value.encode("utf-8")
+    target._content_bytes_cache = (value, encoded)
+    target.content_token = compute_content_token(encoded)
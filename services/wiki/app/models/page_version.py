@@ -9,10 +9,13 @@ from sqlalchemy import (
     Column,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
     UniqueConstraint,
+    event,
+    text,
 )
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
@@ -42,9 +45,12 @@ class PageVersion(db.Model):
     # Relationships
     page = relationship("Page", backref="versions")
 
-    # Ensure unique version per page
     __table_args__ = (
+        # Ensure unique version per page
         UniqueConstraint("page_id", "version", name="unique_page_version"),
+        # Newest-first lookups (history listing, latest version) read this index
+        # in order instead of sorting; same definition as the initial migration
+        Index("idx_versions_version", page_id, version.desc()),
     )
 
     def __repr__(self):
@@ -63,3 +69,23 @@ class PageVersion(db.Model):
             "diff_data": self.diff_data,
             "created_at": self.created_at.isoformat() if self.created_at else None,
         }
+
+
+# Keep Page.version_count in step with version rows, in the same flush/transaction.
+# Raw SQL so the pages.updated_at onupdate default does not fire.
+# Bulk Query.delete() bypasses these events; it is only used when the page itself
+# is being deleted.
+@event.listens_for(PageVersion, "after_insert")
+def _increment_page_version_count(mapper, connection, target):
+    connection.execute(
+        text("UPDATE pages SET version_count = version_count + 1 WHERE id = :page_id"),
+        {"page_id": str(target.page_id)},
+    )
+
+
+@event.listens_for(PageVersion, "after_delete")
+def _decrement_page_version_count(mapper, connection, target):
+    connection.execute(
+        text("UPDATE pages SET version_count = version_count - 1 WHERE id = :page_id"),
+        {"page_id": str(target.page_id)},
+    )
@@ -526,6 +526,7 @@ def get_logs():
         level: Filter by log level (ERROR, WARNING, INFO, DEBUG)
     """
     try:
+        from app.utils.json_response import json_response
         from app.utils.log_handler import get_log_handler
 
         # Get query parameters
@@ -536,14 +537,12 @@ def get_logs():
         log_handler = get_log_handler()
         logs = log_handler.get_recent_logs(limit=limit, level=level)
 
-        return (
-            jsonify(
-                {
-                    "logs": logs,
-                    "count": len(logs),
-                    "total_available": len(log_handler.logs),
-                }
-            ),
+        return json_response(
+            {
+                "logs": logs,
+                "count": len(logs),
+                "total_available": len(log_handler.logs),
+            },
             200,
         )
     except Exception as e:
@@ -46,25 +46,13 @@ def root():
     )
 
 
-@wiki_bp.route("/health", methods=["GET"])
-def health_check():
+def _check_auth_service():
     """
-    Health check endpoint with process information.
+    Check the Auth Service connection for the health endpoint.
 
-    Returns standardized health status including process metadata.
-    Does not block on external services to ensure quick response.
+    Returns:
+        Dependency status dict, or None to leave the dependency out
     """
-    from app.utils.health_check import get_health_status
-
-    # Get standard health status with process info
-    health_status = get_health_status(
-        service_name="wiki",
-        version="1.0.0",
-        include_process_info=True,
-    )
-
-    # Optionally check Auth Service connection (non-blocking, very short timeout)
-    # This doesn't affect the wiki service's health status
     try:
         import requests
         from app.services.auth_service_client import get_auth_client
@@ -79,28 +67,47 @@ def health_check():
             headers={"Content-Type": "application/json"},
         )
         # Any response (even 401) means the service is reachable
-        health_status["dependencies"] = {
-            "auth_service": {
-                "status": "reachable",
-                "url": auth_client.base_url,
-                "response_code": response.status_code,
-            }
+        return {
+            "status": "reachable",
+            "url": auth_client.base_url,
+            "response_code": response.status_code,
         }
     except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
         # Auth service unreachable - wiki is still healthy, just note the dependency
-        health_status["dependencies"] = {
-            "auth_service": {
-                "status": "unreachable",
-                "url": auth_client.base_url,
-            }
-        }
         # Don't mark wiki as degraded - it's still functional
+        return {
+            "status": "unreachable",
+            "url": auth_client.base_url,
+        }
     except Exception:
         # Any other error - just skip the auth check
-        pass
+        return None
+
+
+@wiki_bp.route("/health", methods=["GET"])
+def health_check():
+    """
+    Health check endpoint with process information.
+
+    Returns standardized health status including process metadata.
+    Does not block on external services to ensure quick response.
+    """
+    from app.utils.health_check import get_health_status
+    from app.utils.json_response import json_response
+
+    # Get standard health status with process info; the Auth Service check
+    # runs alongside it (very short timeout, and it doesn't affect the wiki
+    # service's health status)
+    health_status = get_health_status(
+        service_name="wiki",
+        version="1.0.0",
+        include_process_info=True,
+        dependency_checks={"auth_service": _check_auth_service},
+        dependency_timeout=0.5,
+    )
 
     # Always return 200 - wiki service is healthy if it can respond
-    return jsonify(health_status), 200
+    return json_response(health_status, 200)
 
 
 @wiki_bp.route("/admin/clear-cache", methods=["POST"])
@@ -8,6 +8,9 @@ from app import db
 from app.models.page import Page
 from flask import current_app
 
+# Chunk size for streaming file comparisons
+READ_CHUNK_SIZE = 64 * 1024
+
 
 class FileService:
     """Service for managing wiki page files"""
@@ -133,7 +136,7 @@ class FileService:
             return f.read()
 
     @staticmethod
-    def write_page_file(page: Page, content: str, file_path: str = None):
+    def write_page_file(page: Page, content: str, file_path: str = None) -> bool:
         """
         Write page content to file system.
         Creates directory structure if needed.
@@ -142,6 +145,9 @@ class FileService:
             page: Page model instance
             content: Markdown content with YAML frontmatter
             file_path: Optional file path (if not provided, uses page.file_path)
+
+        Returns:
+            True if the file was written, False if it already had this content
         """
         # Get file_path, handling SQLite UUID conversion issues
         if not file_path:
@@ -161,8 +167,66 @@ class FileService:
         full_path = FileService.get_full_path(file_path)
         FileService.ensure_directory_exists(full_path)
 
+        return FileService.write_if_changed(full_path, content)
+
+    @staticmethod
+    def write_if_changed(full_path: str, content: str) -> bool:
+        """
+        Write content to a file unless it already holds exactly these bytes.
+
+        Skipping identical writes keeps the file's mtime, so the sync watcher
+        and mtime-based checks don't see a change that isn't one.
+
+        Args:
+            full_path: Absolute file path
+            content: Content to write (UTF-8)
+
+        Returns:
+            True if the file was written, False if it was left untouched
+        """
+        if FileService.file_matches(full_path, content.encode("utf-8")):
+            return False
+
         with open(full_path, "w", encoding="utf-8") as f:
             f.write(content)
+        return True
+
+    @staticmethod
+    def file_matches(
+        full_path: str, data: bytes, st: Optional[os.stat_result] = None
+    ) -> bool:
+        """
+        Check whether a file is byte-for-byte identical to the given data.
+
+        The file size is compared first, so a mismatch costs a stat and no read.
+
+        Args:
+            full_path: Absolute file path
+            data: Bytes to compare against
+            st: Stat result of the file, if the caller already has one
+
+        Returns:
+            True if the file exists and matches exactly
+        """
+        expected = memoryview(data)
+        try:
+            if st is None:
+                st = os.stat(full_path)
+            if st.st_size != len(expected):
+                return False
+
+            # Compare in fixed-size chunks: no file-sized bytes object, and the
+            # first differing chunk ends the read
+            offset = 0
+            with open(full_path, "rb") as f:
+                while chunk := f.read(READ_CHUNK_SIZE):
+                    end = offset + len(chunk)
+                    if expected[offset:end] != chunk:
+                        return False
+                    offset = end
+            return offset == len(expected)
+        except OSError:
+            return False
 
     @staticmethod
     def delete_page_file(page: Page):
@@ -55,7 +55,9 @@ class LinkService:
         return normalized_links
 
     @staticmethod
-    def update_page_links(page_id: uuid.UUID, content: str) -> List[PageLink]:
+    def update_page_links(
+        page_id: uuid.UUID, content: str, commit: bool = True
+    ) -> List[PageLink]:
         """
         Update bidirectional links for a page based on its content.
         Removes old links and creates new ones.
@@ -63,6 +65,7 @@ class LinkService:
         Args:
             page_id: ID of the page
             content: Current markdown content of the page
+            commit: Commit the session (False only flushes, for batched callers)
 
         Returns:
             List of created PageLink instances
@@ -91,7 +94,10 @@ class LinkService:
             db.session.add(link)
             new_links.append(link)
 
-        db.session.commit()
+        if commit:
+            db.session.commit()
+        else:
+            db.session.flush()
 
         return new_links
 
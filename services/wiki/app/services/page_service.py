@@ -1,21 +1,23 @@
 """Page service for CRUD operations and business logic"""
 
-import hashlib
 import os
 import time
 import uuid
 from typing import Dict, List, Optional
 
-import yaml
 from app import db
-from app.models.page import Page
+from app.models.page import Page, datetime_to_ns
 from app.models.page_version import PageVersion
 from app.services.file_service import FileService
 from app.sync.file_scanner import FileScanner
+from app.sync.sync_status_cache import file_hash_cache, sync_status_cache
+from app.sync.sync_utility import RACY_MTIME_WINDOW_NS
+from app.utils.content_token import compute_content_token
 from app.utils.markdown_service import parse_frontmatter
 from app.utils.size_calculator import calculate_content_size_kb, calculate_word_count
 from app.utils.slug_generator import generate_slug, validate_slug
 from flask import current_app
+from sqlalchemy import insert
 from sqlalchemy.exc import IntegrityError
 
 
@@ -54,7 +56,7 @@ class PageService:
         """
         # Generate slug if not provided
         if not slug:
-            existing_slugs = [p.slug for p in Page.query.with_entities(Page.slug).all()]
+            existing_slugs = {p.slug for p in Page.query.with_entities(Page.slug).all()}
             slug = generate_slug(title, existing_slugs)
         else:
             if not validate_slug(slug):
@@ -197,6 +199,159 @@ class PageService:
         old_file_path = page.file_path
         old_content = page.content
 
+        PageService._apply_page_updates(
+            page,
+            user_id,
+            title=title,
+            content=content,
+            slug=slug,
+            parent_id=parent_id,
+            section=section,
+            status=status,
+            is_public=is_public,
+        )
+        PageService._write_updated_page_file(page, old_file_path)
+
+        db.session.commit()
+
+        # Store original version before version creation
+        original_version = page.version
+
+        # Create version if content changed
+        if content is not None and content != old_content:
+            PageService._create_version(page, user_id, "Page updated")
+            # The version was incremented in the database via raw SQL in _create_version
+            # Manually increment the page object's version to reflect the database change
+            # This is necessary because the page object is stale after _create_version commits
+            page.version = original_version + 1
+
+        return page
+
+    @staticmethod
+    def update_page_bulk(updates: List[Dict], user_id: uuid.UUID) -> List[Page]:
+        """
+        Apply several page updates with a single version INSERT and commit.
+
+        Each update is a dict with a "page_id" key plus any of update_page's
+        keyword arguments (title, content, slug, ...). Updates are applied in
+        order and a page may appear more than once: every content change gets
+        its own version, as if update_page had been called for each entry,
+        but each page file is written once with its final state.
+
+        Args:
+            updates: List of update dicts, each with at least "page_id"
+            user_id: ID of user making the updates
+
+        Returns:
+            List of updated Page instances, in the order first updated
+
+        Raises:
+            ValueError: If a page is not found or a slug is invalid/duplicate.
+                No update in the batch is applied.
+        """
+        pages = {}
+        old_file_paths = {}
+        # page_id -> [(title, content)] for each content change, in order
+        snapshots = {}
+
+        try:
+            for update in updates:
+                fields = dict(update)
+                page_id = fields.pop("page_id")
+
+                page = pages.get(page_id)
+                if page is None:
+                    page = db.session.get(Page, page_id)
+                    if not page:
+                        raise ValueError(f"Page not found: {page_id}")
+                    pages[page_id] = page
+                    old_file_paths[page_id] = page.file_path
+                    snapshots[page_id] = []
+
+                old_content = page.content
+                PageService._apply_page_updates(page, user_id, **fields)
+
+                content = fields.get("content")
+                if content is not None and content != old_content:
+                    snapshots[page_id].append((page.title, page.content))
+        except ValueError:
+            db.session.rollback()
+            raise
+
+        for page_id, page in pages.items():
+            PageService._write_updated_page_file(page, old_file_paths[page_id])
+
+        rows = []
+        for page_id, page_snapshots in snapshots.items():
+            if not page_snapshots:
+                continue
+
+            page = pages[page_id]
+            latest_version = (
+                PageVersion.query.filter_by(page_id=page_id)
+                .order_by(PageVersion.version.desc())
+                .first()
+            )
+            if latest_version:
+                next_version = latest_version.version + 1
+                prev_content = latest_version.content
+            else:
+                next_version = page.version if page.version > 0 else 1
+                prev_content = None
+
+            for title, content in page_snapshots:
+                rows.append(
+                    {
+                        "page_id": page_id,
+                        "title": title,
+                        "content": content,
+                        "change_summary": "Page updated",
+                        "changed_by": user_id,
+                        "version": next_version,
+                        "diff_data": PageService._calculate_line_diff(
+                            prev_content, content
+                        ),
+                    }
+                )
+                prev_content = content
+                next_version += 1
+
+            # Same convention as _create_version: pages.version is one past
+            # the latest version row
+            page.version = next_version
+            # The bulk INSERT below does not fire PageVersion's after_insert
+            # event, so keep the denormalized counter in step here
+            db.session.execute(
+                db.text(
+                    "UPDATE pages SET version_count = version_count + :added "
+                    "WHERE id = :page_id"
+                ),
+                {"page_id": str(page_id), "added": len(page_snapshots)},
+            )
+
+        if rows:
+            # One multi-row INSERT (executemany) for every version in the batch
+            db.session.execute(insert(PageVersion), rows)
+
+        db.session.commit()
+
+        return list(pages.values())
+
+    @staticmethod
+    def _apply_page_updates(
+        page: Page,
+        user_id: uuid.UUID,
+        title: Optional[str] = None,
+        content: Optional[str] = None,
+        slug: Optional[str] = None,
+        parent_id: Optional[uuid.UUID] = None,
+        section: Optional[str] = None,
+        status: Optional[str] = None,
+        is_public: Optional[bool] = None,
+    ):
+        """Apply update_page field changes to a page object (no file write or commit)"""
+        page_id = page.id
+
         # Update fields
         if title is not None:
             page.title = title
@@ -255,6 +410,9 @@ class PageService:
 
         page.updated_by = user_id
 
+    @staticmethod
+    def _write_updated_page_file(page: Page, old_file_path: Optional[str]):
+        """Write (and move, if its path changed) the file for an updated page"""
         # Recalculate file path if structure changed
         new_file_path = FileService.calculate_file_path(page)
         if new_file_path != old_file_path:
@@ -300,21 +458,6 @@ class PageService:
             )
             FileService.write_page_file(page, file_content)
 
-        db.session.commit()
-
-        # Store original version before version creation
-        original_version = page.version
-
-        # Create version if content changed
-        if content is not None and content != old_content:
-            PageService._create_version(page, user_id, "Page updated")
-            # The version was incremented in the database via raw SQL in _create_version
-            # Manually increment the page object's version to reflect the database change
-            # This is necessary because the page object is stale after _create_version commits
-            page.version = original_version + 1
-
-        return page
-
     @staticmethod
     def delete_page(page_id: uuid.UUID, user_id: uuid.UUID) -> Dict:
         """
@@ -541,6 +684,8 @@ class PageService:
             frontmatter["status"] = page.status
 
         # Build YAML frontmatter
+        import yaml
+
         frontmatter_yaml = yaml.dump(
             frontmatter, default_flow_style=False, sort_keys=False
         )
@@ -569,12 +714,29 @@ class PageService:
             frontmatter["status"] = status
 
         # Build YAML frontmatter
+        import yaml
+
         frontmatter_yaml = yaml.dump(
             frontmatter, default_flow_style=False, sort_keys=False
         )
 
         return f"---\n{frontmatter_yaml}---\n{markdown_content}"
 
+    @staticmethod
+    def _calculate_line_diff(old_content: Optional[str], new_content: str) -> Dict:
+        """Simple line-count diff stored on versions ({} for the first version)"""
+        if old_content is None:
+            return {}
+
+        old_lines = old_content.split("\n")
+        new_lines = new_content.split("\n")
+        return {
+            "old_line_count": len(old_lines),
+            "new_line_count": len(new_lines),
+            "lines_added": max(0, len(new_lines) - len(old_lines)),
+            "lines_removed": max(0, len(old_lines) - len(new_lines)),
+        }
+
     @staticmethod
     def _create_version(
         page: Page,
@@ -648,17 +810,9 @@ class PageService:
                 except Exception:
                     content_for_diff = ""
 
-        diff_data = {}
-        if prev_version:
-            # Simple diff: store line-by-line comparison
-            old_lines = prev_version.content.split("\n")
-            new_lines = content_for_diff.split("\n")
-            diff_data = {
-                "old_line_count": len(old_lines),
-                "new_line_count": len(new_lines),
-                "lines_added": max(0, len(new_lines) - len(old_lines)),
-                "lines_removed": max(0, len(old_lines) - len(new_lines)),
-            }
+        diff_data = PageService._calculate_line_diff(
+            prev_version.content if prev_version else None, content_for_diff
+        )
 
         # Get page attributes, using stored values if provided, otherwise try to access from page object
         # Only access page object if we're missing values
@@ -775,47 +929,23 @@ class PageService:
         if not page.file_path:
             return None
 
-        pages_dir = current_app.config.get("WIKI_PAGES_DIR", "data/pages")
-        file_mtime = FileScanner.get_file_modification_time(page.file_path, pages_dir)
-
-        if not file_mtime:
-            # File doesn't exist, no conflict
-            return None
-
-        # Check if file is newer than database
-        db_time = page.updated_at.timestamp() if page.updated_at else 0
-        file_newer = file_mtime > db_time
-
-        # Check if content differs (if content comparison enabled)
+        # Stat the file, and compare content if content comparison is enabled
         enable_content_comparison = current_app.config.get(
             "SYNC_ENABLE_CONTENT_COMPARISON", True
         )
-        content_different = False
-
-        if enable_content_comparison:
-            try:
-                # Read and hash file content
-                full_path = os.path.join(pages_dir, page.file_path)
-                if os.path.exists(full_path):
-                    with open(full_path, "r", encoding="utf-8") as f:
-                        file_content = f.read()
-
-                    # Reconstruct full content with frontmatter for comparison
-                    file_frontmatter, file_markdown = parse_frontmatter(file_content)
-                    file_full_content = PageService._reconstruct_content_for_hash(
-                        file_frontmatter, file_markdown
-                    )
-                    file_hash = hashlib.sha256(
-                        file_full_content.encode("utf-8")
-                    ).hexdigest()
+        file_state = PageService._get_file_sync_state(
+            page, include_content=enable_content_comparison
+        )
+        file_mtime_ns = file_state["file_mtime_ns"]
 
-                    # Hash database content
-                    db_hash = hashlib.sha256(page.content.encode("utf-8")).hexdigest()
+        if not file_mtime_ns:
+            # File doesn't exist, no conflict
+            return None
 
-                    content_different = file_hash != db_hash
-            except Exception:
-                # If content comparison fails, assume content might differ
-                content_different = True
+        # Check if file is newer than database (compared as integer nanoseconds)
+        db_time_ns = PageService._get_updated_at_ns(page)
+        file_newer = file_mtime_ns > db_time_ns
+        content_different = bool(file_state.get("content_different"))
 
         # Only report conflict if file is newer or content differs
         if not file_newer and not content_different:
@@ -823,8 +953,7 @@ class PageService:
 
         # Check grace period
         grace_period = current_app.config.get("SYNC_CONFLICT_GRACE_PERIOD_SECONDS", 600)
-        current_time = time.time()
-        time_since_db_update = current_time - db_time
+        time_since_db_update = (time.time_ns() - db_time_ns) / 1_000_000_000
         grace_period_remaining = max(0, grace_period - time_since_db_update)
 
         # Build conflict message
@@ -849,8 +978,8 @@ class PageService:
             "has_conflict": True,
             "file_newer": file_newer,
             "content_different": content_different,
-            "file_modification_time": file_mtime,
-            "database_updated_at": db_time,
+            "file_modification_time": file_mtime_ns / 1_000_000_000,
+            "database_updated_at": db_time_ns / 1_000_000_000,
             "grace_period_remaining": (
                 grace_period_remaining if grace_period_remaining > 0 else None
             ),
@@ -879,34 +1008,125 @@ class PageService:
         if not page.file_path:
             return None
 
-        pages_dir = current_app.config.get("WIKI_PAGES_DIR", "data/pages")
-        file_mtime = FileScanner.get_file_modification_time(page.file_path, pages_dir)
+        file_mtime_ns = PageService._get_file_sync_state(page)["file_mtime_ns"]
 
-        if file_mtime is None:
+        if file_mtime_ns is None:
             # File doesn't exist
             return None
 
-        db_time = page.updated_at.timestamp() if page.updated_at else 0
+        db_time_ns = PageService._get_updated_at_ns(page)
 
         # Determine which source is newer
-        time_diff = file_mtime - db_time
-        is_synced = abs(time_diff) < 1.0  # Consider synced if within 1 second
+        time_diff_ns = file_mtime_ns - db_time_ns
+        # Consider synced if within 1 second
+        is_synced = abs(time_diff_ns) < 1_000_000_000
 
         if is_synced:
             last_updated_source = "synced"
-        elif file_mtime > db_time:
+        elif time_diff_ns > 0:
             last_updated_source = "file"
         else:
             last_updated_source = "database"
 
+        # Convert to float seconds only for the returned values
         return {
             "last_updated_source": last_updated_source,
-            "file_modification_time": file_mtime,
-            "database_updated_at": db_time,
+            "file_modification_time": file_mtime_ns / 1_000_000_000,
+            "database_updated_at": db_time_ns / 1_000_000_000,
             "is_synced": is_synced,
-            "time_difference_seconds": time_diff,
+            "time_difference_seconds": time_diff_ns / 1_000_000_000,
         }
 
+    @staticmethod
+    def _get_updated_at_ns(page: Page) -> int:
+        """Get page.updated_at as integer nanoseconds (0 if never set)"""
+        if page.updated_at_ns is not None:
+            return page.updated_at_ns
+        # Rows written before updated_at_ns existed
+        return datetime_to_ns(page.updated_at) or 0
+
+    @staticmethod
+    def _get_file_sync_state(page: Page, include_content: bool = False) -> Dict:
+        """
+        Get file-derived sync state for a page, using the sync status cache.
+
+        While the file watcher behind sync_status_cache is running, the stat
+        (and content hash) of the page file is reused until the file changes on
+        disk or the page row changes in the database.
+
+        Args:
+            page: Page instance with a file_path
+            include_content: Also compare file content against page.content
+
+        Returns:
+            Dictionary with:
+            - file_mtime_ns: int (nanoseconds since epoch) or None if file doesn't exist
+            - content_different: bool (only present if include_content is True)
+        """
+        pages_dir = current_app.config.get("WIKI_PAGES_DIR", "data/pages")
+        version_key = (page.id, page.updated_at, page.version)
+
+        state = sync_status_cache.get(page.file_path, version_key)
+        if state is not None and (not include_content or "content_different" in state):
+            return state
+
+        epoch = sync_status_cache.epoch
+        state = dict(state) if state else {}
+        if "file_mtime_ns" not in state:
+            state["file_mtime_ns"] = FileScanner.get_file_modification_time_ns(
+                page.file_path, pages_dir
+            )
+
+        if include_content and state["file_mtime_ns"]:
+            try:
+                full_path = os.path.join(pages_dir, page.file_path)
+                stat_time_ns = time.time_ns()
+                st = os.stat(full_path)
+                file_key = (full_path, st.st_mtime_ns, st.st_size)
+                # A rewrite in the same timestamp tick would keep an mtime this
+                # recent, so it can't vouch for the content on a later check
+                trusted = stat_time_ns - st.st_mtime_ns >= RACY_MTIME_WINDOW_NS
+
+                # Reuse the normalized hash while the file's mtime and size are
+                # unchanged: first from this Page instance (repeat checks in one
+                # request), then from the process-wide cache
+                cached = getattr(page, "_cached_file_hash", None)
+                if cached is not None and cached[0] == file_key:
+                    file_hash = cached[1]
+                else:
+                    file_hash = file_hash_cache.get(*file_key)
+                if file_hash is None:
+                    # Read and hash file content
+                    with open(full_path, "r", encoding="utf-8") as f:
+                        file_content = f.read()
+
+                    # Reconstruct full content with frontmatter for comparison
+                    file_frontmatter, file_markdown = parse_frontmatter(file_content)
+                    file_full_content = PageService._reconstruct_content_for_hash(
+                        file_frontmatter, file_markdown
+                    )
+                    file_hash = compute_content_token(file_full_content)
+                    if trusted:
+                        file_hash_cache.set(*file_key, file_hash)
+                if trusted:
+                    # Not a mapped column, never persisted
+                    page._cached_file_hash = (file_key, file_hash)
+
+                # Database content token is stored on the row
+                db_hash = page.content_token
+                if db_hash is None:
+                    db_hash = compute_content_token(page.content_bytes)
+
+                state["content_different"] = file_hash != db_hash
+            except Exception:
+                # If content comparison fails, assume content might differ
+                # (not cached, so the comparison is retried next time)
+                state["content_different"] = True
+                return state
+
+        sync_status_cache.set(page.file_path, version_key, state, epoch)
+        return state
+
     @staticmethod
     def _reconstruct_content_for_hash(frontmatter: Dict, markdown_content: str) -> str:
         """
@@ -924,5 +1144,7 @@ class PageService:
         if not frontmatter:
             return markdown_content
 
+        import yaml
+
         yaml_str = yaml.dump(frontmatter, default_flow_style=False, allow_unicode=True)
         return f"---\n{yaml_str}---\n\n{markdown_content}"
@@ -15,7 +15,7 @@ class SearchIndexService:
 
     @staticmethod
     def index_page(
-        page_id: uuid.UUID, content: str, title: str = None
+        page_id: uuid.UUID, content: str, title: str = None, commit: bool = True
     ) -> List[IndexEntry]:
         """
         Index a page for search (full-text and keywords).
@@ -25,6 +25,7 @@ class SearchIndexService:
             page_id: ID of the page to index
             content: Markdown content of the page
             title: Optional page title (if not provided, will fetch from page)
+            commit: Commit the session (False only flushes, for batched callers)
 
         Returns:
             List of created IndexEntry instances
@@ -68,7 +69,10 @@ class SearchIndexService:
         # Save to database
         for entry in all_entries:
             db.session.add(entry)
-        db.session.commit()
+        if commit:
+            db.session.commit()
+        else:
+            db.session.flush()
 
         return all_entries
 
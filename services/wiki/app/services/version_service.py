@@ -1,6 +1,5 @@
 """Version service for wiki page history"""
 
-import difflib
 import uuid
 from typing import Dict, List, Optional
 
@@ -8,13 +7,26 @@ from app import db
 from app.models.page import Page
 from app.models.page_version import PageVersion
 
+# Try to import cydifflib (C port of difflib, same API), but make it optional
+try:
+    import cydifflib as difflib
+
+    CYDIFFLIB_AVAILABLE = True
+except ImportError:
+    import difflib
+
+    CYDIFFLIB_AVAILABLE = False
+
 
 class VersionService:
     """Service for managing page version history"""
 
     @staticmethod
     def create_version(
-        page_id: uuid.UUID, user_id: uuid.UUID, change_summary: str = None
+        page_id: uuid.UUID,
+        user_id: uuid.UUID,
+        change_summary: str = None,
+        commit: bool = True,
     ) -> PageVersion:
         """
         Create a new version snapshot of a page.
@@ -23,6 +35,7 @@ class VersionService:
             page_id: ID of the page
             user_id: ID of the user making the change
             change_summary: Optional summary of changes
+            commit: Commit the session (False only flushes, for batched callers)
 
         Returns:
             Created PageVersion instance
@@ -34,12 +47,7 @@ class VersionService:
         # Get the next version number
         # Use page.version which is already incremented by PageService
         # If no versions exist yet, start at 1
-        latest_version = (
-            db.session.query(PageVersion)
-            .filter_by(page_id=page_id)
-            .order_by(PageVersion.version.desc())
-            .first()
-        )
+        latest_version = VersionService.get_latest_version(page_id)
 
         if latest_version:
             next_version = latest_version.version + 1
@@ -75,7 +83,10 @@ class VersionService:
         # So we need to set it to next_version + 1 so the next version will be next_version + 1
         page.version = next_version + 1
 
-        db.session.commit()
+        if commit:
+            db.session.commit()
+        else:
+            db.session.flush()
 
         return version
 
@@ -93,6 +104,21 @@ class VersionService:
         """
         old_lines = old_content.splitlines(keepends=True)
         new_lines = new_content.splitlines(keepends=True)
+        old_char_count = len(old_content)
+        new_char_count = len(new_content)
+
+        # Unchanged content (e.g. snapshot versions) needs no matcher run
+        if old_content == new_content:
+            return {
+                "diff": [],
+                "added_lines": 0,
+                "removed_lines": 0,
+                "old_line_count": len(old_lines),
+                "new_line_count": len(new_lines),
+                "old_char_count": old_char_count,
+                "new_char_count": new_char_count,
+                "char_diff": 0,
+            }
 
         # Calculate line-based diff
         diff = list(
@@ -113,8 +139,6 @@ class VersionService:
         )
 
         # Calculate character-level changes
-        old_char_count = len(old_content)
-        new_char_count = len(new_content)
         char_diff = new_char_count - old_char_count
 
         return {
@@ -333,7 +357,9 @@ class VersionService:
         Returns:
             Number of versions
         """
-        return db.session.query(PageVersion).filter_by(page_id=page_id).count()
+        # Denormalized counter maintained by PageVersion insert/delete events
+        count = db.session.query(Page.version_count).filter_by(id=page_id).scalar()
+        return count or 0
 
     @staticmethod
     def delete_version(page_id: uuid.UUID, version: int) -> bool:
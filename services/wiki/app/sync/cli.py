@@ -3,6 +3,7 @@
 import argparse
 import signal
 import sys
+from functools import lru_cache
 
 from app import create_app
 from app.sync.file_watcher import FileWatcher
@@ -60,7 +61,7 @@ def sync_file_command(file_path: str, force: bool = False, admin_user_id: str =
             elif status is False:
                 action = "Updated"
             else:
-                action = "Skipped (file not newer)"
+                action = "Skipped (file not newer, or unchanged)"
             print(f"{action} page: {page.title} (slug: {page.slug})")
         except Exception as e:
             print(f"Error syncing file: {e}")
@@ -132,8 +133,9 @@ def watch_command(admin_user_id: str = None, debounce: float = 1.0):
         sys.exit(1)
 
 
-def main():
-    """Main CLI entry point"""
+@lru_cache(maxsize=None)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the CLI argument parser (once per process; parse_args keeps no state)"""
     parser = argparse.ArgumentParser(description="Wiki sync utility")
     subparsers = parser.add_subparsers(dest="command", help="Command to run")
 
@@ -184,6 +186,12 @@ def main():
         help="Debounce time in seconds (default: 1.0)",
     )
 
+    return parser
+
+
+def main():
+    """Main CLI entry point"""
+    parser = _build_parser()
     args = parser.parse_args()
 
     if not args.command:
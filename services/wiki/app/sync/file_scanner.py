@@ -1,10 +1,44 @@
 """File scanner for finding markdown files"""
 
 import os
-from typing import List, Optional
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from flask import current_app
 
+# Queued directories needed before switching from a serial to a parallel scan
+SCAN_PARALLEL_MIN_DIRS = 32
+
+
+@lru_cache(maxsize=4096)
+def _resolve(file_path: str, base_directory: str) -> Optional[Tuple[str, str]]:
+    """
+    Normalize a scan_file path against the base directory.
+
+    Pure string work with no file system access, so results are memoized;
+    the watcher and sync passes resolve the same paths repeatedly.
+
+    Returns:
+        (relative path with forward slashes, full path), or None if an
+        absolute path is outside base_directory
+    """
+    # If file_path is already relative, use it as-is
+    if os.path.isabs(file_path):
+        # Absolute path - check if it's within base_directory
+        if not file_path.startswith(base_directory):
+            return None
+        rel_path = os.path.relpath(file_path, base_directory)
+    else:
+        # Relative path
+        rel_path = file_path
+
+    # Normalize to forward slashes for cross-platform compatibility
+    rel_path = rel_path.replace("\\", "/")
+
+    return rel_path, os.path.join(base_directory, rel_path)
+
 
 class FileScanner:
     """Scans for markdown files in the pages directory"""
@@ -20,6 +54,30 @@ class FileScanner:
         Returns:
             List of file paths relative to pages directory
         """
+        return sorted(FileScanner._walk(directory, with_stats=False))
+
+    @staticmethod
+    def scan_directory_stats(
+        directory: Optional[str] = None,
+    ) -> Dict[str, os.stat_result]:
+        """
+        Scan directory for all .md files, with each file's stat result.
+
+        The stat comes from the DirEntry found by the scan (free on Windows,
+        one stat per file elsewhere, done on the scan threads), so callers
+        that need metadata for every file don't stat again.
+
+        Args:
+            directory: Directory to scan (defaults to WIKI_PAGES_DIR)
+
+        Returns:
+            Dict of relative file path -> os.stat_result, in sorted path order
+        """
+        return dict(sorted(FileScanner._walk(directory, with_stats=True)))
+
+    @staticmethod
+    def _walk(directory: Optional[str], with_stats: bool) -> list:
+        """Scan a tree; items are relative paths, or (path, stat) pairs with_stats"""
         if directory is None:
             directory = current_app.config.get("WIKI_PAGES_DIR", "data/pages")
 
@@ -27,19 +85,101 @@ class FileScanner:
             return []
 
         markdown_files = []
+        workers = current_app.config.get("SYNC_SCAN_WORKERS", 16)
+
+        # Iterative walk with os.scandir, serial while the tree is small.
+        # Queue items are (directory, relative prefix with forward slashes).
+        pending = deque([(directory, "")])
+        while pending:
+            if workers > 1 and len(pending) >= SCAN_PARALLEL_MIN_DIRS:
+                # Wide tree: overlap the remaining scandir calls (which release
+                # the GIL) across a thread pool - helps on network mounts
+                markdown_files.extend(
+                    FileScanner._scan_parallel(pending, workers, with_stats)
+                )
+                break
 
-        # Walk through directory recursively
-        for root, dirs, files in os.walk(directory):
-            for file in files:
-                if file.endswith(".md"):
-                    full_path = os.path.join(root, file)
-                    # Get relative path from pages directory
-                    rel_path = os.path.relpath(full_path, directory)
-                    # Normalize to forward slashes for cross-platform compatibility
-                    rel_path = rel_path.replace("\\", "/")
-                    markdown_files.append(rel_path)
+            files, subdirs = FileScanner._scan_one(*pending.popleft(), with_stats)
+            markdown_files.extend(files)
+            pending.extend(subdirs)
 
-        return sorted(markdown_files)
+        return markdown_files
+
+    @staticmethod
+    def _scan_one(
+        current_dir: str, rel_prefix: str, with_stats: bool = False
+    ) -> Tuple[list, List[Tuple[str, str]]]:
+        """
+        List one directory.
+
+        DirEntry type checks use the d_type returned with the listing, so most
+        entries need no extra stat.
+
+        Args:
+            current_dir: Directory to list
+            rel_prefix: Its path relative to the scan root, with a trailing "/"
+            with_stats: Return (path, DirEntry.stat()) pairs instead of paths
+
+        Returns:
+            Tuple of (relative .md file paths, [(subdirectory, relative prefix)])
+        """
+        files = []
+        subdirs = []
+        try:
+            entries = os.scandir(current_dir)
+        except OSError:
+            # Unreadable directory, skip it (as os.walk does)
+            return files, subdirs
+
+        with entries:
+            for entry in entries:
+                try:
+                    # Symlinked files count, as with os.walk
+                    if entry.name.endswith(".md") and entry.is_file():
+                        rel_path = rel_prefix + entry.name
+                        files.append(
+                            (rel_path, entry.stat()) if with_stats else rel_path
+                        )
+                    elif entry.is_dir(follow_symlinks=False):
+                        subdirs.append((entry.path, f"{rel_prefix}{entry.name}/"))
+                except OSError:
+                    continue
+
+        return files, subdirs
+
+    @staticmethod
+    def _scan_parallel(
+        pending: Iterable[Tuple[str, str]], workers: int, with_stats: bool = False
+    ) -> list:
+        """
+        Scan directories (and everything below them) on a thread pool.
+
+        Args:
+            pending: (directory, relative prefix) pairs still to scan
+            workers: Number of scan threads
+            with_stats: Return (path, stat) pairs instead of paths
+
+        Returns:
+            Relative .md file paths found (unsorted)
+        """
+        markdown_files = []
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            in_flight = {
+                executor.submit(FileScanner._scan_one, *item, with_stats)
+                for item in pending
+            }
+            # Done when no listing is in flight and none produced new work
+            while in_flight:
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    files, subdirs = future.result()
+                    markdown_files.extend(files)
+                    in_flight.update(
+                        executor.submit(FileScanner._scan_one, *item, with_stats)
+                        for item in subdirs
+                    )
+
+        return markdown_files
 
     @staticmethod
     def scan_file(
@@ -58,26 +198,51 @@ class FileScanner:
         if base_directory is None:
             base_directory = current_app.config.get("WIKI_PAGES_DIR", "data/pages")
 
-        # If file_path is already relative, use it as-is
-        if os.path.isabs(file_path):
-            # Absolute path - check if it's within base_directory
-            if not file_path.startswith(base_directory):
-                return None
-            rel_path = os.path.relpath(file_path, base_directory)
-        else:
-            # Relative path
-            rel_path = file_path
-
-        # Normalize to forward slashes for cross-platform compatibility
-        rel_path = rel_path.replace("\\", "/")
-
-        full_path = os.path.join(base_directory, rel_path)
+        resolved = _resolve(file_path, base_directory)
+        if resolved is None:
+            return None
+        rel_path, full_path = resolved
 
-        if os.path.exists(full_path) and full_path.endswith(".md"):
+        if full_path.endswith(".md") and os.path.exists(full_path):
             return rel_path
 
         return None
 
+    @staticmethod
+    def stat_file(
+        file_path: str, base_directory: Optional[str] = None
+    ) -> Optional[os.stat_result]:
+        """
+        Stat a file once, for callers that need several of its fields.
+
+        Args:
+            file_path: Relative file path
+            base_directory: Base directory (defaults to WIKI_PAGES_DIR)
+
+        Returns:
+            os.stat_result, or None if file doesn't exist
+        """
+        if base_directory is None:
+            base_directory = current_app.config.get("WIKI_PAGES_DIR", "data/pages")
+
+        return FileScanner.stat_path(os.path.join(base_directory, file_path))
+
+    @staticmethod
+    def stat_path(full_path: str) -> Optional[os.stat_result]:
+        """
+        Stat a file by its full path (for callers that already joined it).
+
+        Args:
+            full_path: File path including the base directory
+
+        Returns:
+            os.stat_result, or None if file doesn't exist
+        """
+        try:
+            return os.stat(full_path)
+        except (FileNotFoundError, NotADirectoryError):
+            return None
+
     @staticmethod
     def get_file_modification_time(
         file_path: str, base_directory: Optional[str] = None
@@ -92,12 +257,32 @@ class FileScanner:
         Returns:
             Modification time as float (Unix timestamp), or None if file doesn't exist
         """
+        st = FileScanner.stat_file(file_path, base_directory)
+        return st.st_mtime if st is not None else None
+
+    @staticmethod
+    def get_file_modification_time_ns(
+        file_path: str, base_directory: Optional[str] = None
+    ) -> Optional[int]:
+        """
+        Get file modification time in integer nanoseconds.
+
+        Unlike get_file_modification_time, this does not round-trip through a
+        float, so it can be compared exactly with Page.updated_at_ns.
+
+        Args:
+            file_path: Relative file path
+            base_directory: Base directory (defaults to WIKI_PAGES_DIR)
+
+        Returns:
+            Modification time in nanoseconds since the Unix epoch, or None if file doesn't exist
+        """
         if base_directory is None:
             base_directory = current_app.config.get("WIKI_PAGES_DIR", "data/pages")
 
         full_path = os.path.join(base_directory, file_path)
 
-        if os.path.exists(full_path):
-            return os.path.getmtime(full_path)
-
-        return None
+        try:
+            return os.stat(full_path).st_mtime_ns
+        except FileNotFoundError:
+            return None
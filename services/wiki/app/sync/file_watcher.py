@@ -39,6 +39,7 @@ import threading
 import time
 from typing import Dict, Optional
 
+from app.sync.file_scanner import FileScanner
 from app.sync.sync_utility import SyncUtility
 from flask import Flask
 from watchdog.events import FileSystemEvent, FileSystemEventHandler
@@ -236,13 +237,16 @@ class MarkdownFileHandler(FileSystemEventHandler):
 
         try:
             with self.app.app_context():
-                # Verify file still exists (might have been deleted)
-                full_path = os.path.join(self.sync_utility.pages_dir, file_path)
-                if not os.path.exists(full_path):
+                # Verify file still exists (might have been deleted); the same
+                # stat serves sync_file's checks
+                st = FileScanner.stat_file(file_path, self.sync_utility.pages_dir)
+                if st is None:
                     return
 
                 # Sync the file
-                page, status = self.sync_utility.sync_file(file_path, force=False)
+                page, status = self.sync_utility.sync_file(
+                    file_path, force=False, st=st
+                )
 
                 if status is True:
                     print(f"[WATCHER] Created: {file_path} (slug: {page.slug})")
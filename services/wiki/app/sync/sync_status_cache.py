@@ -0,0 +1,294 @@
+"""
+In-process cache for file-derived sync status.
+
+PageService.check_sync_conflict and PageService.get_sync_status stat (and
+optionally read and hash) a page's markdown file on every request. While the
+cache is active, those file-derived facts are remembered per file path and only
+recomputed after the file changes on disk.
+
+Invalidation is push-based rather than polled: a watchdog observer on the pages
+directory queues a path as stale whenever a markdown file is written, deleted
+or moved. Queued invalidations are applied on the next lookup (or explicitly
+via drain()), so readers never see an entry for a file that has changed since
+the last event was delivered.
+
+Entries are also versioned by the page's database state, so a database write
+misses the cache without needing a hook of its own.
+
+Usage:
+    from app.sync.sync_status_cache import sync_status_cache
+
+    sync_status_cache.start(app.config["WIKI_PAGES_DIR"])
+    ...
+    state = sync_status_cache.get(page.file_path, version_key)
+    if state is None:
+        epoch = sync_status_cache.epoch
+        state = compute_state()
+        sync_status_cache.set(page.file_path, version_key, state, epoch)
+
+The cache is inactive (every lookup misses) until start() has been called.
+create_app starts it on the first request a process serves, so code paths that
+never serve a request - tests, one-off CLI commands - don't run an observer and
+keep reading the file system directly.
+"""
+
+import os
+import queue
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+from watchdog.events import FileSystemEvent, FileSystemEventHandler
+from watchdog.observers import Observer
+
+# Sentinel queued by invalidate() with no path: drop every entry
+_ALL = object()
+
+# Events that change a file's mtime or content. "opened" is deliberately
+# excluded: reading a page file to compare content must not invalidate it.
+_INVALIDATING_EVENTS = {"created", "modified", "closed", "deleted", "moved"}
+
+
+class _InvalidationHandler(FileSystemEventHandler):
+    """Queues invalidations for markdown files changed under the pages directory"""
+
+    def __init__(self, cache: "SyncStatusCache", pages_abs: str):
+        super().__init__()
+        self.cache = cache
+        self.pages_abs = pages_abs
+
+    def _relative_path(self, path: str) -> Optional[str]:
+        """Convert an event path to a page file_path, or None if not a page file"""
+        if not path or not path.lower().endswith(".md"):
+            return None
+        file_abs = os.path.abspath(path)
+        if not file_abs.startswith(self.pages_abs):
+            return None
+        return os.path.relpath(file_abs, self.pages_abs).replace("\\", "/")
+
+    def on_any_event(self, event: FileSystemEvent):
+        """Invalidate the source (and destination, for moves) of a file change"""
+        if event.event_type not in _INVALIDATING_EVENTS:
+            return
+
+        if event.is_directory:
+            # Directory moves/deletes can affect many pages at once
+            if event.event_type in ("deleted", "moved"):
+                self.cache.invalidate()
+            return
+
+        for path in (event.src_path, getattr(event, "dest_path", None)):
+            rel_path = self._relative_path(path)
+            if rel_path:
+                self.cache.invalidate(rel_path)
+
+
+class SyncStatusCache:
+    """
+    Cache of file-derived sync facts keyed by page file path.
+
+    Each entry is stored with a version key describing the database state it
+    was computed against; a lookup with a different version key is a miss.
+    Invalidations arrive from the watchdog observer thread through a queue and
+    are applied by the reading thread, keeping the observer callback O(1).
+
+    Attributes:
+        epoch: Incremented every time an invalidation is applied. Callers read
+            it before computing a value and pass it to set(), which discards
+            the value if a file event was applied in the meantime.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Tuple[Hashable, Dict[str, Any]]] = {}
+        self._pending: "queue.SimpleQueue" = queue.SimpleQueue()
+        self._observer: Optional[Observer] = None
+        self.pages_abs: Optional[str] = None
+        self.epoch = 0
+
+    @property
+    def active(self) -> bool:
+        """True while the file system observer is running"""
+        return self._observer is not None and self._observer.is_alive()
+
+    def start(self, pages_dir: str):
+        """
+        Start watching a pages directory for changes.
+
+        Restarting with a different directory drops all cached entries.
+
+        Args:
+            pages_dir: Directory containing the markdown page files
+        """
+        pages_abs = os.path.abspath(pages_dir)
+        if self.active and self.pages_abs == pages_abs:
+            return
+
+        self.stop()
+        os.makedirs(pages_abs, exist_ok=True)
+
+        observer = Observer()
+        observer.daemon = True
+        observer.schedule(
+            _InvalidationHandler(self, pages_abs), pages_abs, recursive=True
+        )
+        observer.start()
+
+        self.pages_abs = pages_abs
+        self._observer = observer
+
+    def stop(self):
+        """Stop the observer and drop all cached entries"""
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join()
+            self._observer = None
+        self.clear()
+
+    def get(self, file_path: str, version_key: Hashable) -> Optional[Dict[str, Any]]:
+        """
+        Get cached state for a file.
+
+        Args:
+            file_path: Page file path relative to the pages directory
+            version_key: Key describing the database state of the page
+
+        Returns:
+            Cached state dict, or None on a miss (or while inactive)
+        """
+        if not self.active:
+            return None
+
+        self.drain()
+        with self._lock:
+            entry = self._entries.get(file_path)
+
+        if entry is None or entry[0] != version_key:
+            return None
+        return entry[1]
+
+    def set(
+        self,
+        file_path: str,
+        version_key: Hashable,
+        state: Dict[str, Any],
+        epoch: int,
+    ):
+        """
+        Store state for a file.
+
+        Args:
+            file_path: Page file path relative to the pages directory
+            version_key: Key describing the database state of the page
+            state: File-derived state to cache
+            epoch: Value of `epoch` read before the state was computed
+        """
+        if not self.active:
+            return
+
+        self.drain()
+        with self._lock:
+            if epoch != self.epoch:
+                # A file event was applied while the caller was computing
+                return
+            self._entries[file_path] = (version_key, state)
+
+    def invalidate(self, file_path: Optional[str] = None):
+        """
+        Queue an invalidation. Safe to call from any thread.
+
+        Args:
+            file_path: Page file path to invalidate, or None for all entries
+        """
+        self._pending.put(_ALL if file_path is None else file_path)
+
+    def drain(self) -> int:
+        """
+        Apply all queued invalidations.
+
+        Returns:
+            Number of invalidations applied
+        """
+        applied = 0
+        while True:
+            try:
+                path = self._pending.get_nowait()
+            except queue.Empty:
+                break
+            with self._lock:
+                if path is _ALL:
+                    self._entries.clear()
+                else:
+                    self._entries.pop(path, None)
+                self.epoch += 1
+            applied += 1
+        return applied
+
+    def clear(self):
+        """Drop all cached entries and pending invalidations"""
+        self.drain()
+        with self._lock:
+            self._entries.clear()
+            self.epoch += 1
+
+
+class FileHashCache:
+    """
+    Bounded LRU of normalized file content tokens keyed by (path, mtime_ns, size).
+
+    Normalizing a page file for content comparison parses and re-dumps its
+    YAML frontmatter, which dominates the cost of the comparison. A file whose
+    nanosecond mtime and size have not changed is assumed to have the same
+    content, so the token is reused without reading the file. Unlike
+    SyncStatusCache this needs no observer: a write to the file changes the
+    key. Callers must not store a token for an mtime recent enough for a
+    same-tick rewrite to keep (see sync_utility.RACY_MTIME_WINDOW_NS).
+    """
+
+    def __init__(self, max_entries: int = 10_000):
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Tuple[str, int, int], int]" = OrderedDict()
+        self.max_entries = max_entries
+
+    def get(self, full_path: str, mtime_ns: int, size: int) -> Optional[int]:
+        """
+        Get the cached token for a file, or None on a miss.
+
+        Args:
+            full_path: Path of the page file
+            mtime_ns: Current modification time of the file in nanoseconds
+            size: Current size of the file in bytes
+        """
+        key = (full_path, mtime_ns, size)
+        with self._lock:
+            file_hash = self._entries.get(key)
+            if file_hash is not None:
+                self._entries.move_to_end(key)
+        return file_hash
+
+    def set(self, full_path: str, mtime_ns: int, size: int, file_hash: int):
+        """
+        Store the token for a file, evicting the least recently used entry.
+
+        Args:
+            full_path: Path of the page file
+            mtime_ns: Modification time of the file when it was read
+            size: Size of the file in bytes when it was read
+            file_hash: Normalized content token of the file
+        """
+        key = (full_path, mtime_ns, size)
+        with self._lock:
+            self._entries[key] = file_hash
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Drop all cached tokens"""
+        with self._lock:
+            self._entries.clear()
+
+
+# Process-wide caches used by PageService
+sync_status_cache = SyncStatusCache()
+file_hash_cache = FileHashCache()
@@ -7,21 +7,101 @@ For AI agents writing wiki pages:
 - After writing files, user runs: python -m app.sync sync-all
 """
 
-import hashlib
+import json
+import multiprocessing
 import os
 import time
 import uuid
-from typing import Dict, Optional, Tuple
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Deque, Dict, Iterator, List, Optional, Set, Tuple, Union
 
 from app import db
-from app.models.page import Page
+from app.models.page import Page, datetime_to_ns
+from app.services.file_service import FileService
 from app.services.link_service import LinkService
 from app.services.search_index_service import SearchIndexService
 from app.services.version_service import VersionService
 from app.sync.file_scanner import FileScanner
+from app.utils.content_token import TOKEN_ALGORITHM, compute_content_token
 from app.utils.markdown_service import parse_frontmatter
 from app.utils.slug_generator import generate_slug
 from flask import current_app
+from sqlalchemy import update
+from sqlalchemy.orm.attributes import set_committed_value
+
+# Minimum number of changed files for which hashing them in worker processes
+# is worth the cost of starting the workers
+PARALLEL_HASH_MIN_FILES = 64
+
+# Start method for the hashing workers. Never fork: the syncing process already
+# runs threads (file watcher, sync status observer, read-ahead pool), and a
+# forked child can deadlock on a lock one of them held at fork time.
+HASH_WORKER_START_METHOD = (
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+
+# How recent an mtime may be (relative to when the file was stat'ed) and still
+# be remembered as proof the file is unchanged. On file systems with coarse
+# timestamps (ext3, HFS+, FAT, some NFS) a rewrite within the same tick keeps
+# the mtime, so a file that was this fresh when read is compared by content
+# again next time (the "racy git" problem).
+RACY_MTIME_WINDOW_NS = 2_000_000_000
+
+# Rows fetched per round trip when streaming page metadata (bounds memory
+# on large wikis instead of materializing every row at once)
+PRELOAD_CHUNK_SIZE = 5000
+
+
+def _reconstruct_content(frontmatter: Dict, markdown_content: str) -> str:
+    """Rebuild full page content with YAML frontmatter (see SyncUtility._reconstruct_content)"""
+    import yaml
+
+    if not frontmatter:
+        return markdown_content
+
+    # Convert frontmatter to YAML string
+    yaml_str = yaml.dump(frontmatter, default_flow_style=False, allow_unicode=True)
+
+    # Reconstruct with frontmatter
+    return f"---\n{yaml_str}---\n\n{markdown_content}"
+
+
+def _hash_file(
+    full_path: str, st: Optional[os.stat_result] = None
+) -> Tuple[int, int, int, int]:
+    """
+    Stat, normalize and hash one page file.
+
+    Module-level (and free of app state) so it can run in a worker process.
+
+    Args:
+        full_path: Path of the page file
+        st: Stat result of the file, if the caller already has one
+
+    Returns:
+        Hash cache entry (st_mtime_ns, st_size, st_ino, content_token)
+
+    Raises:
+        OSError, UnicodeDecodeError: If the file cannot be read
+    """
+    if st is None:
+        st = os.stat(full_path)
+    with open(full_path, "r", encoding="utf-8") as f:
+        file_content = f.read()
+
+    # Reconstruct full content with frontmatter for comparison
+    frontmatter, markdown_content = parse_frontmatter(file_content)
+    full_content = _reconstruct_content(frontmatter, markdown_content)
+    return (st.st_mtime_ns, st.st_size, st.st_ino, compute_content_token(full_content))
+
+
+def _try_hash_file(full_path: str) -> Optional[Tuple[int, int, int, int]]:
+    """_hash_file for worker processes: None on failure (the serial pass logs it)"""
+    try:
+        return _hash_file(full_path)
+    except Exception:
+        return None
 
 
 class SyncUtility:
@@ -38,6 +118,24 @@ class SyncUtility:
         self.admin_user_id = admin_user_id or self._get_admin_user_id()
         self.pages_dir = current_app.config.get("WIKI_PAGES_DIR", "data/pages")
 
+        # file_path -> (st_mtime_ns, st_size, st_ino, content_token)
+        cache_file = current_app.config.get("SYNC_HASH_CACHE_FILE", ".sync-cache.json")
+        self._hash_cache_path = (
+            os.path.join(self.pages_dir, cache_file) if cache_file else None
+        )
+        self._hash_cache: Dict[str, Tuple[int, int, int, int]] = self._load_hash_cache()
+        self._hash_cache_dirty = False
+
+        # True while _sync_files runs
+        self._in_batch_sync = False
+
+        # time.time_ns() from before the stat results being synced were taken
+        # (see _trusted_mtime_ns); None means "now"
+        self._stat_floor_ns: Optional[int] = None
+
+        # slug -> page id for every page, loaded on first use while _sync_files runs
+        self._slug_ids: Optional[Dict[str, uuid.UUID]] = None
+
     def _get_admin_user_id(self) -> uuid.UUID:
         """
         Get admin user ID from config or use default.
@@ -62,6 +160,9 @@ class SyncUtility:
         """
         Resolve parent_slug to parent_id.
 
+        During a batch sync this is a lookup in the slug map loaded once per
+        pass (see _batch_slug_ids) instead of a query per child page.
+
         Args:
             parent_slug: Slug of parent page
 
@@ -71,98 +172,302 @@ class SyncUtility:
         if not parent_slug:
             return None
 
-        parent = db.session.query(Page).filter_by(slug=parent_slug).first()
-        if parent:
-            return parent.id
+        slug_ids = self._batch_slug_ids()
+        if slug_ids is not None:
+            return slug_ids.get(parent_slug)
 
-        return None
+        parent = db.session.query(Page.id).filter_by(slug=parent_slug).first()
+        return parent.id if parent else None
+
+    def _batch_slug_ids(self) -> Optional[Dict[str, uuid.UUID]]:
+        """
+        Get slug -> page id for every page, during a batch sync only.
+
+        Loaded with one query the first time a pass needs it (a pass over
+        unchanged files never does) and kept current as the pass creates pages.
+
+        Returns:
+            Slug map, or None outside _sync_files
+        """
+        if not self._in_batch_sync:
+            return None
+        if self._slug_ids is None:
+            self._slug_ids = dict(
+                db.session.query(Page.slug, Page.id).yield_per(PRELOAD_CHUNK_SIZE)
+            )
+        return self._slug_ids
 
-    def read_file(self, file_path: str) -> Tuple[Dict, str]:
+    def read_file(
+        self, file_path: str, full_path: Optional[str] = None
+    ) -> Tuple[Dict, str]:
         """
         Read and parse markdown file.
 
         Args:
             file_path: Relative file path
+            full_path: file_path joined to the pages directory, if the caller has it
 
         Returns:
             Tuple of (frontmatter_dict, markdown_content)
         """
-        full_path = os.path.join(self.pages_dir, file_path)
-
-        if not os.path.exists(full_path):
-            raise FileNotFoundError(f"File not found: {full_path}")
+        if full_path is None:
+            full_path = os.path.join(self.pages_dir, file_path)
 
-        with open(full_path, "r", encoding="utf-8") as f:
-            content = f.read()
+        # No exists() check first: open() reports a missing file itself, and a
+        # whole-file read() is sized from fstat, so it's a single read syscall
+        try:
+            with open(full_path, "r", encoding="utf-8") as f:
+                content = f.read()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"File not found: {full_path}") from None
 
         frontmatter, markdown_content = parse_frontmatter(content)
         return frontmatter, markdown_content
 
-    def _compute_content_hash(self, content: str) -> str:
+    def _compute_content_hash(self, content: Union[str, bytes]) -> str:
         """
-        Compute SHA256 hash of content.
+        Compute a hex hash of content (the 64-bit change token, zero-padded).
+
+        Sync decisions compare integer tokens; this is kept for callers that
+        want a string.
 
         Args:
-            content: Content string to hash
+            content: Content string (UTF-8 encoded before hashing) or bytes
 
         Returns:
-            Hexadecimal hash string
+            Hexadecimal hash string (16 characters)
+        """
+        return f"{compute_content_token(content) & 0xFFFFFFFFFFFFFFFF:016x}"
+
+    def _trusted_mtime_ns(self, mtime_ns: int) -> Optional[int]:
+        """
+        Return mtime_ns if it can be recorded as proof of unchanged content.
+
+        Returns None for an mtime within RACY_MTIME_WINDOW_NS of when the file
+        was stat'ed: a rewrite in the same timestamp tick would keep it.
+        """
+        stat_time_ns = self._stat_floor_ns
+        if stat_time_ns is None:
+            stat_time_ns = time.time_ns()
+        if stat_time_ns - mtime_ns < RACY_MTIME_WINDOW_NS:
+            return None
+        return mtime_ns
+
+    def _record_file_mtime(self, page: Page, st: os.stat_result):
+        """
+        Record the mtime of a file found identical to its page.
+
+        A touched but unchanged file (editor save, git checkout) then takes the
+        mtime fast path on the next sync instead of being hashed again. The
+        UPDATE keeps updated_at as is, so the page doesn't look recently edited.
+        An mtime too recent to trust (see _trusted_mtime_ns) is not recorded.
+
+        Args:
+            page: Page whose content matches the file
+            st: Stat result of the file
         """
-        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+        mtime_ns = self._trusted_mtime_ns(st.st_mtime_ns)
+        if mtime_ns is None:
+            return
+
+        table = Page.__table__
+        db.session.execute(
+            update(table)
+            .where(table.c.id == page.id)
+            .values(
+                file_mtime_ns=mtime_ns,
+                updated_at=table.c.updated_at,
+                updated_at_ns=table.c.updated_at_ns,
+            )
+        )
+        set_committed_value(page, "file_mtime_ns", mtime_ns)
+
+    @staticmethod
+    def _page_matches(
+        page: Page,
+        title: str,
+        content: str,
+        parent_id: Optional[uuid.UUID],
+        section: Optional[str],
+        status: str,
+        order: Optional[int],
+        file_path: str,
+    ) -> bool:
+        """Check whether syncing these file values would leave the page unchanged"""
+        return (
+            page.title == title
+            and page.content == content
+            and page.parent_id == parent_id
+            and page.section == section
+            and page.status == status
+            and (order is None or page.order_index == order)
+            and page.file_path == file_path
+        )
 
-    def _get_file_content_hash(self, file_path: str) -> Optional[str]:
+    def _get_file_content_token(
+        self,
+        file_path: str,
+        st: Optional[os.stat_result] = None,
+        full_path: Optional[str] = None,
+    ) -> Optional[int]:
         """
-        Get content hash of file (reconstructing full content with frontmatter).
+        Get the change token of a file (reconstructing full content with frontmatter).
 
         Args:
             file_path: Relative file path
+            st: Stat result of the file, if the caller already has one
+            full_path: file_path joined to the pages directory, if the caller has it
 
         Returns:
-            Content hash string, or None if file cannot be read
+            Content token, or None if file cannot be read
         """
         try:
+            if full_path is None:
+                full_path = os.path.join(self.pages_dir, file_path)
+            if st is None:
+                st = FileScanner.stat_path(full_path)
+                if st is None:
+                    return None
+
+            # Unchanged file (same mtime, size and inode): reuse the cached token
+            file_key = (st.st_mtime_ns, st.st_size, st.st_ino)
+            cached = self._hash_cache.get(file_path)
+            if cached is not None and cached[:3] == file_key:
+                return cached[3]
+
+            entry = _hash_file(full_path, st)
+            # The cache key is only as trustworthy as the mtime in it
+            if self._trusted_mtime_ns(entry[0]) is not None:
+                self._hash_cache[file_path] = entry
+                self._hash_cache_dirty = True
+            return entry[3]
+        except Exception as e:
+            current_app.logger.warning(
+                f"Error computing file content token for {file_path}: {e}"
+            )
+            return None
+
+    def _file_matches_content(
+        self,
+        file_path: str,
+        content: Union[str, bytes],
+        st: Optional[os.stat_result] = None,
+        full_path: Optional[str] = None,
+    ) -> bool:
+        """
+        Check whether a file is byte-for-byte identical to the given content.
+
+        The file size is compared first, so a mismatch costs a stat and no read.
+        A size mismatch does not mean the content differs for sync purposes -
+        the hash comparison normalizes frontmatter formatting - so callers still
+        fall back to hashing when this returns False.
+
+        Args:
+            file_path: Relative file path
+            content: Content to compare against (strings are encoded as UTF-8)
+            st: Stat result of the file, if the caller already has one
+            full_path: file_path joined to the pages directory, if the caller has it
+
+        Returns:
+            True if the file exists and matches exactly
+        """
+        if isinstance(content, str):
+            content = content.encode("utf-8")
+        if full_path is None:
             full_path = os.path.join(self.pages_dir, file_path)
-            if not os.path.exists(full_path):
-                return None
+        return FileService.file_matches(full_path, content, st)
 
-            with open(full_path, "r", encoding="utf-8") as f:
-                file_content = f.read()
+    def _load_hash_cache(self) -> Dict[str, Tuple[int, int, int, int]]:
+        """
+        Load persisted file content hashes from the hash cache file.
 
-            # Reconstruct full content with frontmatter for comparison
-            frontmatter, markdown_content = parse_frontmatter(file_content)
-            full_content = self._reconstruct_content(frontmatter, markdown_content)
+        Returns:
+            Hash cache dict (empty if missing, unreadable, or from another token algorithm)
+        """
+        if not self._hash_cache_path or not os.path.exists(self._hash_cache_path):
+            return {}
 
-            return self._compute_content_hash(full_content)
+        try:
+            with open(self._hash_cache_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("algorithm") != TOKEN_ALGORITHM:
+                return {}
+            return {
+                file_path: tuple(entry)
+                for file_path, entry in data.get("entries", {}).items()
+            }
         except Exception as e:
-            current_app.logger.warning(
-                f"Error computing file content hash for {file_path}: {e}"
-            )
-            return None
+            current_app.logger.warning(f"Ignoring unreadable sync hash cache: {e}")
+            return {}
+
+    def save_hash_cache(self):
+        """Persist the hash cache if it changed (no-op when persistence is disabled)"""
+        if not self._hash_cache_path or not self._hash_cache_dirty:
+            return
+
+        data = {"algorithm": TOKEN_ALGORITHM, "entries": self._hash_cache}
+        tmp_path = f"{self._hash_cache_path}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            # Atomic replace so a concurrent reader never sees a partial file
+            os.replace(tmp_path, self._hash_cache_path)
+            self._hash_cache_dirty = False
+        except OSError as e:
+            current_app.logger.warning(f"Could not save sync hash cache: {e}")
+
+    def clear_hash_cache(self):
+        """Drop all cached file hashes, in memory and on disk"""
+        self._hash_cache.clear()
+        self._hash_cache_dirty = False
+        if self._hash_cache_path:
+            try:
+                os.remove(self._hash_cache_path)
+            except FileNotFoundError:
+                pass
 
-    def should_sync_file(self, file_path: str, page: Optional[Page]) -> bool:
+    def should_sync_file(
+        self,
+        file_path: str,
+        page: Optional[Page],
+        st: Optional[os.stat_result] = None,
+        full_path: Optional[str] = None,
+    ) -> bool:
         """
         Determine if file should be synced.
 
-        Uses content comparison (hash-based) to skip syncs when content is identical,
-        even if timestamps differ. Also includes conflict detection: if database was
+        A file whose mtime is exactly the one recorded when the page was last
+        synced from it is skipped without being read. Otherwise, uses content
+        comparison (hash-based) to skip syncs when content is identical, even
+        if timestamps differ. Also includes conflict detection: if database was
         recently updated (within grace period), sync is skipped to protect browser edits.
 
         Args:
             file_path: Relative file path
             page: Existing page record (None if new)
+            st: Stat result of the file, if the caller already has one
+            full_path: file_path joined to the pages directory, if the caller has it
 
         Returns:
             True if file should be synced, False if sync should be skipped
         """
-        file_mtime = FileScanner.get_file_modification_time(file_path, self.pages_dir)
+        if full_path is None:
+            full_path = os.path.join(self.pages_dir, file_path)
 
-        if not file_mtime:
+        # One stat serves the timestamp check, the size check and the hash cache key
+        if st is None:
+            st = FileScanner.stat_path(full_path)
+        if st is None or not st.st_mtime_ns:
             return False
 
         if not page:
             # New file, should sync
             return True
 
+        # Unchanged since it was last synced: exact integer compare, no read
+        if page.file_mtime_ns is not None and st.st_mtime_ns == page.file_mtime_ns:
+            return False
+
         # Check if content comparison is enabled (default: True)
         enable_content_comparison = current_app.config.get(
             "SYNC_ENABLE_CONTENT_COMPARISON", True
@@ -170,29 +475,52 @@ class SyncUtility:
 
         # Content comparison: Skip sync if content is identical
         if enable_content_comparison:
-            file_hash = self._get_file_content_hash(file_path)
-            if file_hash:
+            if self._file_matches_content(file_path, page.content_bytes, st, full_path):
+                # Byte-identical file (e.g. written from the database), no hashing needed
+                current_app.logger.debug(
+                    f"Sync skipped for {file_path} (slug: {page.slug}): "
+                    "Content is identical (file matches database content)."
+                )
+                self._record_file_mtime(page, st)
+                return False
+
+            file_token = self._get_file_content_token(file_path, st, full_path)
+            if file_token is not None:
+                # The stored token matches when the database content is already
+                # in reconstructed form (e.g. it was synced from this file)
+                if file_token == page.content_token:
+                    current_app.logger.debug(
+                        f"Sync skipped for {file_path} (slug: {page.slug}): "
+                        "Content is identical (content token match)."
+                    )
+                    self._record_file_mtime(page, st)
+                    return False
+
                 # Reconstruct database content the same way as file content for comparison
                 # This ensures YAML formatting differences don't cause false positives
                 db_frontmatter, db_markdown = parse_frontmatter(page.content)
                 db_reconstructed = self._reconstruct_content(
                     db_frontmatter, db_markdown
                 )
-                db_hash = self._compute_content_hash(db_reconstructed)
-                if file_hash == db_hash:
+                if file_token == compute_content_token(db_reconstructed):
                     # Content is identical, skip sync regardless of timestamps
                     current_app.logger.debug(
                         f"Sync skipped for {file_path} (slug: {page.slug}): "
-                        "Content is identical (content hash match)."
+                        "Content is identical (content token match)."
                     )
+                    self._record_file_mtime(page, st)
                     return False
 
         # Content differs - check timestamps and grace period
         if page.updated_at:
-            db_time = page.updated_at.timestamp()
+            # Integer nanoseconds on both sides: no datetime conversion, and naive
+            # updated_at values are read as UTC rather than server-local time
+            db_time_ns = page.updated_at_ns
+            if db_time_ns is None:
+                db_time_ns = datetime_to_ns(page.updated_at)
 
             # Check if file is newer than database
-            if file_mtime <= db_time:
+            if st.st_mtime_ns <= db_time_ns:
                 # File is not newer, skip sync
                 return False
 
@@ -200,8 +528,7 @@ class SyncUtility:
             grace_period = current_app.config.get(
                 "SYNC_CONFLICT_GRACE_PERIOD_SECONDS", 600
             )  # Default: 10 minutes
-            current_time = time.time()
-            time_since_db_update = current_time - db_time
+            time_since_db_update = (time.time_ns() - db_time_ns) / 1e9
 
             if time_since_db_update < grace_period:
                 # Database was updated recently (within grace period)
@@ -220,7 +547,13 @@ class SyncUtility:
         return True
 
     def sync_file(
-        self, file_path: str, force: bool = False
+        self,
+        file_path: str,
+        force: bool = False,
+        commit: bool = True,
+        st: Optional[os.stat_result] = None,
+        parsed: Optional[Tuple[Dict, str]] = None,
+        full_path: Optional[str] = None,
     ) -> Tuple[Page, Optional[bool]]:
         """
         Sync a single file to database.
@@ -228,15 +561,37 @@ class SyncUtility:
         Args:
             file_path: Relative file path
             force: Force sync even if file is not newer (bypasses conflict detection)
+            commit: Commit an update (False only flushes it, for batched callers).
+                    Creating a page always commits.
+            st: Stat result of the file taken before this call (e.g. by the
+                directory scan); stat'ed here if not given
+            parsed: read_file result for the file, read after st was taken
+                (e.g. by the read-ahead); read here if not given
+            full_path: file_path joined to the pages directory (batch syncs
+                join it once and pass it along); joined here if not given
 
         Returns:
             Tuple of (Page instance, status: bool|None)
             - True: page was created
             - False: page was updated
-            - None: page was skipped (file not newer than DB, or conflict detected)
+            - None: page was skipped (file not newer than DB, conflict detected,
+              or the file would change nothing)
         """
+        if full_path is None:
+            full_path = os.path.join(self.pages_dir, file_path)
+
+        if not self._in_batch_sync:
+            # Batch syncs set this before their directory scan
+            self._stat_floor_ns = time.time_ns() if st is None else None
+
+        # Stat before reading, so a write racing the read leaves a newer mtime
+        if st is None:
+            st = FileScanner.stat_path(full_path)
+
         # Read file
-        frontmatter, markdown_content = self.read_file(file_path)
+        if parsed is None:
+            parsed = self.read_file(file_path, full_path)
+        frontmatter, markdown_content = parsed
 
         # Extract metadata
         slug = frontmatter.get("slug")
@@ -251,19 +606,29 @@ class SyncUtility:
 
         if not slug:
             # Generate slug from title
-            existing_slugs = [p.slug for p in db.session.query(Page.slug).all()]
+            existing_slugs = self._batch_slug_ids()
+            if existing_slugs is None:
+                existing_slugs = [p.slug for p in db.session.query(Page.slug).all()]
             slug = generate_slug(title, existing_slugs)
 
-        # Check if page exists
-        page = db.session.query(Page).filter_by(slug=slug).first()
+        # Check if page exists (during a batch sync, the slug map answers "no"
+        # without a query)
+        slug_ids = self._batch_slug_ids()
+        if slug_ids is not None and slug not in slug_ids:
+            page = None
+        else:
+            page = db.session.query(Page).filter_by(slug=slug).first()
 
         # Check if should sync
         # - If page doesn't exist, always create it
         # - If page exists and force=False, check if file is newer
         # - If page exists and force=True, always update
         if page and not force:
-            if not self.should_sync_file(file_path, page):
+            if not self.should_sync_file(file_path, page, st, full_path):
                 # Page exists but file is not newer, skip sync
+                if commit:
+                    # Persist a file mtime recorded for identical content
+                    db.session.commit()
                 return page, None  # None indicates skipped
 
         # Resolve parent
@@ -279,6 +644,17 @@ class SyncUtility:
         # Frontend will parse and strip frontmatter for editor display
         full_content = self._reconstruct_content(frontmatter, markdown_content)
 
+        if page and self._page_matches(
+            page, title, full_content, parent_id, section, status, order, file_path
+        ):
+            # Nothing to update (e.g. a forced sync of an unchanged file): skip
+            # the UPDATE, the new version and the link/search reindex
+            if st is not None and page.file_mtime_ns != st.st_mtime_ns:
+                self._record_file_mtime(page, st)
+            if commit:
+                db.session.commit()
+            return page, None
+
         if page:
             # Update existing page
             page.title = title
@@ -302,8 +678,9 @@ class SyncUtility:
 
             # Update file path
             page.file_path = file_path
+            page.file_mtime_ns = self._trusted_mtime_ns(st.st_mtime_ns) if st else None
 
-            db.session.commit()
+            db.session.flush()
             was_created = False
         else:
             # Create new page
@@ -326,14 +703,22 @@ class SyncUtility:
 
             # Override file_path with actual file location
             page.file_path = file_path
+            page.file_mtime_ns = self._trusted_mtime_ns(st.st_mtime_ns) if st else None
             db.session.commit()
             was_created = True
+            if self._slug_ids is not None:
+                # Later files may use the new page as parent or collide with its slug
+                self._slug_ids[slug] = page.id
+            # PageService.create_page already committed, so batching gains nothing
+            commit = True
 
         # Update links - use page.content (which includes frontmatter, but link extraction handles it)
-        LinkService.update_page_links(page.id, page.content)
+        LinkService.update_page_links(page.id, page.content, commit=False)
 
         # Update search index
-        SearchIndexService.index_page(page.id, markdown_content, title=title)
+        SearchIndexService.index_page(
+            page.id, markdown_content, title=title, commit=False
+        )
 
         # Create version if this is an update
         if not was_created:
@@ -341,8 +726,12 @@ class SyncUtility:
                 page_id=page.id,
                 user_id=self.admin_user_id,
                 change_summary="Synced from file",
+                commit=False,
             )
 
+        if commit:
+            db.session.commit()
+
         return page, was_created
 
     def _reconstruct_content(self, frontmatter: Dict, markdown_content: str) -> str:
@@ -356,21 +745,16 @@ class SyncUtility:
         Returns:
             Full content with frontmatter
         """
-        import yaml
-
-        if not frontmatter:
-            return markdown_content
-
-        # Convert frontmatter to YAML string
-        yaml_str = yaml.dump(frontmatter, default_flow_style=False, allow_unicode=True)
-
-        # Reconstruct with frontmatter
-        return f"---\n{yaml_str}---\n\n{markdown_content}"
+        return _reconstruct_content(frontmatter, markdown_content)
 
-    def _cleanup_orphaned_pages(self) -> int:
+    def _cleanup_orphaned_pages(self, files_on_disk: Optional[Set[str]] = None) -> int:
         """
         Remove pages from database whose files no longer exist.
 
+        Args:
+            files_on_disk: Relative paths from a scan the caller already did
+                           (scanned here if not given)
+
         Returns:
             Number of pages deleted
         """
@@ -378,26 +762,32 @@ class SyncUtility:
 
         from app.services.file_service import FileService
 
-        # Find all pages with file_path set
-        pages_with_files = (
-            db.session.query(Page).filter(Page.file_path.isnot(None)).all()
-        )
-
         deleted_count = 0
-        files_on_disk = set(FileScanner.scan_directory(self.pages_dir))
-
-        for page in pages_with_files:
+        if files_on_disk is None:
+            files_on_disk = set(FileScanner.scan_directory(self.pages_dir))
+
+        # Stream (id, file_path) rows of pages with file_path set instead of
+        # loading every Page; only orphans are loaded, after the scan finishes
+        orphaned_ids = []
+        for page_id, page_file_path in (
+            db.session.query(Page.id, Page.file_path)
+            .filter(Page.file_path.isnot(None))
+            .yield_per(PRELOAD_CHUNK_SIZE)
+        ):
             # Check if file exists on disk
             # First check if the file_path is in the files_on_disk set (exact match)
-            file_exists = page.file_path in files_on_disk
+            if page_file_path in files_on_disk:
+                continue
 
             # If not found, also check if the file physically exists on disk
             # (handles cases where file_path format might differ)
-            if not file_exists:
-                full_path = FileService.get_full_path(page.file_path)
-                file_exists = os.path.exists(full_path)
+            full_path = FileService.get_full_path(page_file_path)
+            if not os.path.exists(full_path):
+                orphaned_ids.append(page_id)
 
-            if not file_exists:
+        for orphaned_id in orphaned_ids:
+            page = db.session.get(Page, orphaned_id)
+            if page is not None:
                 # File is missing, delete the page
                 try:
                     page_id = page.id
@@ -442,6 +832,293 @@ class SyncUtility:
 
         return deleted_count
 
+    def _synced_file_mtimes(self) -> Dict[str, int]:
+        """Map file_path -> file_mtime_ns for every page synced from a file (one query)"""
+        return dict(
+            db.session.query(Page.file_path, Page.file_mtime_ns)
+            .filter(Page.file_mtime_ns.isnot(None))
+            .yield_per(PRELOAD_CHUNK_SIZE)
+        )
+
+    def _prefetch_file_tokens(
+        self,
+        files: List[str],
+        file_stats: Optional[Dict[str, os.stat_result]] = None,
+        synced_mtimes: Optional[Dict[str, int]] = None,
+    ):
+        """
+        Hash changed files in worker processes ahead of the serial sync loop.
+
+        Normalizing and hashing files is CPU-bound and independent per file,
+        while database writes must stay on the main connection. Filling the
+        hash cache first lets should_sync_file find every token cached.
+        Files whose mtime still matches their page's last sync are left out:
+        should_sync_file skips those without reading them.
+
+        Args:
+            files: Relative file paths about to be synced
+            file_stats: Stat results from the directory scan, by file path
+            synced_mtimes: Result of _synced_file_mtimes, if the caller has it
+        """
+        workers = current_app.config.get("SYNC_PARALLEL_WORKERS", 1)
+        if workers <= 1 or not current_app.config.get(
+            "SYNC_ENABLE_CONTENT_COMPARISON", True
+        ):
+            return
+
+        # One query instead of a page lookup per file
+        if synced_mtimes is None:
+            synced_mtimes = self._synced_file_mtimes()
+
+        stale = []
+        for file_path in files:
+            st = file_stats.get(file_path) if file_stats else None
+            if st is None:
+                st = FileScanner.stat_file(file_path, self.pages_dir)
+                if st is None:
+                    continue
+            if synced_mtimes.get(file_path) == st.st_mtime_ns:
+                continue
+            cached = self._hash_cache.get(file_path)
+            if cached is None or cached[:3] != (st.st_mtime_ns, st.st_size, st.st_ino):
+                stale.append(file_path)
+
+        if len(stale) < PARALLEL_HASH_MIN_FILES:
+            return
+
+        full_paths = [os.path.join(self.pages_dir, f) for f in stale]
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context(HASH_WORKER_START_METHOD),
+        ) as executor:
+            entries = executor.map(_try_hash_file, full_paths, chunksize=16)
+            for file_path, entry in zip(stale, entries):
+                if entry is not None and self._trusted_mtime_ns(entry[0]) is not None:
+                    self._hash_cache[file_path] = entry
+                    self._hash_cache_dirty = True
+
+    def _sync_files(
+        self,
+        files: List[str],
+        force: bool,
+        stats: Dict[str, int],
+        file_stats: Optional[Dict[str, os.stat_result]] = None,
+        synced_mtimes: Optional[Dict[str, int]] = None,
+    ):
+        """
+        Sync files in order, committing updates in batches.
+
+        Files whose scanned mtime equals the one recorded at their last sync are
+        counted as skipped without calling sync_file, which would read and
+        parse the file and query its page. The others are read ahead in threads
+        (see _read_ahead). Updates are flushed per file and
+        committed every SYNC_COMMIT_BATCH_SIZE files, so a large sync pays for
+        one commit per batch instead of several per file. If a file fails, the
+        session rollback also discards the uncommitted updates before it; those
+        are replayed. Parent and slug lookups use one slug map
+        for the duration of the call.
+
+        Args:
+            files: Relative file paths
+            force: Force sync even if files are not newer
+            stats: Sync statistics, updated in place
+            file_stats: Stat results from the directory scan, by file path
+            synced_mtimes: Result of _synced_file_mtimes (enables the early skip)
+        """
+        batch_size = max(1, current_app.config.get("SYNC_COMMIT_BATCH_SIZE", 100))
+        pending: List[str] = []  # updated files not committed yet
+
+        to_sync = []
+        for file_path in files:
+            st = file_stats.get(file_path) if file_stats else None
+            if (
+                not force
+                and st is not None
+                and synced_mtimes
+                and synced_mtimes.get(file_path) == st.st_mtime_ns
+            ):
+                stats["skipped"] += 1
+            else:
+                # Joined once here; sync_file and its helpers reuse it
+                to_sync.append((file_path, os.path.join(self.pages_dir, file_path), st))
+
+        self._in_batch_sync = True
+        try:
+            for file_path, full_path, st, parsed in self._read_ahead(to_sync):
+                try:
+                    page, status = self.sync_file(
+                        file_path,
+                        force=force,
+                        commit=False,
+                        st=st,
+                        parsed=parsed,
+                        full_path=full_path,
+                    )
+                    if status is True:
+                        stats["created"] += 1
+                        # Creating a page commits everything pending
+                        pending.clear()
+                    elif status is False:
+                        stats["updated"] += 1
+                        pending.append(file_path)
+                        if len(pending) >= batch_size:
+                            self._commit_batch(pending, force, stats)
+                    else:  # status is None (skipped)
+                        stats["skipped"] += 1
+                except Exception as e:
+                    self._rollback()
+                    current_app.logger.error(f"Error syncing {file_path}: {e}")
+                    stats["errors"] += 1
+                    self._replay_files(pending, force, stats)
+
+            self._commit_batch(pending, force, stats)
+        finally:
+            self._in_batch_sync = False
+            self._slug_ids = None
+            self._stat_floor_ns = None
+
+    def _read_ahead(
+        self, to_sync: List[Tuple[str, str, Optional[os.stat_result]]]
+    ) -> Iterator[
+        Tuple[str, str, Optional[os.stat_result], Optional[Tuple[Dict, str]]]
+    ]:
+        """
+        Read and parse files in threads, a bounded window ahead of the caller.
+
+        File reads overlap the database work of the files before them, while
+        everything that touches the session stays on the calling thread.
+        Files are stat'ed before being read so sync_file records an mtime no
+        newer than the content it syncs.
+
+        Args:
+            to_sync: (file_path, full path, stat result or None), in sync order
+
+        Yields:
+            (file_path, full path, stat result, read_file result), in order.
+            The result is None if the read failed; sync_file then reads the
+            file itself and reports the error.
+        """
+        workers = current_app.config.get("SYNC_READ_AHEAD_WORKERS", 1)
+        if workers <= 1 or len(to_sync) < 2:
+            for file_path, full_path, st in to_sync:
+                yield file_path, full_path, st, None
+            return
+
+        def read(file_path: str, full_path: str, st: Optional[os.stat_result]):
+            if st is None:
+                st = FileScanner.stat_path(full_path)
+            return st, self.read_file(file_path, full_path)
+
+        window: Deque[Tuple[str, str, Optional[os.stat_result], Future]] = deque()
+        remaining = iter(to_sync)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            # Keep a few reads queued per thread; the rest wait their turn
+            for item in remaining:
+                window.append((*item, pool.submit(read, *item)))
+                if len(window) >= workers * 4:
+                    break
+            while window:
+                file_path, full_path, st, future = window.popleft()
+                next_file = next(remaining, None)
+                if next_file is not None:
+                    window.append((*next_file, pool.submit(read, *next_file)))
+                try:
+                    st, parsed = future.result()
+                except Exception:
+                    parsed = None
+                yield file_path, full_path, st, parsed
+
+    def _commit_batch(self, pending: List[str], force: bool, stats: Dict[str, int]):
+        """
+        Commit pending updates, replaying them if the commit fails.
+
+        Commits even with nothing pending: skipped files may have recorded
+        their new mtime (see _record_file_mtime).
+        """
+        try:
+            db.session.commit()
+            pending.clear()
+        except Exception as e:
+            self._rollback()
+            current_app.logger.warning(
+                f"Batched sync commit failed ({e}), replaying {len(pending)} files"
+            )
+            self._replay_files(pending, force, stats)
+
+    def _replay_files(self, pending: List[str], force: bool, stats: Dict[str, int]):
+        """
+        Re-sync rolled-back updates in one transaction.
+
+        Each file gets a savepoint, so a file that fails again rolls back only
+        its own changes and the rest share one commit. If that commit fails
+        too, the files are re-synced with one commit each.
+
+        The files were already counted as updated; the counts are corrected
+        if a replay is skipped or fails.
+        """
+        replayed: List[str] = []  # replayed updates not committed yet
+        for file_path in pending:
+            savepoint = db.session.begin_nested()
+            try:
+                _, status = self.sync_file(file_path, force=force, commit=False)
+                if savepoint.is_active:
+                    savepoint.commit()
+            except Exception as e:
+                # A failed flush deactivates the savepoint but leaves it current
+                if db.session().get_nested_transaction() is savepoint:
+                    savepoint.rollback()
+                else:
+                    # A page create committed mid-file; drop only what followed
+                    self._rollback()
+                self._count_replay_error(file_path, e, stats)
+                continue
+
+            if status is False:
+                replayed.append(file_path)
+            else:
+                self._count_replay_status(status, stats)
+                if status is True:
+                    # Creating a page commits the replayed updates before it
+                    replayed.clear()
+        pending.clear()
+
+        try:
+            db.session.commit()
+        except Exception as e:
+            self._rollback()
+            current_app.logger.warning(
+                f"Replayed sync commit failed ({e}), retrying {len(replayed)} files one commit each"
+            )
+            for file_path in replayed:
+                try:
+                    _, status = self.sync_file(file_path, force=force)
+                    if status is not False:
+                        self._count_replay_status(status, stats)
+                except Exception as e:
+                    self._rollback()
+                    self._count_replay_error(file_path, e, stats)
+
+    @staticmethod
+    def _count_replay_status(status: Optional[bool], stats: Dict[str, int]):
+        """Recount a replayed file (counted as updated) that was created or skipped"""
+        stats["updated"] -= 1
+        stats["created" if status else "skipped"] += 1
+
+    @staticmethod
+    def _count_replay_error(file_path: str, error: Exception, stats: Dict[str, int]):
+        """Recount a replayed file (counted as updated) that failed"""
+        current_app.logger.error(f"Error syncing {file_path}: {error}")
+        stats["updated"] -= 1
+        stats["errors"] += 1
+
+    @staticmethod
+    def _rollback():
+        """Rollback session on error to prevent cascading failures"""
+        try:
+            db.session.rollback()
+        except Exception:
+            pass  # Ignore rollback errors
+
     def sync_all(self, force: bool = False) -> Dict[str, int]:
         """
         Sync all markdown files in pages directory.
@@ -455,7 +1132,10 @@ class SyncUtility:
         Returns:
             Dictionary with sync statistics including 'deleted' count
         """
-        files = FileScanner.scan_directory(self.pages_dir)
+        # One scan supplies the file list and every file's stat
+        self._stat_floor_ns = time.time_ns()
+        file_stats = FileScanner.scan_directory_stats(self.pages_dir)
+        files = list(file_stats)
 
         stats = {
             "total_files": len(files),
@@ -466,32 +1146,24 @@ class SyncUtility:
             "deleted": 0,
         }
 
+        # Forced syncs never compare content, so there is nothing to hash ahead
+        synced_mtimes = None
+        if not force:
+            synced_mtimes = self._synced_file_mtimes()
+            self._prefetch_file_tokens(files, file_stats, synced_mtimes)
+
         # First, sync all existing files
-        for file_path in files:
-            try:
-                page, status = self.sync_file(file_path, force=force)
-                if status is True:
-                    stats["created"] += 1
-                elif status is False:
-                    stats["updated"] += 1
-                else:  # status is None (skipped)
-                    stats["skipped"] += 1
-            except Exception as e:
-                # Rollback session on error to prevent cascading failures
-                try:
-                    db.session.rollback()
-                except Exception:
-                    pass  # Ignore rollback errors
-                current_app.logger.error(f"Error syncing {file_path}: {e}")
-                stats["errors"] += 1
+        self._sync_files(files, force, stats, file_stats, synced_mtimes)
 
         # Then, clean up orphaned pages (pages whose files are missing)
         try:
-            stats["deleted"] = self._cleanup_orphaned_pages()
+            stats["deleted"] = self._cleanup_orphaned_pages(set(files))
         except Exception as e:
             current_app.logger.error(f"Error cleaning up orphaned pages: {e}")
             # Don't increment errors count for cleanup failures, just log
 
+        self.save_hash_cache()
+
         return stats
 
     def sync_directory(self, directory: str, force: bool = False) -> Dict[str, int]:
@@ -511,14 +1183,15 @@ class SyncUtility:
             raise ValueError(f"Directory not found: {full_dir}")
 
         # Scan the full pages directory and filter to the specified directory
-        all_files = FileScanner.scan_directory(self.pages_dir)
+        self._stat_floor_ns = time.time_ns()
+        all_file_stats = FileScanner.scan_directory_stats(self.pages_dir)
 
         # Filter to only files in the specified directory
         # Normalize directory path for comparison
         directory_normalized = directory.replace("\\", "/")
         filtered_files = [
             f
-            for f in all_files
+            for f in all_file_stats
             if f.startswith(directory_normalized + "/")
             or f == directory_normalized.split("/")[-1] + ".md"
         ]
@@ -531,22 +1204,13 @@ class SyncUtility:
             "errors": 0,
         }
 
-        for file_path in filtered_files:
-            try:
-                page, status = self.sync_file(file_path, force=force)
-                if status is True:
-                    stats["created"] += 1
-                elif status is False:
-                    stats["updated"] += 1
-                else:  # status is None (skipped)
-                    stats["skipped"] += 1
-            except Exception as e:
-                # Rollback session on error to prevent cascading failures
-                try:
-                    db.session.rollback()
-                except Exception:
-                    pass  # Ignore rollback errors
-                current_app.logger.error(f"Error syncing {file_path}: {e}")
-                stats["errors"] += 1
+        synced_mtimes = None
+        if not force:
+            synced_mtimes = self._synced_file_mtimes()
+            self._prefetch_file_tokens(filtered_files, all_file_stats, synced_mtimes)
+
+        self._sync_files(filtered_files, force, stats, all_file_stats, synced_mtimes)
+
+        self.save_hash_cache()
 
         return stats
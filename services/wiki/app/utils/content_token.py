@@ -0,0 +1,37 @@
+"""64-bit change tokens for detecting page content changes"""
+
+import hashlib
+from typing import Union
+
+# Try to import xxhash (XXH3 is much faster than cryptographic hashes), but make it optional
+try:
+    import xxhash
+
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+# Identifies how tokens were computed (tokens from different algorithms never match)
+TOKEN_ALGORITHM = "xxh3-64" if XXHASH_AVAILABLE else "blake2b-64"
+
+
+def compute_content_token(content: Union[str, bytes]) -> int:
+    """
+    Compute a 64-bit change token for content.
+
+    Tokens only answer "did the content change?" - they are not cryptographic.
+    The value is signed so it fits a PostgreSQL BIGINT column.
+
+    Args:
+        content: Content string (UTF-8 encoded before hashing) or bytes
+
+    Returns:
+        Signed 64-bit integer token
+    """
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+    if XXHASH_AVAILABLE:
+        digest = xxhash.xxh3_64_digest(content)
+    else:
+        digest = hashlib.blake2b(content, digest_size=8).digest()
+    return int.from_bytes(digest, "big", signed=True)
@@ -6,18 +6,47 @@ should use to ensure consistent health endpoint responses with process metadata.
 """
 
 import os
-import platform
+import sys
 import time
-from typing import Dict, Optional
+from collections import namedtuple
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Callable, Dict, Optional, Tuple
 
-# Try to import psutil, but make it optional
-try:
-    import psutil
+# psutil is optional and imported on first use (see _psutil_available): its
+# C extension adds to startup, and a worker may never serve a health probe.
+# PSUTIL_AVAILABLE is None until the import has been tried.
+psutil = None
+PSUTIL_AVAILABLE: Optional[bool] = None
 
-    PSUTIL_AVAILABLE = True
-except ImportError:
-    PSUTIL_AVAILABLE = False
-    psutil = None
+# Seconds a psutil process snapshot is reused for (0 disables). Load balancers
+# and metrics scrapers probe /health several times a second; the metrics
+# don't need to be fresher than this.
+PROCESS_INFO_TTL_SECONDS = float(os.environ.get("HEALTH_CACHE_TTL", "10"))
+
+# (pid, time.monotonic() when taken, process_info) of the last psutil
+# snapshot; the pid makes a forked worker take its own
+_process_info_cache: Optional[Tuple[int, float, Dict]] = None
+
+# psutil.Process of this process, kept between probes (see _get_process)
+_process = None
+
+# Read process info from /proc/self/stat (one read, Linux only) instead of
+# psutil. Always tried when psutil isn't installed.
+HEALTH_FAST_PROC_STAT = os.environ.get("ARCADIUM_HEALTH_FAST") == "1"
+
+_IS_LINUX = sys.platform.startswith("linux")
+_IS_WINDOWS = sys.platform == "win32"
+
+# Fields of /proc/self/stat used for process info
+ProcStat = namedtuple("ProcStat", ["num_threads", "starttime_ticks", "rss_pages"])
+
+# (pid, epoch seconds the process started), derived from /proc on first read
+_process_start: Optional[Tuple[int, float]] = None
+
+# Threads that run dependency checks side by side (shared between probes, so
+# a check that outlives its timeout doesn't hold up the response)
+DEPENDENCY_CHECK_WORKERS = 4
+_dependency_pool: Optional[ThreadPoolExecutor] = None
 
 
 def get_health_status(
@@ -25,6 +54,8 @@ def get_health_status(
     version: str = "1.0.0",
     additional_info: Optional[Dict] = None,
     include_process_info: bool = True,
+    dependency_checks: Optional[Dict[str, Callable[[], Optional[Dict]]]] = None,
+    dependency_timeout: float = 3.0,
 ) -> Dict:
     """
     Generate a standardized health check response.
@@ -34,6 +65,12 @@ def get_health_status(
         version: Service version (default: "1.0.0")
         additional_info: Optional dictionary with additional service-specific info
         include_process_info: Whether to include process information (default: True)
+        dependency_checks: Optional dependency name -> check function. Checks run
+            concurrently (and alongside the process info read); each returns a
+            status dict for "dependencies", or None to leave that dependency out.
+        dependency_timeout: Seconds to wait for all dependency checks (default: 3.0).
+            A check still running is reported as {"status": "timeout"}, one that
+            raised as {"status": "error"}.
 
     Returns:
         Dictionary with health status information:
@@ -50,6 +87,7 @@ def get_health_status(
                 "threads": int,
                 "open_files": int (0 on Windows)
             },
+            "dependencies": {name: status dict} (if any checks were given),
             ...additional_info
         }
     """
@@ -59,56 +97,29 @@ def get_health_status(
         "version": version,
     }
 
-    # Add process information if requested and psutil is available
-    if include_process_info and PSUTIL_AVAILABLE:
-        try:
-            process = psutil.Process()
-            # Use oneshot() for efficiency
-            with process.oneshot():
-                create_time = process.create_time()
-                uptime_seconds = time.time() - create_time
-                memory_info = process.memory_info()
-                memory_mb = memory_info.rss / (1024 * 1024)
-
-                # Get CPU percent (non-blocking)
-                try:
-                    cpu_percent = process.cpu_percent(interval=None)
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    cpu_percent = 0.0
+    # Plain liveness probe: nothing to measure or check
+    if not include_process_info and not dependency_checks:
+        if additional_info:
+            health_status.update(additional_info)
+        return health_status
 
-                # Get memory percent
-                try:
-                    memory_percent = process.memory_percent()
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    memory_percent = 0.0
+    # Start dependency checks first so they overlap the process info read
+    if dependency_checks:
+        deadline = time.monotonic() + dependency_timeout
+        futures = _start_dependency_checks(dependency_checks)
 
-                # Get thread count
-                try:
-                    threads = process.num_threads()
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    threads = 0
+    # Add process information if requested
+    if include_process_info:
+        psutil_available = _psutil_available()
+        process_info = None
+        if HEALTH_FAST_PROC_STAT or not psutil_available:
+            process_info = _get_proc_process_info()
 
-                # Skip open_files() on Windows - it's extremely slow
-                if platform.system() == "Windows":
-                    open_files = 0
-                else:
-                    try:
-                        open_files = len(process.open_files())
-                    except (psutil.NoSuchProcess, psutil.AccessDenied, Exception):
-                        open_files = 0
-
-            health_status["process_info"] = {
-                "pid": process.pid,
-                "uptime_seconds": round(uptime_seconds, 2),
-                "cpu_percent": round(cpu_percent, 2),
-                "memory_mb": round(memory_mb, 2),
-                "memory_percent": round(memory_percent, 2),
-                "threads": threads,
-                "open_files": open_files,
-            }
-        except (psutil.NoSuchProcess, psutil.AccessDenied, AttributeError):
-            # Fallback if psutil fails
-            health_status["process_info"] = {
+        if process_info is None and psutil_available:
+            process_info = _get_cached_process_info()
+        elif process_info is None:
+            # Basic info without psutil or /proc
+            process_info = {
                 "pid": os.getpid(),
                 "uptime_seconds": 0.0,
                 "cpu_percent": 0.0,
@@ -117,9 +128,239 @@ def get_health_status(
                 "threads": 0,
                 "open_files": 0,
             }
-    elif include_process_info:
-        # Basic info without psutil
-        health_status["process_info"] = {
+
+        if not psutil_available:
+            process_info["note"] = "psutil not available"
+        health_status["process_info"] = process_info
+
+    if dependency_checks:
+        dependencies = _collect_dependency_checks(futures, deadline)
+        if dependencies:
+            health_status["dependencies"] = dependencies
+
+    # Add any additional service-specific information
+    if additional_info:
+        health_status.update(additional_info)
+
+    return health_status
+
+
+def _psutil_available() -> bool:
+    """Import psutil on first call; return whether it is installed"""
+    global psutil, PSUTIL_AVAILABLE
+
+    if PSUTIL_AVAILABLE is None:
+        try:
+            import psutil
+
+            PSUTIL_AVAILABLE = True
+        except ImportError:
+            PSUTIL_AVAILABLE = False
+    return PSUTIL_AVAILABLE
+
+
+def _start_dependency_checks(
+    dependency_checks: Dict[str, Callable[[], Optional[Dict]]],
+) -> Dict[str, Future]:
+    """Submit each dependency check to the shared pool"""
+    global _dependency_pool
+
+    if _dependency_pool is None:
+        _dependency_pool = ThreadPoolExecutor(
+            max_workers=DEPENDENCY_CHECK_WORKERS, thread_name_prefix="health-check"
+        )
+    return {
+        name: _dependency_pool.submit(check)
+        for name, check in dependency_checks.items()
+    }
+
+
+def _collect_dependency_checks(
+    futures: Dict[str, Future], deadline: float
+) -> Dict[str, Dict]:
+    """
+    Wait (until deadline) for dependency checks and gather their results.
+
+    Args:
+        futures: Dependency name -> future from _start_dependency_checks
+        deadline: time.monotonic() value after which checks are timed out
+
+    Returns:
+        Dependency name -> status dict (checks that returned None are left out)
+    """
+    wait(futures.values(), timeout=max(0.0, deadline - time.monotonic()))
+
+    dependencies = {}
+    for name, future in futures.items():
+        if not future.done():
+            # Slow dependency: report it instead of blocking the probe
+            future.cancel()
+            dependencies[name] = {"status": "timeout"}
+            continue
+        try:
+            result = future.result()
+        except Exception as e:
+            dependencies[name] = {"status": "error", "error": str(e)}
+            continue
+        if result is not None:
+            dependencies[name] = result
+    return dependencies
+
+
+def _read_proc_self_stat() -> Optional[ProcStat]:
+    """
+    Read thread count, start time and RSS from /proc/self/stat.
+
+    Returns:
+        ProcStat, or None if not on Linux or /proc is unreadable
+    """
+    if not _IS_LINUX:
+        return None
+    try:
+        with open("/proc/self/stat", "rb") as f:
+            data = f.read()
+    except OSError:
+        return None
+
+    # Fields after "(comm)" start at field 3; comm itself may contain spaces
+    fields = data[data.rindex(b")") + 2 :].split()
+    return ProcStat(
+        num_threads=int(fields[17]),  # field 20
+        starttime_ticks=int(fields[19]),  # field 22, clock ticks after boot
+        rss_pages=int(fields[21]),  # field 24
+    )
+
+
+def _get_proc_process_info() -> Optional[Dict]:
+    """
+    Build process info from /proc/self/stat, without psutil.
+
+    CPU percent, memory percent and open files are not read (reported as 0).
+
+    Returns:
+        Process info dict, or None if /proc is unavailable
+    """
+    global _process_start
+
+    stat = _read_proc_self_stat()
+    if stat is None:
+        return None
+
+    pid = os.getpid()
+    if _process_start is None or _process_start[0] != pid:
+        # Start time is fixed for the life of the process: one /proc/uptime
+        # read per process turns boot-relative ticks into epoch seconds
+        try:
+            with open("/proc/uptime", "r") as f:
+                system_uptime = float(f.read().split()[0])
+        except (OSError, ValueError, IndexError):
+            return None
+        started_after_boot = stat.starttime_ticks / os.sysconf("SC_CLK_TCK")
+        _process_start = (pid, time.time() - system_uptime + started_after_boot)
+
+    rss_bytes = stat.rss_pages * os.sysconf("SC_PAGE_SIZE")
+    return {
+        "pid": pid,
+        "uptime_seconds": round(max(0.0, time.time() - _process_start[1]), 2),
+        "cpu_percent": 0.0,
+        "memory_mb": round(rss_bytes / (1024 * 1024), 2),
+        "memory_percent": 0.0,
+        "threads": stat.num_threads,
+        "open_files": 0,
+    }
+
+
+def _get_cached_process_info() -> Dict:
+    """
+    Return process info, reusing a snapshot taken within the TTL.
+
+    Returns:
+        A copy of the process info dict (callers may modify it)
+    """
+    global _process_info_cache
+
+    pid = os.getpid()
+    now = time.monotonic()
+    cached = _process_info_cache
+    if (
+        cached is not None
+        and cached[0] == pid
+        and now - cached[1] < PROCESS_INFO_TTL_SECONDS
+    ):
+        return dict(cached[2])
+
+    process_info = _get_process_info()
+    if PROCESS_INFO_TTL_SECONDS > 0:
+        _process_info_cache = (pid, now, process_info)
+    return dict(process_info)
+
+
+def _get_process():
+    """
+    Return a psutil.Process for the current process, reusing the last one.
+
+    Reuse skips the /proc read psutil.Process() does on construction and lets
+    cpu_percent(interval=None) measure usage since the previous probe (a new
+    Process always reports 0.0). A forked worker gets its own.
+    """
+    global _process
+
+    if _process is None or _process.pid != os.getpid():
+        _process = psutil.Process()
+    return _process
+
+
+def _get_process_info() -> Dict:
+    """Read process metrics with psutil (a fallback dict if psutil fails)"""
+    try:
+        process = _get_process()
+        # Every getter below runs inside one oneshot() block, so psutil reads
+        # each /proc file once and serves the other metrics from that read
+        with process.oneshot():
+            create_time = process.create_time()
+            uptime_seconds = time.time() - create_time
+            memory_info = process.memory_info()
+            memory_mb = memory_info.rss / (1024 * 1024)
+
+            # Get CPU percent (non-blocking)
+            try:
+                cpu_percent = process.cpu_percent(interval=None)
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                cpu_percent = 0.0
+
+            # Get memory percent
+            try:
+                memory_percent = process.memory_percent()
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                memory_percent = 0.0
+
+            # Get thread count
+            try:
+                threads = process.num_threads()
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                threads = 0
+
+            # Skip open_files() on Windows - it's extremely slow
+            if _IS_WINDOWS:
+                open_files = 0
+            else:
+                try:
+                    open_files = len(process.open_files())
+                except (psutil.NoSuchProcess, psutil.AccessDenied, Exception):
+                    open_files = 0
+
+        return {
+            "pid": process.pid,
+            "uptime_seconds": round(uptime_seconds, 2),
+            "cpu_percent": round(cpu_percent, 2),
+            "memory_mb": round(memory_mb, 2),
+            "memory_percent": round(memory_percent, 2),
+            "threads": threads,
+            "open_files": open_files,
+        }
+    except (psutil.NoSuchProcess, psutil.AccessDenied, AttributeError):
+        # Fallback if psutil fails
+        return {
             "pid": os.getpid(),
             "uptime_seconds": 0.0,
             "cpu_percent": 0.0,
@@ -127,11 +368,4 @@ def get_health_status(
             "memory_percent": 0.0,
             "threads": 0,
             "open_files": 0,
-            "note": "psutil not available",
         }
-
-    # Add any additional service-specific information
-    if additional_info:
-        health_status.update(additional_info)
-
-    return health_status
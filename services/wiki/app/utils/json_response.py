@@ -0,0 +1,49 @@
+"""
+JSON responses for high-traffic endpoints (health probes, log polling).
+
+Bodies are serialized with orjson when it is installed, falling back to
+Flask's jsonify otherwise.
+"""
+
+from typing import Any
+
+from flask import Response, current_app, jsonify
+
+# Try to import orjson, but make it optional
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+
+def json_response(data: Any, status: int = 200) -> Response:
+    """
+    Build a JSON response, serialized with orjson when available.
+
+    Keys are sorted like jsonify does (per the app's JSON provider). Data
+    orjson can't serialize is handed to jsonify instead.
+
+    Args:
+        data: JSON-serializable data
+        status: HTTP status code (default: 200)
+
+    Returns:
+        Flask Response with an application/json body
+    """
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_SORT_KEYS if current_app.json.sort_keys else 0
+        try:
+            body = orjson.dumps(data, option=option)
+        except TypeError:
+            pass
+        else:
+            return current_app.response_class(
+                body, status=status, mimetype="application/json"
+            )
+
+    response = jsonify(data)
+    response.status_code = status
+    return response
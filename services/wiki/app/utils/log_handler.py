@@ -4,9 +4,57 @@ Used to expose logs via API endpoints.
 """
 
 import logging
+import os
 from collections import deque
 from datetime import datetime
-from typing import Dict, List
+from itertools import islice
+from typing import Dict, List, NamedTuple, Optional
+
+# Formats exceptions for a handler with no formatter set (as logging does)
+_default_formatter = logging.Formatter()
+
+
+class LogEntry(NamedTuple):
+    """Fields of a log record kept in memory (formatted on read)"""
+
+    created: float
+    name: str
+    levelno: int
+    levelname: str
+    raw_message: str
+    pathname: str
+    lineno: int
+    funcName: str
+    process: int
+    thread: int
+    threadName: str
+    exc_text: Optional[str]
+    stack_info: Optional[str]
+
+    def to_record(self) -> logging.LogRecord:
+        """Rebuild a LogRecord the handler's formatter can format"""
+        filename = os.path.basename(self.pathname)
+        return logging.makeLogRecord(
+            {
+                "name": self.name,
+                "msg": self.raw_message,
+                "args": None,
+                "levelno": self.levelno,
+                "levelname": self.levelname,
+                "pathname": self.pathname,
+                "filename": filename,
+                "module": os.path.splitext(filename)[0],
+                "lineno": self.lineno,
+                "funcName": self.funcName,
+                "created": self.created,
+                "msecs": (self.created - int(self.created)) * 1000.0,
+                "process": self.process,
+                "thread": self.thread,
+                "threadName": self.threadName,
+                "exc_text": self.exc_text,
+                "stack_info": self.stack_info,
+            }
+        )
 
 
 class InMemoryLogHandler(logging.Handler):
@@ -29,48 +77,107 @@ class InMemoryLogHandler(logging.Handler):
             )
         )
 
+    def handle(self, record):
+        """
+        Filter and emit a record without taking the handler lock.
+
+        emit() only appends to a bounded deque, which is atomic on its own;
+        the lock logging.Handler.handle() holds around it would just make
+        threads that log wait on each other.
+        """
+        rv = self.filter(record)
+        if isinstance(rv, logging.LogRecord):
+            # Python 3.12+ filters may return a replacement record
+            record = rv
+        if rv:
+            self.emit(record)
+        return rv
+
     def emit(self, record):
-        """Store log record in memory."""
+        """
+        Store log record in memory.
+
+        Only the record's fields are kept; the formatted message and
+        timestamp are built in get_recent_logs, off the logging hot path.
+        """
         try:
-            formatted = self.format(record)
+            exc_text = record.exc_text
+            if record.exc_info and not exc_text:
+                # The traceback can't be formatted later (exc_info isn't kept)
+                exc_text = (self.formatter or _default_formatter).formatException(
+                    record.exc_info
+                )
             self.logs.append(
-                {
-                    "timestamp": datetime.fromtimestamp(record.created).isoformat(),
-                    "level": record.levelname,
-                    "logger": record.name,
-                    "message": formatted,
-                    "raw_message": record.getMessage(),
-                    "pathname": getattr(record, "pathname", ""),
-                    "lineno": getattr(record, "lineno", 0),
-                    "funcName": getattr(record, "funcName", ""),
-                    "process": getattr(record, "process", 0),
-                    "thread": getattr(record, "thread", 0),
-                    "threadName": getattr(record, "threadName", ""),
-                }
+                LogEntry(
+                    created=record.created,
+                    name=record.name,
+                    levelno=record.levelno,
+                    levelname=record.levelname,
+                    raw_message=record.getMessage(),
+                    pathname=getattr(record, "pathname", ""),
+                    lineno=getattr(record, "lineno", 0),
+                    funcName=getattr(record, "funcName", ""),
+                    process=getattr(record, "process", 0),
+                    thread=getattr(record, "thread", 0),
+                    threadName=getattr(record, "threadName", ""),
+                    exc_text=exc_text,
+                    stack_info=record.stack_info,
+                )
             )
         except Exception:
             # Ignore errors in log handler to prevent infinite loops
             pass
 
+    def _entry_to_dict(self, entry: LogEntry) -> Dict:
+        """Format a stored entry into the dict returned by get_recent_logs"""
+        try:
+            formatted = self.format(entry.to_record())
+        except Exception:
+            formatted = entry.raw_message
+        return {
+            "timestamp": datetime.fromtimestamp(entry.created).isoformat(),
+            "level": entry.levelname,
+            "logger": entry.name,
+            "message": formatted,
+            "raw_message": entry.raw_message,
+            "pathname": entry.pathname,
+            "lineno": entry.lineno,
+            "funcName": entry.funcName,
+            "process": entry.process,
+            "thread": entry.thread,
+            "threadName": entry.threadName,
+        }
+
     def get_recent_logs(self, limit: int = 100, level: str = None) -> List[Dict]:
         """
         Get recent log entries.
 
         Args:
             limit: Maximum number of entries to return
-            level: Filter by log level (e.g., 'ERROR', 'WARNING', 'INFO')
+            level: Filter by log level, any case (e.g., 'ERROR', 'WARNING', 'INFO')
 
         Returns:
             List of log entries, most recent first
         """
-        logs = list(self.logs)
+        # emit() appends without the handler lock, so walk a snapshot: copying
+        # the deque (references only) is atomic, iterating it live is not
+        logs = reversed(self.logs.copy())
 
         # Filter by level if specified
         if level:
-            logs = [log for log in logs if log["level"] == level]
+            level = level.upper()
+            logs = (log for log in logs if log.levelname == level)
+
+        # Most recent first, limited to requested count
+        if limit > 0:
+            entries = list(islice(logs, limit))
+        else:
+            # limit <= 0 keeps the slice semantics of logs[-limit:] (0 = all)
+            entries = list(logs)
+            if limit:
+                entries = entries[: max(len(entries) + limit, 0)]
 
-        # Return most recent first, limited to requested count
-        return list(reversed(logs[-limit:]))
+        return [self._entry_to_dict(entry) for entry in entries]
 
 
 # Global log handler instance
@@ -3,9 +3,38 @@
 import re
 from typing import Dict, Optional, Tuple
 
-import yaml
 from app.utils.toc_service import _generate_anchor
 
+# Patterns compiled once at import (markdown_to_html runs them per line or per call)
+_HR_RE = re.compile(r"^([-*_])\1{2,}\s*$")
+_HR_SPACED_RE = re.compile(r"^([-*_])(?:\s+\1){2,}\s*$")
+_BULLET_ITEM_RE = re.compile(r"^(\s*)[-*+]\s+(.+)$")
+_NUMBERED_ITEM_RE = re.compile(r"^(\s*)(\d+\.(?:\d+\.?)*)\s+(.+)$")
+_BULLET_START_RE = re.compile(r"^(\s*)[-*+]\s+")
+_NUMBERED_START_RE = re.compile(r"^(\s*)(\d+\.(?:\d+\.?)*)\s+")
+_CODE_BLOCK_RE = re.compile(r"```(\w+)?\s*\n?(.*?)```", re.DOTALL)
+_TABLE_RE = re.compile(
+    r"^\|.+\|\s*\n"  # Header row: | col1 | col2 |
+    r"\|[-\s:]+(?:\|[-\s:]+)*\|\s*\n"  # Separator: |------|------| (one or more columns)
+    r"(\|.+\|\s*\n?)+",  # Data rows: | cell1 | cell2 | (one or more rows)
+    re.MULTILINE,
+)
+_HR_LINE_RE = re.compile(r"^([-*_])\1{2,}\s*$", re.MULTILINE)
+_HR_SPACED_LINE_RE = re.compile(r"^([-*_])(?:\s+\1){2,}\s*$", re.MULTILINE)
+_H1_RE = re.compile(r"^# (.+)$", re.MULTILINE)
+# H2-H6 in one pass: "#" runs followed by a space match exactly one level
+_SUBHEADING_RE = re.compile(r"^(#{2,6}) (.+)$", re.MULTILINE)
+_BOLD_STARS_RE = re.compile(r"\*\*(.+?)\*\*")
+_BOLD_UNDERSCORES_RE = re.compile(r"__(.+?)__")
+_ITALIC_STAR_RE = re.compile(r"\*(.+?)\*")
+_ITALIC_UNDERSCORE_RE = re.compile(r"_(.+?)_")
+_LINK_RE = re.compile(r"\[([^\]]+)\]\(([^\)]+)\)")
+_IMAGE_RE = re.compile(r"!\[([^\]]*)\]\(([^\)]+)\)")
+_INLINE_CODE_RE = re.compile(r"`([^`]+)`")
+_PRE_BLOCK_RE = re.compile(r"(<pre><code[^>]*>.*?</code></pre>)", re.DOTALL)
+_TABLE_BLOCK_RE = re.compile(r"(<table>.*?</table>)", re.DOTALL)
+_EXTRA_NEWLINES_RE = re.compile(r"\n{3,}")
+
 
 def parse_frontmatter(content: str) -> Tuple[Dict, str]:
     """
@@ -20,18 +49,23 @@ def parse_frontmatter(content: str) -> Tuple[Dict, str]:
     if not content.startswith("---"):
         return {}, content
 
-    # Split on frontmatter delimiters
-    parts = content.split("---", 2)
+    # Find the closing delimiter (slicing avoids split()'s list of copies)
+    end = content.find("---", 3)
 
-    if len(parts) < 3:
+    if end == -1:
         # Malformed frontmatter, return as-is
         return {}, content
 
-    frontmatter_str = parts[1].strip()
-    markdown_content = parts[2].lstrip("\n")
+    frontmatter_str = content[3:end].strip()
+    markdown_content = content[end + 3 :].lstrip("\n")
+
+    # Imported on first use: request workers that never parse pages skip it
+    import yaml
 
+    # libyaml's C loader when PyYAML was built with it (same SafeConstructor, several times faster)
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
     try:
-        frontmatter = yaml.safe_load(frontmatter_str) or {}
+        frontmatter = yaml.load(frontmatter_str, Loader=loader) or {}
     except yaml.YAMLError:
         # Invalid YAML, return empty dict
         frontmatter = {}
@@ -39,6 +73,24 @@ def parse_frontmatter(content: str) -> Tuple[Dict, str]:
     return frontmatter, markdown_content
 
 
+def strip_frontmatter(content: str) -> str:
+    """
+    Remove YAML frontmatter from markdown content without parsing it.
+
+    Args:
+        content: Markdown content with optional YAML frontmatter
+
+    Returns:
+        The markdown content, as parse_frontmatter returns it
+    """
+    if content.startswith("---"):
+        # Find the closing --- (slicing avoids split() copying the frontmatter)
+        end = content.find("---", 3)
+        if end != -1:
+            return content[end + 3 :].lstrip("\n")
+    return content
+
+
 def _parse_lists(lines: list) -> list:
     """
     Parse markdown list lines into HTML list structure.
@@ -73,18 +125,16 @@ def _parse_lists(lines: list) -> list:
 
         # Skip horizontal rules (---, ***, ___, * * *, - - -, _ _ _) - they should already be converted to <hr>
         # but check here as a safeguard to prevent them from being processed as list items
-        if re.match(r"^([-*_])\1{2,}\s*$", stripped) or re.match(
-            r"^([-*_])(?:\s+\1){2,}\s*$", stripped
-        ):
+        if _HR_RE.match(stripped) or _HR_SPACED_RE.match(stripped):
             result.append(line)
             i += 1
             continue
 
         # Check if this is a list item (bullet or numbered)
-        bullet_match = re.match(r"^(\s*)[-*+]\s+(.+)$", stripped)
+        bullet_match = _BULLET_ITEM_RE.match(stripped)
         # Match numbered lists: "1. " or "2.1 " or "3.4.2 " etc.
         # Pattern matches: digits, then period, then optional more digits/periods, then space
-        numbered_match = re.match(r"^(\s*)(\d+\.(?:\d+\.?)*)\s+(.+)$", stripped)
+        numbered_match = _NUMBERED_ITEM_RE.match(stripped)
 
         if bullet_match or numbered_match:
             # Start of a list - collect all list items at this level
@@ -111,14 +161,12 @@ def _parse_lists(lines: list) -> list:
                     if not next_stripped:
                         continue
                     # Check if next line is a horizontal rule (---, ***, ___) - end the list
-                    if re.match(r"^([-*_])\1{2,}\s*$", next_stripped):
+                    if _HR_RE.match(next_stripped):
                         # List ends at horizontal rule
                         break
                     # Check if next line is a list item
-                    next_bullet = re.match(r"^(\s*)[-*+]\s+", next_stripped)
-                    next_numbered = re.match(
-                        r"^(\s*)(\d+\.(?:\d+\.?)*)\s+", next_stripped
-                    )
+                    next_bullet = _BULLET_START_RE.match(next_stripped)
+                    next_numbered = _NUMBERED_START_RE.match(next_stripped)
                     if next_bullet or next_numbered:
                         next_indent = len(lines[i]) - len(lines[i].lstrip())
                         # Get the actual list item indent (spaces before bullet/number)
@@ -144,16 +192,14 @@ def _parse_lists(lines: list) -> list:
                     break
 
                 # Check if this is a horizontal rule (---, ***, ___, * * *, - - -, _ _ _) - end the list
-                if re.match(r"^([-*_])\1{2,}\s*$", stripped) or re.match(
-                    r"^([-*_])(?:\s+\1){2,}\s*$", stripped
-                ):
+                if _HR_RE.match(stripped) or _HR_SPACED_RE.match(stripped):
                     # List ends at horizontal rule
                     break
 
                 # Check if this is a list item
-                item_bullet = re.match(r"^(\s*)[-*+]\s+(.+)$", stripped)
+                item_bullet = _BULLET_ITEM_RE.match(stripped)
                 # Match numbered lists: "1. " or "2.1 " or "3.4.2 " etc.
-                item_numbered = re.match(r"^(\s*)(\d+\.(?:\d+\.?)*)\s+(.+)$", stripped)
+                item_numbered = _NUMBERED_ITEM_RE.match(stripped)
 
                 if not item_bullet and not item_numbered:
                     # Not a list item, end the list
@@ -226,10 +272,8 @@ def _parse_lists(lines: list) -> list:
                     next_indent = len(next_line) - len(next_line.lstrip())
 
                     # Check if this is a list item at the same level (sibling of current list)
-                    next_bullet = re.match(r"^(\s*)[-*+]\s+", next_stripped)
-                    next_numbered = re.match(
-                        r"^(\s*)(\d+\.(?:\d+\.?)*)\s+", next_stripped
-                    )
+                    next_bullet = _BULLET_START_RE.match(next_stripped)
+                    next_numbered = _NUMBERED_START_RE.match(next_stripped)
                     if next_bullet or next_numbered:
                         next_item_indent = (
                             len(next_bullet.group(1))
@@ -301,6 +345,42 @@ def _parse_lists(lines: list) -> list:
     return result
 
 
+# Lines starting with these are already block HTML, not paragraph text
+_BLOCK_TAG_PREFIXES = (
+    "<h",
+    "<p",
+    "<pre",
+    "<ul",
+    "<ol",
+    "<li",
+    "<blockquote",
+    "</ul",
+    "</ol",
+    "<table",
+    "</table",
+    "<hr",
+    "<PROTECTEDCODE",
+    "<PROTECTEDTABLE",
+)
+
+
+def _replace_h1(match) -> str:
+    """H1 heading, with escaped periods unescaped (as for H2-H6 below)"""
+    heading_text = match.group(1).replace("\\.", ".")
+    return f"<h1>{heading_text}</h1>"
+
+
+def _replace_subheading(match) -> str:
+    """H2-H6 heading, with an ID for TOC navigation (H1 is the page title, not in TOC)"""
+    level = len(match.group(1))
+    heading_text = match.group(2)
+    # Unescape backslashes in heading text (e.g., "1\. Title" -> "1. Title")
+    # TurndownService escapes periods to prevent list interpretation, but we want them unescaped in HTML
+    heading_text = heading_text.replace("\\.", ".")
+    anchor = _generate_anchor(heading_text)
+    return f'<h{level} id="{anchor}">{heading_text}</h{level}>'
+
+
 def markdown_to_html(markdown: str) -> str:
     """
     Convert markdown to HTML.
@@ -329,7 +409,7 @@ def markdown_to_html(markdown: str) -> str:
         # Pattern matches: ```language\ncode``` or ```\ncode``` or ```code```
         # Group 1: optional language (word characters)
         # Group 2: code content (everything until closing ```)
-        lang_match = re.match(r"```(\w+)?\s*\n?(.*?)```", full_match, re.DOTALL)
+        lang_match = _CODE_BLOCK_RE.match(full_match)
         if lang_match:
             lang = lang_match.group(1) or ""
             code_content = lang_match.group(2) if lang_match.group(2) else ""
@@ -351,7 +431,7 @@ def markdown_to_html(markdown: str) -> str:
 
     # Find and replace all code blocks (non-greedy match to handle multiple blocks)
     # Pattern: ``` followed by optional language, optional whitespace/newline, then code content, then ```
-    html = re.sub(r"```(\w+)?\s*\n?(.*?)```", replace_code_block, html, flags=re.DOTALL)
+    html = _CODE_BLOCK_RE.sub(replace_code_block, html)
 
     # Tables (GFM syntax) - do before headers to avoid conflicts
     # Pattern: | Header | Header |\n|--------|--------|\n| Cell | Cell |
@@ -420,51 +500,17 @@ def markdown_to_html(markdown: str) -> str:
     # Match GFM tables: lines starting with |, followed by separator line, then data rows
     # Pattern: | ... |\n|----|\n| ... |
     # More flexible pattern that handles various table formats
-    table_pattern = re.compile(
-        r"^\|.+\|\s*\n"  # Header row: | col1 | col2 |
-        r"\|[-\s:]+(?:\|[-\s:]+)*\|\s*\n"  # Separator: |------|------| (one or more columns)
-        r"(\|.+\|\s*\n?)+",  # Data rows: | cell1 | cell2 | (one or more rows)
-        re.MULTILINE,
-    )
-    html = table_pattern.sub(replace_table, html)
-
-    # Headers (H1-H6) - do after code blocks and tables to avoid conflicts
-    # Add IDs to H2-H6 headings for TOC navigation (H1 is typically page title, not in TOC)
-    def add_heading_id(match, level):
-        heading_text = match.group(1)
-        # Unescape backslashes in heading text (e.g., "1\. Title" -> "1. Title")
-        # TurndownService escapes periods to prevent list interpretation, but we want them unescaped in HTML
-        heading_text = heading_text.replace("\\.", ".")
-        anchor = _generate_anchor(heading_text)
-        return f'<h{level} id="{anchor}">{heading_text}</h{level}>'
+    html = _TABLE_RE.sub(replace_table, html)
 
     # Horizontal rules (---, ***, ___, * * *, - - -, _ _ _) - do before headers and lists to avoid conflicts
     # Pattern 1: three or more repeated dashes, asterisks, or underscores (---, ***, ___)
     # Pattern 2: three or more dashes, asterisks, or underscores separated by spaces (* * *, - - -, _ _ _)
-    html = re.sub(r"^([-*_])\1{2,}\s*$", r"<hr>", html, flags=re.MULTILINE)
-    html = re.sub(r"^([-*_])(?:\s+\1){2,}\s*$", r"<hr>", html, flags=re.MULTILINE)
-
-    # H1 headings - unescape backslashes (e.g., "1\. Title" -> "1. Title")
-    def add_h1(match):
-        heading_text = match.group(1).replace("\\.", ".")
-        return f"<h1>{heading_text}</h1>"
-
-    html = re.sub(r"^# (.+)$", add_h1, html, flags=re.MULTILINE)
-    html = re.sub(
-        r"^## (.+)$", lambda m: add_heading_id(m, 2), html, flags=re.MULTILINE
-    )
-    html = re.sub(
-        r"^### (.+)$", lambda m: add_heading_id(m, 3), html, flags=re.MULTILINE
-    )
-    html = re.sub(
-        r"^#### (.+)$", lambda m: add_heading_id(m, 4), html, flags=re.MULTILINE
-    )
-    html = re.sub(
-        r"^##### (.+)$", lambda m: add_heading_id(m, 5), html, flags=re.MULTILINE
-    )
-    html = re.sub(
-        r"^###### (.+)$", lambda m: add_heading_id(m, 6), html, flags=re.MULTILINE
-    )
+    html = _HR_LINE_RE.sub(r"<hr>", html)
+    html = _HR_SPACED_LINE_RE.sub(r"<hr>", html)
+
+    # Headers (H1-H6) - do after code blocks and tables to avoid conflicts
+    html = _H1_RE.sub(_replace_h1, html)
+    html = _SUBHEADING_RE.sub(_replace_subheading, html)
 
     # Parse lists (bullet and numbered) - handle nested lists
     # Do this BEFORE header conversion so we can parse markdown list syntax
@@ -475,21 +521,21 @@ def markdown_to_html(markdown: str) -> str:
     html = "\n".join(lines)
 
     # Bold
-    html = re.sub(r"\*\*(.+?)\*\*", r"<strong>\1</strong>", html)
-    html = re.sub(r"__(.+?)__", r"<strong>\1</strong>", html)
+    html = _BOLD_STARS_RE.sub(r"<strong>\1</strong>", html)
+    html = _BOLD_UNDERSCORES_RE.sub(r"<strong>\1</strong>", html)
 
     # Italic
-    html = re.sub(r"\*(.+?)\*", r"<em>\1</em>", html)
-    html = re.sub(r"_(.+?)_", r"<em>\1</em>", html)
+    html = _ITALIC_STAR_RE.sub(r"<em>\1</em>", html)
+    html = _ITALIC_UNDERSCORE_RE.sub(r"<em>\1</em>", html)
 
     # Links [text](url)
-    html = re.sub(r"\[([^\]]+)\]\(([^\)]+)\)", r'<a href="\2">\1</a>', html)
+    html = _LINK_RE.sub(r'<a href="\2">\1</a>', html)
 
     # Images ![alt](url)
-    html = re.sub(r"!\[([^\]]*)\]\(([^\)]+)\)", r'<img src="\2" alt="\1">', html)
+    html = _IMAGE_RE.sub(r'<img src="\2" alt="\1">', html)
 
     # Inline code `code` - do after other processing to avoid conflicts
-    html = re.sub(r"`([^`]+)`", r"<code>\1</code>", html)
+    html = _INLINE_CODE_RE.sub(r"<code>\1</code>", html)
 
     # Restore code blocks before paragraph processing
     # Use a unique marker that won't be split across lines
@@ -506,8 +552,6 @@ def markdown_to_html(markdown: str) -> str:
     # Paragraphs (lines not starting with #, *, -, <ul, <ol, <li, <pre, etc.)
     # Handle code blocks and tables carefully - they may span multiple lines after restoration
     # First, protect code blocks and tables by replacing them with placeholders
-    code_block_pattern = re.compile(r"(<pre><code[^>]*>.*?</code></pre>)", re.DOTALL)
-    table_pattern = re.compile(r"(<table>.*?</table>)", re.DOTALL)
     protected_blocks = []
 
     def protect_code_block(match):
@@ -524,8 +568,8 @@ def markdown_to_html(markdown: str) -> str:
         protected_blocks.append((placeholder, block))
         return placeholder
 
-    html = code_block_pattern.sub(protect_code_block, html)
-    html = table_pattern.sub(protect_table, html)
+    html = _PRE_BLOCK_RE.sub(protect_code_block, html)
+    html = _TABLE_BLOCK_RE.sub(protect_table, html)
 
     # Now split by newlines for paragraph processing
     lines = html.split("\n")
@@ -551,24 +595,7 @@ def markdown_to_html(markdown: str) -> str:
                 current_paragraph = []
                 in_paragraph = False
             result.append("")
-        elif stripped.startswith(
-            (
-                "<h",
-                "<p",
-                "<pre",
-                "<ul",
-                "<ol",
-                "<li",
-                "<blockquote",
-                "</ul",
-                "</ol",
-                "<table",
-                "</table",
-                "<hr",
-                "<PROTECTEDCODE",
-                "<PROTECTEDTABLE",
-            )
-        ):
+        elif stripped.startswith(_BLOCK_TAG_PREFIXES):
             if in_paragraph:
                 result.append(f'<p>{" ".join(current_paragraph)}</p>')
                 current_paragraph = []
@@ -589,7 +616,7 @@ def markdown_to_html(markdown: str) -> str:
         html = html.replace(placeholder, f"\n{block}\n")
 
     # Final cleanup: remove excessive newlines but preserve structure
-    html = re.sub(r"\n{3,}", "\n\n", html)
+    html = _EXTRA_NEWLINES_RE.sub("\n\n", html)
 
     # Post-process: wrap any remaining unwrapped text lines in paragraphs
     # This handles text that comes after tables/code blocks
@@ -634,25 +661,24 @@ def extract_internal_links(content: str) -> list:
         List of link dictionaries with 'text' and 'target' (slug)
     """
     links = []
-    if not content:
+    # Content without "](" has no links; skip the regex scan
+    if not content or "](" not in content:
         return links
 
-    # Pattern for markdown links: [text](target)
-    link_pattern = re.compile(r"\[([^\]]+)\]\(([^\)]+)\)")
-
-    for match in link_pattern.finditer(content):
-        link_text = match.group(1)
-        link_target = match.group(2)
+    # Markdown links: [text](target)
+    for link_text, link_target in _LINK_RE.findall(content):
+        # Split off the anchor once: slug#anchor -> slug, anchor
+        target, has_anchor, anchor = link_target.partition("#")
 
         # Extract slug from various formats
-        slug = _extract_slug_from_link(link_target)
+        slug = _extract_slug_from_link(target)
 
         if slug:
             links.append(
                 {
                     "text": link_text,
                     "target": slug,
-                    "anchor": _extract_anchor_from_link(link_target),
+                    "anchor": anchor.partition("#")[0] if has_anchor else None,
                 }
             )
 
@@ -660,14 +686,10 @@ def extract_internal_links(content: str) -> list:
 
 
 def _extract_slug_from_link(link_target: str) -> Optional[str]:
-    """Extract slug from link target (handles various formats)"""
+    """Extract slug from an anchor-free link target (handles various formats)"""
     if not link_target:
         return None
 
-    # Remove anchor if present: slug#anchor -> slug
-    if "#" in link_target:
-        link_target = link_target.split("#")[0]
-
     # Handle /wiki/pages/slug format
     if link_target.startswith("/wiki/pages/"):
         return link_target.replace("/wiki/pages/", "").strip("/")
@@ -681,10 +703,3 @@ def _extract_slug_from_link(link_target: str) -> Optional[str]:
 
     # Direct slug
     return link_target.strip("/")
-
-
-def _extract_anchor_from_link(link_target: str) -> Optional[str]:
-    """Extract anchor from link target if present"""
-    if "#" in link_target:
-        return link_target.split("#")[1]
-    return None
@@ -1,6 +1,45 @@
 """Utilities for calculating page size and word count"""
 
 import re
+import threading
+from collections import OrderedDict
+from typing import Callable, Tuple, TypeVar
+
+from app.utils.markdown_service import strip_frontmatter
+
+T = TypeVar("T")
+
+# Results of recent calculations, keyed by calculation, hash(content) and
+# len(content), so the memo never keeps page content alive. Re-saving or re-syncing a page whose
+# content was measured recently then costs one hash (cached on the str).
+MEMO_SIZE = 1024
+_memo: "OrderedDict[Tuple[str, int, int], object]" = OrderedDict()
+_memo_lock = threading.Lock()
+
+# Compiled once; both calculations run for every created or synced page
+_IMAGE_RE = re.compile(r"!\[.*?\]\([^\)]+\)")
+_LINK_RE = re.compile(r"\[([^\]]+)\]\([^\)]+\)")
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+# A maximal \w run is always bounded by \b, so this finds what \b\w+\b finds, faster
+_WORD_RE = re.compile(r"\w+")
+# Formatting characters (headers, bold, italic, code) and remaining brackets
+_FORMATTING_CHARS = str.maketrans("", "", "#*_`~[]")
+
+
+def _memoized(kind: str, content: str, calculate: Callable[[str], T]) -> T:
+    """Return calculate(content), reusing the result for recently seen content"""
+    key = (kind, hash(content), len(content))
+    with _memo_lock:
+        if key in _memo:
+            _memo.move_to_end(key)
+            return _memo[key]
+
+    result = calculate(content)
+    with _memo_lock:
+        _memo[key] = result
+        if len(_memo) > MEMO_SIZE:
+            _memo.popitem(last=False)
+    return result
 
 
 def calculate_word_count(content: str) -> int:
@@ -16,27 +55,31 @@ def calculate_word_count(content: str) -> int:
     """
     if not content:
         return 0
+    return _memoized("words", content, _count_words)
 
+
+def _count_words(content: str) -> int:
+    """calculate_word_count without the memo"""
     # Remove YAML frontmatter if present
-    content = _remove_frontmatter(content)
+    content = strip_frontmatter(content)
 
-    # Remove markdown image syntax: ![alt](url) or ![alt](url "title")
-    content = re.sub(r"!\[.*?\]\([^\)]+\)", "", content)
+    # Images and links both contain "](": pages without one skip both passes
+    if "](" in content:
+        # Remove markdown image syntax: ![alt](url) or ![alt](url "title")
+        content = _IMAGE_RE.sub("", content)
 
-    # Remove markdown links but keep the text: [text](url) -> text
-    content = re.sub(r"\[([^\]]+)\]\([^\)]+\)", r"\1", content)
+        # Remove markdown links but keep the text: [text](url) -> text
+        content = _LINK_RE.sub(r"\1", content)
 
     # Remove markdown formatting but keep text
-    content = re.sub(r"[#*_`~]", "", content)  # Headers, bold, italic, code
-    content = re.sub(r"\[|\]", "", content)  # Remaining brackets
+    content = content.translate(_FORMATTING_CHARS)
 
     # Remove HTML tags if any
-    content = re.sub(r"<[^>]+>", "", content)
-
-    # Split into words (whitespace-separated)
-    words = re.findall(r"\b\w+\b", content)
+    if "<" in content:
+        content = _HTML_TAG_RE.sub("", content)
 
-    return len(words)
+    # Count words (runs of word characters)
+    return len(_WORD_RE.findall(content))
 
 
 def calculate_content_size_kb(content: str) -> float:
@@ -52,25 +95,20 @@ def calculate_content_size_kb(content: str) -> float:
     """
     if not content:
         return 0.0
+    return _memoized("size_kb", content, _content_size_kb)
+
 
+def _content_size_kb(content: str) -> float:
+    """calculate_content_size_kb without the memo"""
     # Remove YAML frontmatter if present
-    content = _remove_frontmatter(content)
+    content = strip_frontmatter(content)
 
     # Remove markdown image syntax (images don't count toward size)
-    content = re.sub(r"!\[.*?\]\([^\)]+\)", "", content)
+    if "](" in content:
+        content = _IMAGE_RE.sub("", content)
 
     # Calculate size in bytes (UTF-8 encoding)
     size_bytes = len(content.encode("utf-8"))
 
     # Convert to kilobytes
     return round(size_bytes / 1024.0, 2)
-
-
-def _remove_frontmatter(content: str) -> str:
-    """Remove YAML frontmatter from content if present"""
-    if content.startswith("---"):
-        # Find the closing ---
-        parts = content.split("---", 2)
-        if len(parts) >= 3:
-            return parts[2].lstrip("\n")
-    return content
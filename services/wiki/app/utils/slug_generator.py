@@ -2,16 +2,22 @@
 
 import re
 import unicodedata
-from typing import Optional
+from typing import Collection, Optional
 
+# Compiled once; generate_slug runs per synced file without a slug
+_NON_SLUG_CHARS_RE = re.compile(r"[^\w\s-]")
+_SEPARATORS_RE = re.compile(r"[-\s]+")
+_VALID_SLUG_RE = re.compile(r"^[a-z0-9_-]+$")
 
-def generate_slug(text: str, existing_slugs: Optional[list] = None) -> str:
+
+def generate_slug(text: str, existing_slugs: Optional[Collection[str]] = None) -> str:
     """
     Generate a URL-friendly slug from text.
 
     Args:
         text: The text to convert to a slug
-        existing_slugs: List of existing slugs to check for uniqueness
+        existing_slugs: Existing slugs to check for uniqueness (other
+            collections are turned into a set if the slug is taken)
 
     Returns:
         A unique slug
@@ -22,13 +28,14 @@ def generate_slug(text: str, existing_slugs: Optional[list] = None) -> str:
     # Convert to lowercase
     slug = text.lower()
 
-    # Remove accents and special characters
-    slug = unicodedata.normalize("NFKD", slug)
-    slug = slug.encode("ascii", "ignore").decode("ascii")
+    # Remove accents and special characters (ASCII text has none to strip)
+    if not slug.isascii():
+        slug = unicodedata.normalize("NFKD", slug)
+        slug = slug.encode("ascii", "ignore").decode("ascii")
 
     # Replace spaces and special chars with hyphens
-    slug = re.sub(r"[^\w\s-]", "", slug)
-    slug = re.sub(r"[-\s]+", "-", slug)
+    slug = _NON_SLUG_CHARS_RE.sub("", slug)
+    slug = _SEPARATORS_RE.sub("-", slug)
 
     # Remove leading/trailing hyphens
     slug = slug.strip("-")
@@ -44,7 +51,10 @@ def generate_slug(text: str, existing_slugs: Optional[list] = None) -> str:
         slug = slug.rstrip("-")
 
     # Ensure uniqueness
-    if existing_slugs:
+    if existing_slugs and slug in existing_slugs:
+        if not isinstance(existing_slugs, (set, frozenset, dict)):
+            # A list costs a full scan per candidate; hash it once instead
+            existing_slugs = set(existing_slugs)
         base_slug = slug
         counter = 1
         while slug in existing_slugs:
@@ -79,7 +89,8 @@ def validate_slug(slug: str) -> bool:
         return False
 
     # Check format: alphanumeric, hyphens, underscores only
-    if not re.match(r"^[a-z0-9_-]+$", slug):
+    # (non-ASCII slugs are rejected without running the regex)
+    if not slug.isascii() or not _VALID_SLUG_RE.match(slug):
         return False
 
     # Cannot start or end with hyphen
@@ -3,6 +3,11 @@
 import re
 from typing import Dict, List
 
+# Markdown headings (H2-H6), e.g. "## Heading", "### Heading"
+_HEADING_RE = re.compile(r"^(#{2,6})\s+(.+)$", re.MULTILINE)
+_NON_ANCHOR_CHARS_RE = re.compile(r"[^\w\s-]")
+_SEPARATORS_RE = re.compile(r"[-\s]+")
+
 
 def generate_toc(content: str) -> List[Dict[str, str]]:
     """
@@ -18,17 +23,13 @@ def generate_toc(content: str) -> List[Dict[str, str]]:
     if not content:
         return toc
 
-    # Remove YAML frontmatter if present
-    if content.startswith("---"):
-        parts = content.split("---", 2)
-        if len(parts) >= 3:
-            content = parts[2].lstrip("\n")
+    # Imported here: markdown_service imports this module at load time
+    from app.utils.markdown_service import strip_frontmatter
 
-    # Pattern to match markdown headings (H2-H6)
-    # Matches: ## Heading, ### Heading, etc.
-    heading_pattern = re.compile(r"^(#{2,6})\s+(.+)$", re.MULTILINE)
+    # Remove YAML frontmatter if present
+    content = strip_frontmatter(content)
 
-    for match in heading_pattern.finditer(content):
+    for match in _HEADING_RE.finditer(content):
         level = len(match.group(1))  # Number of # characters (2-6)
         text = match.group(2).strip()
 
@@ -56,8 +57,8 @@ def _generate_anchor(text: str) -> str:
     anchor = text.lower()
 
     # Replace spaces and special chars with hyphens
-    anchor = re.sub(r"[^\w\s-]", "", anchor)
-    anchor = re.sub(r"[-\s]+", "-", anchor)
+    anchor = _NON_ANCHOR_CHARS_RE.sub("", anchor)
+    anchor = _SEPARATORS_RE.sub("-", anchor)
 
     # Remove leading/trailing hyphens
     anchor = anchor.strip("-")
@@ -98,6 +98,52 @@ class Config:
         os.environ.get("SYNC_ENABLE_CONTENT_COMPARISON", "true").lower() == "true"
     )
 
+    # File sync status cache
+    # Cache file mtime/content-hash results used by conflict warnings and sync status,
+    # invalidated by a file system watcher on the pages directory instead of re-reading
+    # the file on every request. Not started when TESTING is set.
+    # Default: True (enabled)
+    SYNC_STATUS_CACHE_ENABLED = (
+        os.environ.get("SYNC_STATUS_CACHE_ENABLED", "true").lower() == "true"
+    )
+
+    # File sync content hash cache
+    # File name (inside WIKI_PAGES_DIR) where SyncUtility persists content hashes of
+    # synced files between runs, so files whose mtime/size/inode are unchanged are not
+    # re-read. Set to an empty string to keep the cache in memory only.
+    SYNC_HASH_CACHE_FILE = os.environ.get("SYNC_HASH_CACHE_FILE", ".sync-cache.json")
+
+    # File sync parallel hashing
+    # Worker processes used by sync-all/sync-dir to normalize and hash changed files
+    # before the serial database phase. Set to 1 to hash in the main process only.
+    # Default: min(8, CPU count)
+    SYNC_PARALLEL_WORKERS = int(
+        os.environ.get("SYNC_PARALLEL_WORKERS", str(min(8, os.cpu_count() or 1)))
+    )
+
+    # File sync read-ahead
+    # Threads used by sync-all/sync-dir to read and parse the files to sync ahead of
+    # the serial database phase. Set to 1 to read each file when it is synced.
+    # Default: min(32, 4 x CPU count)
+    SYNC_READ_AHEAD_WORKERS = int(
+        os.environ.get(
+            "SYNC_READ_AHEAD_WORKERS", str(min(32, 4 * (os.cpu_count() or 1)))
+        )
+    )
+
+    # Page directory scanning
+    # Threads used to list wide page trees (32+ queued directories) in parallel,
+    # which overlaps slow directory listings on network mounts. Set to 1 to scan
+    # serially.
+    # Default: 16
+    SYNC_SCAN_WORKERS = int(os.environ.get("SYNC_SCAN_WORKERS", "16"))
+
+    # File sync commit batching
+    # Number of updated files sync-all/sync-dir commit together. A failure rolls back
+    # the uncommitted batch, which is then replayed under per-file savepoints.
+    # Default: 100
+    SYNC_COMMIT_BATCH_SIZE = int(os.environ.get("SYNC_COMMIT_BATCH_SIZE", "100"))
+
 
 class DevelopmentConfig(Config):
     """Development configuration"""
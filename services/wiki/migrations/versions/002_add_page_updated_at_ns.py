@@ -0,0 +1,32 @@
+"""Add pages.updated_at_ns
+
+Revision ID: 002_updated_at_ns
+Revises: 001_initial
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "002_updated_at_ns"
+down_revision = "001_initial"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # updated_at as integer nanoseconds, for exact comparison with file st_mtime_ns
+    op.add_column("pages", sa.Column("updated_at_ns", sa.BigInteger(), nullable=True))
+
+    # Backfill from updated_at (stored as UTC wall time), at microsecond precision
+    op.execute(
+        "UPDATE pages SET updated_at_ns = "
+        "(EXTRACT(EPOCH FROM updated_at) * 1000000)::bigint * 1000 "
+        "WHERE updated_at IS NOT NULL"
+    )
+
+
+def downgrade():
+    op.drop_column("pages", "updated_at_ns")
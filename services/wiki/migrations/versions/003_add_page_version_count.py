@@ -0,0 +1,35 @@
+"""Add pages.version_count
+
+Revision ID: 003_version_count
+Revises: 002_updated_at_ns
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "003_version_count"
+down_revision = "002_updated_at_ns"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Denormalized count of page_versions rows per page
+    op.add_column(
+        "pages",
+        sa.Column("version_count", sa.Integer(), nullable=False, server_default="0"),
+    )
+
+    # Backfill from existing versions
+    op.execute(
+        "UPDATE pages SET version_count = counts.total "
+        "FROM (SELECT page_id, COUNT(*) AS total FROM page_versions GROUP BY page_id) AS counts "
+        "WHERE pages.id = counts.page_id"
+    )
+
+
+def downgrade():
+    op.drop_column("pages", "version_count")
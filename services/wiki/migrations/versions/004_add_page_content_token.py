@@ -0,0 +1,34 @@
+"""Add pages.content_token
+
+Revision ID: 004_content_token
+Revises: 003_version_count
+Create Date: 2026-10-17 00:00:00.000000
+
+Sync content comparison switches from SHA-256 hex digests to a 64-bit
+non-cryptographic change token (XXH3-64 when xxhash is installed, otherwise
+BLAKE2b truncated to 64 bits), stored per page so the database side is an
+integer read instead of a hash over the content. Tokens answer "did the
+content change?" only; they are not suitable for integrity checks.
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "004_content_token"
+down_revision = "003_version_count"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Not backfilled: a token computed here would depend on whichever
+    # algorithm the app (and its optional xxhash) has at upgrade time. NULL
+    # makes readers hash the content instead, and the app stores the token
+    # the next time a page's content is written.
+    op.add_column("pages", sa.Column("content_token", sa.BigInteger(), nullable=True))
+
+
+def downgrade():
+    op.drop_column("pages", "content_token")
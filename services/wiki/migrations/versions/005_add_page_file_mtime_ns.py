@@ -0,0 +1,26 @@
+"""Add pages.file_mtime_ns
+
+Revision ID: 005_file_mtime_ns
+Revises: 004_content_token
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "005_file_mtime_ns"
+down_revision = "004_content_token"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # st_mtime_ns of the page file at its last sync; NULL until the next sync,
+    # which falls back to the content comparison
+    op.add_column("pages", sa.Column("file_mtime_ns", sa.BigInteger(), nullable=True))
+
+
+def downgrade():
+    op.drop_column("pages", "file_mtime_ns")
@@ -0,0 +1,69 @@
+"""Shared test helpers for seeding pages and page files"""
+
+import os
+import uuid
+from pathlib import Path
+from typing import Optional, Union
+
+from app import db
+from app.models.page import Page
+
+# Nanoseconds per unit, for readable mtime offsets (e.g. -NS_PER_HOUR)
+NS_PER_SECOND = 1_000_000_000
+NS_PER_HOUR = 3600 * NS_PER_SECOND
+
+
+def seed_file(
+    path: Union[str, Path], content: str, mtime_ns: Optional[int] = None
+) -> Path:
+    """
+    Write a test file and optionally pin its timestamps.
+
+    The content is written in one call without flushing to disk, then the
+    access/modification time is set with os.utime's ns= keyword so it never
+    round-trips through a float and matches the st_mtime_ns the sync code
+    compares against.
+
+    Args:
+        path: File to write
+        content: File content (UTF-8)
+        mtime_ns: Access/modification time in nanoseconds since the Unix epoch
+            (left as written if None)
+
+    Returns:
+        Path of the written file
+    """
+    path = Path(path)
+    path.write_text(content, encoding="utf-8")
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+    return path
+
+
+def make_page(user_id: Optional[uuid.UUID] = None, **overrides) -> Page:
+    """
+    Create and commit a Page with test defaults.
+
+    Args:
+        user_id: Used for created_by/updated_by (random if None)
+        **overrides: Page column values replacing the defaults
+
+    Returns:
+        The committed Page instance
+    """
+    if user_id is None:
+        user_id = uuid.uuid4()
+
+    fields = {
+        "title": "Test",
+        "slug": "test",
+        "content": "# Test",
+        "created_by": user_id,
+        "updated_by": user_id,
+    }
+    fields.update(overrides)
+
+    page = Page(**fields)
+    db.session.add(page)
+    db.session.commit()
+    return page
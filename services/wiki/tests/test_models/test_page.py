@@ -1,9 +1,11 @@
 """Test Page model"""
 
 import uuid
+from datetime import datetime, timezone
 
 from app import db
-from app.models.page import Page
+from app.models.page import Page, datetime_to_ns
+from app.utils.content_token import compute_content_token
 
 
 def test_page_creation(app):
@@ -118,3 +120,85 @@ def test_section_independence(app):
         # Section can be different from parent's section
         assert page.section == "Regression-Testing/game-mechanics"
         assert page.parent_id is None  # No parent, but has section
+
+
+def test_datetime_to_ns():
+    """Test datetime to integer nanosecond conversion"""
+    aware = datetime(2024, 1, 2, 3, 4, 5, 123456, tzinfo=timezone.utc)
+
+    assert datetime_to_ns(aware) == 1704164645_123456000
+    # Naive datetimes are stored UTC wall time
+    assert datetime_to_ns(aware.replace(tzinfo=None)) == datetime_to_ns(aware)
+    assert datetime_to_ns(None) is None
+
+
+def test_updated_at_ns_tracks_updated_at(app):
+    """Test updated_at_ns is written alongside updated_at on insert and update"""
+    with app.app_context():
+        user_id = uuid.uuid4()
+        updated_at = datetime(2024, 1, 2, 3, 4, 5, 123456, tzinfo=timezone.utc)
+        page = Page(
+            title="Test Page",
+            slug="test-page",
+            file_path="test-page.md",
+            content="Content",
+            created_by=user_id,
+            updated_by=user_id,
+            updated_at=updated_at,
+        )
+        db.session.add(page)
+        db.session.commit()
+
+        assert page.updated_at_ns == datetime_to_ns(updated_at)
+
+        # onupdate refreshes both columns together
+        page.content = "Updated content"
+        db.session.commit()
+
+        assert page.updated_at_ns == datetime_to_ns(page.updated_at)
+        assert page.updated_at_ns > datetime_to_ns(updated_at)
+
+
+def test_content_token_tracks_content(app):
+    """Test content_token is set on create and recomputed when content changes"""
+    with app.app_context():
+        user_id = uuid.uuid4()
+        page = Page(
+            title="Test Page",
+            slug="test-page",
+            file_path="test-page.md",
+            content="Content",
+            created_by=user_id,
+            updated_by=user_id,
+        )
+        db.session.add(page)
+        db.session.commit()
+
+        assert page.content_token == compute_content_token("Content")
+
+        page.content = "Updated content"
+        db.session.commit()
+        db.session.expire(page)
+
+        assert page.content_token == compute_content_token("Updated content")
+
+
+def test_content_bytes_memoized_until_content_changes(app):
+    """Test content_bytes is encoded once and re-encoded after content changes"""
+    with app.app_context():
+        user_id = uuid.uuid4()
+        page = Page(
+            title="Test Page",
+            slug="test-page",
+            file_path="test-page.md",
+            content="Contént",
+            created_by=user_id,
+            updated_by=user_id,
+        )
+
+        first = page.content_bytes
+        assert first == "Contént".encode("utf-8")
+        assert page.content_bytes is first
+
+        page.content = "Updated"
+        assert page.content_bytes == b"Updated"
@@ -216,3 +216,60 @@ def test_version_cascade_delete(app):
 
         # Version should be deleted
         assert PageVersion.query.get(version_id) is None
+
+
+def test_page_version_count_tracks_versions(app):
+    """Test Page.version_count follows version inserts and deletes"""
+    with app.app_context():
+        user_id = uuid.uuid4()
+
+        page = Page(
+            title="Test Page",
+            slug="test-page",
+            file_path="data/pages/test-page.md",
+            content="Content",
+            section="Regression-Testing",
+            created_by=user_id,
+            updated_by=user_id,
+        )
+        db.session.add(page)
+        db.session.commit()
+        updated_at = page.updated_at
+        assert page.version_count == 0
+
+        versions = []
+        for i in range(1, 4):
+            version = PageVersion(
+                page_id=page.id,
+                version=i,
+                title="Test Page",
+                content=f"Version {i}",
+                changed_by=user_id,
+            )
+            db.session.add(version)
+            versions.append(version)
+        db.session.commit()
+
+        assert page.version_count == 3
+        # Counting versions is not a page edit
+        assert page.updated_at == updated_at
+
+        db.session.delete(versions[0])
+        db.session.commit()
+
+        assert page.version_count == 2
+
+
+def test_page_version_newest_first_index(app):
+    """Test the (page_id, version DESC) index is created with the table"""
+    with app.app_context():
+        indexes = {
+            index["name"]: index
+            for index in db.inspect(db.engine).get_indexes("page_versions")
+        }
+
+        assert "idx_versions_version" in indexes
+        assert indexes["idx_versions_version"]["column_names"] == [
+            "page_id",
+            "version",
+        ]
@@ -247,3 +247,19 @@ def test_move_page_file(app):
             assert os.path.exists(new_full)
         finally:
             shutil.rmtree(temp_dir)
+
+
+def test_write_if_changed_keeps_identical_file(tmp_path):
+    """Test identical content is not rewritten, so the mtime is preserved"""
+    full_path = str(tmp_path / "page.md")
+    content = "---\ntitle: Tést\n---\n# Tést\n"
+
+    assert FileService.write_if_changed(full_path, content) is True
+    os.utime(full_path, ns=(1_700_000_000_000_000_000, 1_700_000_000_000_000_000))
+
+    assert FileService.write_if_changed(full_path, content) is False
+    assert os.stat(full_path).st_mtime_ns == 1_700_000_000_000_000_000
+
+    assert FileService.write_if_changed(full_path, content + "More.\n") is True
+    with open(full_path, encoding="utf-8") as f:
+        assert f.read() == content + "More.\n"
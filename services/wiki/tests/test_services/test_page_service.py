@@ -5,6 +5,7 @@ import shutil
 import tempfile
 import uuid
 
+from app import db
 from app.models.page import Page
 from app.services.page_service import PageService
 
@@ -215,6 +216,96 @@ def test_update_page_circular_reference(app):
             )
 
 
+def test_update_page_bulk(app):
+    """Test bulk updates create one version per content change"""
+    with app.app_context():
+        from app.models.page_version import PageVersion
+
+        user_id = uuid.uuid4()
+
+        page1 = PageService.create_page(
+            title="Bulk Page 1",
+            content="Original 1",
+            user_id=user_id,
+            section="Regression-Testing",
+        )
+        page2 = PageService.create_page(
+            title="Bulk Page 2",
+            content="Original 2",
+            user_id=user_id,
+            section="Regression-Testing",
+        )
+        sequential = PageService.create_page(
+            title="Sequential Page",
+            content="Original 1",
+            user_id=user_id,
+            section="Regression-Testing",
+        )
+        PageService.update_page(sequential.id, user_id, content="Second 1")
+        sequential = PageService.update_page(
+            sequential.id, user_id, content="Third 1\nmore"
+        )
+
+        updated = PageService.update_page_bulk(
+            [
+                {"page_id": page1.id, "content": "Second 1"},
+                {"page_id": page2.id, "title": "Renamed 2"},
+                {"page_id": page1.id, "content": "Third 1\nmore"},
+            ],
+            user_id=user_id,
+        )
+
+        assert [page.id for page in updated] == [page1.id, page2.id]
+        assert updated[0].content == "Third 1\nmore"
+        # Same version numbering as the equivalent update_page calls
+        assert updated[0].version == sequential.version
+        db.session.expire_all()
+        assert db.session.get(Page, page1.id).version == (
+            db.session.get(Page, sequential.id).version
+        )
+        assert updated[0].version_count == 3
+        assert updated[1].title == "Renamed 2"
+        assert updated[1].version_count == 1
+
+        versions = (
+            PageVersion.query.filter_by(page_id=page1.id)
+            .order_by(PageVersion.version)
+            .all()
+        )
+        assert [v.content for v in versions] == [
+            "Original 1",
+            "Second 1",
+            "Third 1\nmore",
+        ]
+        assert versions[2].diff_data["lines_added"] == 1
+
+
+def test_update_page_bulk_page_not_found(app):
+    """Test a bulk update with a missing page applies nothing"""
+    with app.app_context():
+        import pytest
+
+        user_id = uuid.uuid4()
+
+        page = PageService.create_page(
+            title="Bulk Page",
+            content="Original",
+            user_id=user_id,
+            section="Regression-Testing",
+        )
+
+        with pytest.raises(ValueError, match="Page not found"):
+            PageService.update_page_bulk(
+                [
+                    {"page_id": page.id, "content": "Changed"},
+                    {"page_id": uuid.uuid4(), "content": "Missing"},
+                ],
+                user_id=user_id,
+            )
+
+        assert Page.query.get(page.id).content == "Original"
+
+
 def test_delete_page(app):
     """Test page deletion"""
     with app.app_context():
@@ -5,11 +5,12 @@ import tempfile
 import time
 import uuid
 from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
 
 import pytest
-from app import db
 from app.models.page import Page
 from app.services.page_service import PageService
+from tests._helpers import NS_PER_HOUR, NS_PER_SECOND, make_page, seed_file
 
 
 @pytest.fixture
@@ -36,16 +37,10 @@ def admin_user_id():
 def test_check_sync_conflict_no_file_path(app, admin_user_id):
     """Test check_sync_conflict returns None when page has empty file_path"""
     with app.app_context():
-        page = Page(
-            title="Test",
-            slug="test",
-            content="# Test",
-            created_by=admin_user_id,
-            updated_by=admin_user_id,
+        page = make_page(
+            user_id=admin_user_id,
             file_path="",  # Empty string - file_path is NOT NULL in DB
         )
-        db.session.add(page)
-        db.session.commit()
 
         # Manually set file_path to None after creation to test the code path
         # (In practice, file_path is always set, but code checks for it defensively)
@@ -54,8 +49,8 @@ def test_check_sync_conflict_no_file_path(app, admin_user_id):
         assert conflict is None
 
 
-def test_check_sync_conflict_file_not_exists(app, admin_user_id, temp_pages_dir):
-    """Test check_sync_conflict returns None when file doesn't exist"""
+def test_sync_checks_skip_file_io_without_file_path(app, admin_user_id):
+    """Test pages without a file_path return before any file system access"""
     with app.app_context():
         page = Page(
             title="Test",
@@ -63,10 +58,25 @@ def test_check_sync_conflict_file_not_exists(app, admin_user_id, temp_pages_dir)
             content="# Test",
             created_by=admin_user_id,
             updated_by=admin_user_id,
+            file_path="",
+        )
+
+        with patch(
+            "app.services.page_service.PageService._get_file_sync_state"
+        ) as mock_state:
+            assert PageService.check_sync_conflict(page) is None
+            assert PageService.get_sync_status(page) is None
+
+        mock_state.assert_not_called()
+
+
+def test_check_sync_conflict_file_not_exists(app, admin_user_id, temp_pages_dir):
+    """Test check_sync_conflict returns None when file doesn't exist"""
+    with app.app_context():
+        page = make_page(
+            user_id=admin_user_id,
             file_path="nonexistent.md",
         )
-        db.session.add(page)
-        db.session.commit()
 
         conflict = PageService.check_sync_conflict(page)
         assert conflict is None
@@ -76,24 +86,15 @@ def test_check_sync_conflict_file_newer(app, admin_user_id, temp_pages_dir):
     """Test check_sync_conflict detects when file is newer than database"""
     with app.app_context():
         # Create page in database
-        page = Page(
-            title="Test",
-            slug="test",
-            content="# Test",
-            created_by=admin_user_id,
-            updated_by=admin_user_id,
+        page = make_page(
+            user_id=admin_user_id,
             file_path="test.md",
             updated_at=datetime.now(timezone.utc) - timedelta(hours=1),
         )
-        db.session.add(page)
-        db.session.commit()
 
         # Create file with newer timestamp
         file_path = os.path.join(temp_pages_dir, "test.md")
-        with open(file_path, "w", encoding="utf-8") as f:
-            f.write("# Updated Test")
-        time.sleep(0.1)
-        os.utime(file_path, None)
+        seed_file(file_path, "# Updated Test", time.time_ns() + NS_PER_SECOND)
 
         conflict = PageService.check_sync_conflict(page)
         assert conflict is not None
@@ -114,17 +115,12 @@ slug: "test"
 ---
 # Database Content
 """
-        page = Page(
-            title="Test",
-            slug="test",
+        page = make_page(
             content=db_content,
-            created_by=admin_user_id,
-            updated_by=admin_user_id,
+            user_id=admin_user_id,
             file_path="test.md",
             updated_at=datetime.now(timezone.utc),
         )
-        db.session.add(page)
-        db.session.commit()
 
         # Create file with different content
         file_content = """---
@@ -134,12 +130,8 @@ slug: "test"
 # File Content
 """
         file_path = os.path.join(temp_pages_dir, "test.md")
-        with open(file_path, "w", encoding="utf-8") as f:
-            f.write(file_content)
-
-        # Set file timestamp to be same or older (content comparison should still catch it)
-        file_time = datetime.now(timezone.utc).timestamp()
-        os.utime(file_path, (file_time, file_time))
+        # File timestamp same as the database (content comparison should still catch it)
+        seed_file(file_path, file_content, page.updated_at_ns)
 
         conflict = PageService.check_sync_conflict(page)
         assert conflict is not None
@@ -154,24 +146,15 @@ def test_check_sync_conflict_grace_period(app, admin_user_id, temp_pages_dir):
         app.config["SYNC_CONFLICT_GRACE_PERIOD_SECONDS"] = 600
 
         # Create page recently updated
-        page = Page(
-            title="Test",
-            slug="test",
-            content="# Test",
-            created_by=admin_user_id,
-            updated_by=admin_user_id,
+        page = make_page(
+            user_id=admin_user_id,
             file_path="test.md",
             updated_at=datetime.now(timezone.utc),
         )
-        db.session.add(page)
-        db.session.commit()
 
         # Create file with newer timestamp
         file_path = os.path.join(temp_pages_dir, "test.md")
-        with open(file_path, "w", encoding="utf-8") as f:
-            f.write("# Updated")
-        time.sleep(0.1)
-        os.utime(file_path, None)
+        seed_file(file_path, "# Updated", time.time_ns() + NS_PER_SECOND)
 
         conflict = PageService.check_sync_conflict(page)
         assert conflict is not None
@@ -187,16 +170,10 @@ def test_check_sync_conflict_grace_period(app, admin_user_id, temp_pages_dir):
 def test_get_sync_status_no_file_path(app, admin_user_id):
     """Test get_sync_status returns None when page has empty file_path"""
     with app.app_context():
-        page = Page(
-            title="Test",
-            slug="test",
-            content="# Test",
-            created_by=admin_user_id,
-            updated_by=admin_user_id,
+        page = make_page(
+            user_id=admin_user_id,
             file_path="",  # Empty string - file_path is NOT NULL in DB
         )
-        db.session.add(page)
-        db.session.commit()
 
         # Manually set file_path to None after creation to test the code path
         # (In practice, file_path is always set, but code checks for it defensively)
@@ -208,16 +185,10 @@ def test_get_sync_status_no_file_path(app, admin_user_id):
 def test_get_sync_status_file_not_exists(app, admin_user_id, temp_pages_dir):
     """Test get_sync_status returns None when file doesn't exist"""
     with app.app_context():
-        page = Page(
-            title="Test",
-            slug="test",
-            content="# Test",
-            created_by=admin_user_id,
-            updated_by=admin_user_id,
+        page = make_page(
+            user_id=admin_user_id,
             file_path="nonexistent.md",
         )
-        db.session.add(page)
-        db.session.commit()
 
         status = PageService.get_sync_status(page)
         assert status is None
@@ -227,24 +198,15 @@ def test_get_sync_status_file_newer(app, admin_user_id, temp_pages_dir):
     """Test get_sync_status when file is newer"""
     with app.app_context():
         # Create page in database
-        page = Page(
-            title="Test",
-            slug="test",
-            content="# Test",
-            created_by=admin_user_id,
-            updated_by=admin_user_id,
+        page = make_page(
+            user_id=admin_user_id,
             file_path="test.md",
             updated_at=datetime.now(timezone.utc) - timedelta(hours=1),
         )
-        db.session.add(page)
-        db.session.commit()
 
         # Create file with newer timestamp
         file_path = os.path.join(temp_pages_dir, "test.md")
-        with open(file_path, "w", encoding="utf-8") as f:
-            f.write("# Test")
-        time.sleep(0.1)
-        os.utime(file_path, None)
+        seed_file(file_path, "# Test", time.time_ns() + NS_PER_SECOND)
 
         status = PageService.get_sync_status(page)
         assert status is not None
@@ -258,24 +220,15 @@ def test_get_sync_status_database_newer(app, admin_user_id, temp_pages_dir):
     """Test get_sync_status when database is newer"""
     with app.app_context():
         # Create page in database with recent update
-        page = Page(
-            title="Test",
-            slug="test",
-            content="# Test",
-            created_by=admin_user_id,
-            updated_by=admin_user_id,
+        page = make_page(
+            user_id=admin_user_id,
             file_path="test.md",
             updated_at=datetime.now(timezone.utc),
         )
-        db.session.add(page)
-        db.session.commit()
 
         # Create file with older timestamp
         file_path = os.path.join(temp_pages_dir, "test.md")
-        with open(file_path, "w", encoding="utf-8") as f:
-            f.write("# Test")
-        old_time = (datetime.now(timezone.utc) - timedelta(hours=1)).timestamp()
-        os.utime(file_path, (old_time, old_time))
+        seed_file(file_path, "# Test", time.time_ns() - NS_PER_HOUR)
 
         status = PageService.get_sync_status(page)
         assert status is not None
@@ -290,50 +243,33 @@ def test_get_sync_status_synced(app, admin_user_id, temp_pages_dir):
     with app.app_context():
         # Create page in database
         db_time = datetime.now(timezone.utc)
-        page = Page(
-            title="Test",
-            slug="test",
-            content="# Test",
-            created_by=admin_user_id,
-            updated_by=admin_user_id,
+        page = make_page(
+            user_id=admin_user_id,
             file_path="test.md",
             updated_at=db_time,
         )
-        db.session.add(page)
-        db.session.commit()
 
-        # Create file with matching timestamp
+        # Create file with matching timestamp (exact, in nanoseconds)
         file_path = os.path.join(temp_pages_dir, "test.md")
-        with open(file_path, "w", encoding="utf-8") as f:
-            f.write("# Test")
-        file_time = db_time.timestamp()
-        os.utime(file_path, (file_time, file_time))
+        seed_file(file_path, "# Test", page.updated_at_ns)
 
         status = PageService.get_sync_status(page)
         assert status is not None
         assert status["last_updated_source"] == "synced"
         assert status["is_synced"] is True
-        assert abs(status["time_difference_seconds"]) < 1.0
+        assert status["time_difference_seconds"] == 0
 
 
 def test_get_sync_status_includes_timestamps(app, admin_user_id, temp_pages_dir):
     """Test get_sync_status includes all required timestamp fields"""
     with app.app_context():
-        page = Page(
-            title="Test",
-            slug="test",
-            content="# Test",
-            created_by=admin_user_id,
-            updated_by=admin_user_id,
+        page = make_page(
+            user_id=admin_user_id,
             file_path="test.md",
             updated_at=datetime.now(timezone.utc),
         )
-        db.session.add(page)
-        db.session.commit()
 
-        file_path = os.path.join(temp_pages_dir, "test.md")
-        with open(file_path, "w", encoding="utf-8") as f:
-            f.write("# Test")
+        seed_file(os.path.join(temp_pages_dir, "test.md"), "# Test")
 
         status = PageService.get_sync_status(page)
         assert status is not None
@@ -192,6 +192,31 @@ def test_calculate_diff(app):
         assert added > 0 or removed > 0
 
 
+def test_calculate_diff_line_counts():
+    """Test diff line counts for changed content"""
+    diff_data = VersionService._calculate_diff(
+        "Line 1\nLine 2\nLine 3", "Line 1\nLine 2 Modified\nLine 3\nLine 4"
+    )
+
+    assert diff_data["added_lines"] == 3
+    assert diff_data["removed_lines"] == 2
+    assert diff_data["old_line_count"] == 3
+    assert diff_data["new_line_count"] == 4
+    assert diff_data["char_diff"] == 16
+
+
+def test_calculate_diff_identical_content():
+    """Test diff of identical content short-circuits to an empty diff"""
+    diff_data = VersionService._calculate_diff("Line 1\nLine 2", "Line 1\nLine 2")
+
+    assert diff_data["diff"] == []
+    assert diff_data["added_lines"] == 0
+    assert diff_data["removed_lines"] == 0
+    assert diff_data["old_line_count"] == 2
+    assert diff_data["new_line_count"] == 2
+    assert diff_data["char_diff"] == 0
+
+
 def test_compare_versions(app):
     """Test comparing two versions"""
     with app.app_context():
@@ -388,11 +413,11 @@ def test_version_retention(app):
             section="Regression-Testing",
         )
 
-        # Create many versions by updating the page
-        for i in range(9):  # 9 more updates = 10 total versions
-            PageService.update_page(
-                page_id=page.id, user_id=user_id, content=f"Version {i+2}"
-            )
+        # Create many versions by updating the page (9 more updates = 10 total versions)
+        PageService.update_page_bulk(
+            [{"page_id": page.id, "content": f"Version {i+2}"} for i in range(9)],
+            user_id=user_id,
+        )
 
         # All versions should still exist
         count = VersionService.get_version_count(page.id)
@@ -1,30 +1,40 @@
 """Tests for Feature 5.1: Content Comparison for Sync Decisions"""
 
 import os
+import shutil
 import tempfile
 import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
 
 import pytest
 from app import db
 from app.models.page import Page
 from app.sync.sync_utility import SyncUtility
+from tests._helpers import NS_PER_HOUR, NS_PER_SECOND, seed_file
+
+# RAM-backed (tmpfs) directory for these write-then-read tests, where available
+SHM_DIR = "/dev/shm"
 
 
 @pytest.fixture
-def temp_pages_dir(app):
-    """Create temporary pages directory"""
-    temp_dir = tempfile.mkdtemp()
+def temp_pages_dir(app, tmp_path):
+    """Create temporary pages directory, on tmpfs when available, else tmp_path"""
+    shm_dir = None
+    if os.path.isdir(SHM_DIR) and os.access(SHM_DIR, os.W_OK):
+        shm_dir = tempfile.mkdtemp(prefix=f"wiki_tests_{os.getpid()}_", dir=SHM_DIR)
+    temp_dir = shm_dir or str(tmp_path)
     original_pages_dir = app.config.get("WIKI_PAGES_DIR")
     app.config["WIKI_PAGES_DIR"] = temp_dir
 
     yield temp_dir
 
     app.config["WIKI_PAGES_DIR"] = original_pages_dir
-    import shutil
-
-    shutil.rmtree(temp_dir, ignore_errors=True)
+    if shm_dir:
+        # Not under pytest's tmp_path roots, so remove it here (cheap on tmpfs)
+        shutil.rmtree(shm_dir, ignore_errors=True)
 
 
 @pytest.fixture
@@ -40,15 +50,46 @@ def sync_utility(app, admin_user_id):
         yield SyncUtility(admin_user_id=admin_user_id)
 
 
+@pytest.fixture
+def make_page_and_file(temp_pages_dir, admin_user_id):
+    """
+    Factory creating a page row and its file, with the file newer than the page.
+
+    Call inside an app context as make_page_and_file(db_content, file_content,
+    **page_fields); returns (page, file_path). The file mtime is set 10 seconds
+    in the future instead of sleeping so it is newer than updated_at.
+    """
+
+    def _make(db_content, file_content, **page_fields):
+        fields = {
+            "title": "Test Page",
+            "slug": "test-page",
+            "created_by": admin_user_id,
+            "updated_by": admin_user_id,
+            "file_path": "test-page.md",
+            "updated_at": datetime.now(timezone.utc) - timedelta(hours=1),
+        }
+        fields.update(page_fields)
+        page = Page(content=db_content, **fields)
+        db.session.add(page)
+        db.session.commit()
+
+        file_path = os.path.join(temp_pages_dir, fields["file_path"])
+        seed_file(file_path, file_content, time.time_ns() + 10 * NS_PER_SECOND)
+        return page, file_path
+
+    return _make
+
+
 def test_should_sync_file_identical_content_skips_sync(
-    temp_pages_dir, app, sync_utility, admin_user_id
+    app, sync_utility, make_page_and_file
 ):
     """Test that sync is skipped when file and database content are identical (hash match)"""
     with app.app_context():
         # Enable content comparison (default)
         app.config["SYNC_ENABLE_CONTENT_COMPARISON"] = True
 
-        # Create page in database
+        # Database content
         page_content = """---
 title: "Test Page"
 slug: "test-page"
@@ -58,27 +99,8 @@ section: "test"
 
 Content here.
 """
-        page = Page(
-            title="Test Page",
-            slug="test-page",
-            content=page_content,
-            section="test",
-            created_by=admin_user_id,
-            updated_by=admin_user_id,
-            file_path="test-page.md",
-            updated_at=datetime.now(timezone.utc) - timedelta(hours=1),
-        )
-        db.session.add(page)
-        db.session.commit()
-
-        # Create file with identical content
-        file_path = os.path.join(temp_pages_dir, "test-page.md")
-        with open(file_path, "w", encoding="utf-8") as f:
-            f.write(page_content)
-
-        # Make file newer (to trigger sync check)
-        time.sleep(0.1)
-        os.utime(file_path, None)
+        # Create page and file with identical content (file newer, to trigger sync check)
+        page, _ = make_page_and_file(page_content, page_content, section="test")
 
         # Should skip sync because content is identical
         should_sync = sync_utility.should_sync_file("test-page.md", page)
@@ -86,14 +108,14 @@ Content here.
 
 
 def test_should_sync_file_different_content_syncs(
-    temp_pages_dir, app, sync_utility, admin_user_id
+    app, sync_utility, make_page_and_file
 ):
     """Test that sync proceeds when file and database content differ"""
     with app.app_context():
         # Enable content comparison (default)
         app.config["SYNC_ENABLE_CONTENT_COMPARISON"] = True
 
-        # Create page in database
+        # Database content
         db_content = """---
 title: "Test Page"
 slug: "test-page"
@@ -103,20 +125,7 @@ section: "test"
 
 Original content.
 """
-        page = Page(
-            title="Test Page",
-            slug="test-page",
-            content=db_content,
-            section="test",
-            created_by=admin_user_id,
-            updated_by=admin_user_id,
-            file_path="test-page.md",
-            updated_at=datetime.now(timezone.utc) - timedelta(hours=1),
-        )
-        db.session.add(page)
-        db.session.commit()
-
-        # Create file with different content
+        # File content
         file_content = """---
 title: "Test Page"
 slug: "test-page"
@@ -126,13 +135,8 @@ section: "test"
 
 Updated content.
 """
-        file_path = os.path.join(temp_pages_dir, "test-page.md")
-        with open(file_path, "w", encoding="utf-8") as f:
-            f.write(file_content)
-
-        # Make file newer
-        time.sleep(0.1)
-        os.utime(file_path, None)
+        # Create page and file with different content (file newer, to trigger sync check)
+        page, _ = make_page_and_file(db_content, file_content, section="test")
 
         # Should sync because content differs
         should_sync = sync_utility.should_sync_file("test-page.md", page)
@@ -140,14 +144,14 @@ Updated content.
 
 
 def test_should_sync_file_content_comparison_disabled(
-    temp_pages_dir, app, sync_utility, admin_user_id
+    app, sync_utility, make_page_and_file
 ):
     """Test that content comparison can be disabled via config"""
     with app.app_context():
         # Disable content comparison
         app.config["SYNC_ENABLE_CONTENT_COMPARISON"] = False
 
-        # Create page in database
+        # Database content
         page_content = """---
 title: "Test Page"
 slug: "test-page"
@@ -156,26 +160,8 @@ slug: "test-page"
 
 Content.
 """
-        page = Page(
-            title="Test Page",
-            slug="test-page",
-            content=page_content,
-            created_by=admin_user_id,
-            updated_by=admin_user_id,
-            file_path="test-page.md",
-            updated_at=datetime.now(timezone.utc) - timedelta(hours=1),
-        )
-        db.session.add(page)
-        db.session.commit()
-
-        # Create file with identical content
-        file_path = os.path.join(temp_pages_dir, "test-page.md")
-        with open(file_path, "w", encoding="utf-8") as f:
-            f.write(page_content)
-
-        # Make file newer
-        time.sleep(0.1)
-        os.utime(file_path, None)
+        # Create page and file with identical content (file newer, to trigger sync check)
+        page, _ = make_page_and_file(page_content, page_content)
 
         # Should sync because content comparison is disabled (uses timestamp check only)
         should_sync = sync_utility.should_sync_file("test-page.md", page)
@@ -183,13 +169,13 @@ Content.
 
 
 def test_should_sync_file_content_comparison_different_content_file_newer(
-    temp_pages_dir, app, sync_utility, admin_user_id
+    app, sync_utility, make_page_and_file
 ):
     """Test that content comparison works when content differs and file is newer"""
     with app.app_context():
         app.config["SYNC_ENABLE_CONTENT_COMPARISON"] = True
 
-        # Create page in database
+        # Database content
         db_content = """---
 title: "Test Page"
 slug: "test-page"
@@ -198,19 +184,6 @@ slug: "test-page"
 
 Original content.
 """
-        page = Page(
-            title="Test Page",
-            slug="test-page",
-            content=db_content,
-            created_by=admin_user_id,
-            updated_by=admin_user_id,
-            file_path="test-page.md",
-            updated_at=datetime.now(timezone.utc) - timedelta(hours=1),
-        )
-        db.session.add(page)
-        db.session.commit()
-
-        # Create file with different content and newer timestamp
         file_content = """---
 title: "Test Page"
 slug: "test-page"
@@ -219,19 +192,37 @@ slug: "test-page"
 
 Different content.
 """
-        file_path = os.path.join(temp_pages_dir, "test-page.md")
-        with open(file_path, "w", encoding="utf-8") as f:
-            f.write(file_content)
-
-        # Make file newer
-        time.sleep(0.1)
-        os.utime(file_path, None)
+        # Create page and file with different content (file newer, to trigger sync check)
+        page, _ = make_page_and_file(db_content, file_content)
 
         # Content differs and file is newer, so should sync
         should_sync = sync_utility.should_sync_file("test-page.md", page)
         assert should_sync is True
 
 
+def test_should_sync_file_token_match_skips_reconstruct(
+    app, sync_utility, make_page_and_file
+):
+    """Test a stored content token match skips reconstructing database content"""
+    with app.app_context():
+        app.config["SYNC_ENABLE_CONTENT_COMPARISON"] = True
+
+        # Database content is already in reconstructed form; the file differs
+        # only in YAML quoting, so it is not byte-identical
+        page_content = sync_utility._reconstruct_content(
+            {"title": "Test Page", "slug": "test-page"}, "# Test Page\n"
+        )
+        file_content = "---\ntitle: Test Page\nslug: test-page\n---\n# Test Page\n"
+        page, _ = make_page_and_file(page_content, file_content)
+
+        token = sync_utility._get_file_content_token("test-page.md")
+        assert token == page.content_token
+
+        with patch.object(sync_utility, "_reconstruct_content") as mock_reconstruct:
+            assert sync_utility.should_sync_file("test-page.md", page) is False
+        mock_reconstruct.assert_not_called()
+
+
 def test_compute_content_hash(app, sync_utility):
     """Test content hash computation"""
     with app.app_context():
@@ -250,12 +241,15 @@ def test_compute_content_hash(app, sync_utility):
         assert hash1 != hash3
 
         # Hash should be a hexadecimal string
-        assert len(hash1) == 64  # SHA256 produces 64 hex characters
+        assert len(hash1) == 16  # 64-bit token as 16 hex characters
         assert all(c in "0123456789abcdef" for c in hash1)
 
+        # Bytes hash the same as the equivalent UTF-8 string
+        assert sync_utility._compute_content_hash(content1.encode("utf-8")) == hash1
+
 
-def test_get_file_content_hash(temp_pages_dir, app, sync_utility):
-    """Test getting content hash from file"""
+def test_get_file_content_token(temp_pages_dir, app, sync_utility):
+    """Test getting content token from file"""
     with app.app_context():
         file_content = """---
 title: "Test"
@@ -267,14 +261,214 @@ slug: "test"
         with open(file_path, "w", encoding="utf-8") as f:
             f.write(file_content)
 
-        hash1 = sync_utility._get_file_content_hash("test.md")
-        assert hash1 is not None
-        assert len(hash1) == 64
+        hash1 = sync_utility._get_file_content_token("test.md")
+        assert isinstance(hash1, int)
+        assert -(2**63) <= hash1 < 2**63
 
         # Hash should be consistent
-        hash2 = sync_utility._get_file_content_hash("test.md")
+        hash2 = sync_utility._get_file_content_token("test.md")
         assert hash1 == hash2
 
         # Non-existent file should return None
-        hash3 = sync_utility._get_file_content_hash("nonexistent.md")
+        hash3 = sync_utility._get_file_content_token("nonexistent.md")
         assert hash3 is None
+
+
+def test_get_file_content_token_reuses_cached_token(temp_pages_dir, app, sync_utility):
+    """Test an unchanged file is not re-read, and a changed one is"""
+    with app.app_context():
+        file_path = os.path.join(temp_pages_dir, "test.md")
+        # Old enough for its mtime to be trusted as a cache key
+        seed_file(file_path, "# Content", time.time_ns() - NS_PER_HOUR)
+
+        hash1 = sync_utility._get_file_content_token("test.md")
+
+        with patch("app.sync.sync_utility.parse_frontmatter") as mock_parse:
+            assert sync_utility._get_file_content_token("test.md") == hash1
+        mock_parse.assert_not_called()
+
+        with open(file_path, "w", encoding="utf-8") as f:
+            f.write("# Changed content")
+        os.utime(file_path, ns=(time.time_ns() + 1_000_000_000,) * 2)
+
+        assert sync_utility._get_file_content_token("test.md") != hash1
+
+
+def test_hash_cache_persists_between_runs(temp_pages_dir, app, admin_user_id):
+    """Test saved hashes are reused by a new SyncUtility and can be cleared"""
+    with app.app_context():
+        app.config["SYNC_HASH_CACHE_FILE"] = ".sync-cache.json"
+        seed_file(
+            os.path.join(temp_pages_dir, "test.md"),
+            "# Content",
+            time.time_ns() - NS_PER_HOUR,
+        )
+
+        first = SyncUtility(admin_user_id=admin_user_id)
+        hash1 = first._get_file_content_token("test.md")
+        first.save_hash_cache()
+        cache_path = os.path.join(temp_pages_dir, ".sync-cache.json")
+        assert os.path.exists(cache_path)
+
+        second = SyncUtility(admin_user_id=admin_user_id)
+        with patch("app.sync.sync_utility.parse_frontmatter") as mock_parse:
+            assert second._get_file_content_token("test.md") == hash1
+        mock_parse.assert_not_called()
+
+        second.clear_hash_cache()
+        assert second._hash_cache == {}
+        assert not os.path.exists(cache_path)
+
+
+def test_get_file_content_token_does_not_cache_racy_mtime(
+    temp_pages_dir, app, sync_utility
+):
+    """Test a file read within its mtime granularity is hashed again next time"""
+    with app.app_context():
+        file_path = os.path.join(temp_pages_dir, "test.md")
+        seed_file(file_path, "# Content")
+        mtime_ns = os.stat(file_path).st_mtime_ns
+
+        hash1 = sync_utility._get_file_content_token("test.md")
+        assert sync_utility._hash_cache == {}
+
+        # Same-size rewrite in the same timestamp tick: the mtime doesn't change
+        seed_file(file_path, "# Changed", mtime_ns)
+        assert sync_utility._get_file_content_token("test.md") != hash1
+
+
+def test_should_sync_file_byte_identical_skips_hashing(
+    temp_pages_dir, app, sync_utility, admin_user_id
+):
+    """Test a byte-identical file is skipped without hashing"""
+    with app.app_context():
+        app.config["SYNC_ENABLE_CONTENT_COMPARISON"] = True
+
+        page = Page(
+            title="Test Page",
+            slug="test-page",
+            content="# Test Page\n\nContent here.\n",
+            created_by=admin_user_id,
+            updated_by=admin_user_id,
+            file_path="test-page.md",
+            updated_at=datetime.now(timezone.utc) - timedelta(hours=1),
+        )
+        db.session.add(page)
+        db.session.commit()
+
+        with open(os.path.join(temp_pages_dir, "test-page.md"), "wb") as f:
+            f.write(page.content.encode("utf-8"))
+
+        with patch.object(sync_utility, "_get_file_content_token") as mock_hash:
+            assert sync_utility.should_sync_file("test-page.md", page) is False
+        mock_hash.assert_not_called()
+
+
+def test_should_sync_file_reformatted_frontmatter_still_skips(
+    temp_pages_dir, app, sync_utility, admin_user_id
+):
+    """Test a size mismatch from YAML formatting alone still compares equal by hash"""
+    with app.app_context():
+        app.config["SYNC_ENABLE_CONTENT_COMPARISON"] = True
+
+        page = Page(
+            title="Test Page",
+            slug="test-page",
+            content='---\ntitle: "Test Page"\n---\n# Test Page\n',
+            created_by=admin_user_id,
+            updated_by=admin_user_id,
+            file_path="test-page.md",
+            updated_at=datetime.now(timezone.utc) - timedelta(hours=1),
+        )
+        db.session.add(page)
+        db.session.commit()
+
+        with open(
+            os.path.join(temp_pages_dir, "test-page.md"), "w", encoding="utf-8"
+        ) as f:
+            f.write("---\ntitle: Test Page\n---\n# Test Page\n")
+
+        assert sync_utility.should_sync_file("test-page.md", page) is False
+
+
+def test_file_matches_content_compares_in_chunks(temp_pages_dir, app, sync_utility):
+    """Test the streaming comparison across chunk boundaries"""
+    with app.app_context():
+        content = "# Tést\n\n" + "line of content\n" * 20
+        with open(os.path.join(temp_pages_dir, "test.md"), "wb") as f:
+            f.write(content.encode("utf-8"))
+
+        with patch("app.services.file_service.READ_CHUNK_SIZE", 7):
+            assert sync_utility._file_matches_content("test.md", content) is True
+            assert (
+                sync_utility._file_matches_content("test.md", content[:-2] + "X\n")
+                is False
+            )
+            assert sync_utility._file_matches_content("missing.md", content) is False
+
+
+def _thread_pool(max_workers, mp_context):
+    """Stand-in for ProcessPoolExecutor that checks the workers aren't forked"""
+    assert mp_context.get_start_method() != "fork"
+    return ThreadPoolExecutor(max_workers=max_workers)
+
+
+def test_prefetch_file_tokens_fills_hash_cache(temp_pages_dir, app, sync_utility):
+    """Test changed files are hashed through the executor before syncing"""
+    with app.app_context():
+        app.config["SYNC_PARALLEL_WORKERS"] = 2
+        files = [f"page{i}.md" for i in range(3)]
+        for i, file_path in enumerate(files):
+            seed_file(
+                os.path.join(temp_pages_dir, file_path),
+                f"# Page {i}\n",
+                time.time_ns() - NS_PER_HOUR,
+            )
+
+        with patch("app.sync.sync_utility.PARALLEL_HASH_MIN_FILES", 1), patch(
+            "app.sync.sync_utility.ProcessPoolExecutor", _thread_pool
+        ):
+            sync_utility._prefetch_file_tokens(files + ["missing.md"])
+
+        assert sorted(sync_utility._hash_cache) == files
+        with patch("app.sync.sync_utility.parse_frontmatter") as mock_parse:
+            tokens = [sync_utility._get_file_content_token(f) for f in files]
+        mock_parse.assert_not_called()
+        assert len(set(tokens)) == 3
+
+
+def test_prefetch_file_tokens_skips_files_unchanged_since_sync(
+    temp_pages_dir, app, sync_utility, admin_user_id
+):
+    """Test files whose mtime matches the page's last sync are not read ahead"""
+    with app.app_context():
+        app.config["SYNC_PARALLEL_WORKERS"] = 2
+        files = ["synced.md", "changed.md"]
+        for file_path in files:
+            seed_file(
+                os.path.join(temp_pages_dir, file_path),
+                "# Page\n",
+                time.time_ns() - NS_PER_HOUR,
+            )
+
+        db.session.add(
+            Page(
+                title="Synced",
+                slug="synced",
+                content="# Page\n",
+                created_by=admin_user_id,
+                updated_by=admin_user_id,
+                file_path="synced.md",
+                file_mtime_ns=os.stat(
+                    os.path.join(temp_pages_dir, "synced.md")
+                ).st_mtime_ns,
+            )
+        )
+        db.session.commit()
+
+        with patch("app.sync.sync_utility.PARALLEL_HASH_MIN_FILES", 1), patch(
+            "app.sync.sync_utility.ProcessPoolExecutor", _thread_pool
+        ):
+            sync_utility._prefetch_file_tokens(files)
+
+        assert list(sync_utility._hash_cache) == ["changed.md"]
@@ -1,25 +1,22 @@
 """Tests for file scanner"""
 
 import os
-import tempfile
+from unittest.mock import patch
 
 import pytest
-from app.sync.file_scanner import FileScanner
+from app.sync.file_scanner import FileScanner, _resolve
 
 
 @pytest.fixture
-def temp_pages_dir(app):
-    """Create temporary pages directory"""
-    temp_dir = tempfile.mkdtemp()
+def temp_pages_dir(app, tmp_path):
+    """Create temporary pages directory (removed with pytest's old tmp_path roots)"""
+    temp_dir = str(tmp_path)
     original_pages_dir = app.config.get("WIKI_PAGES_DIR")
     app.config["WIKI_PAGES_DIR"] = temp_dir
 
     yield temp_dir
 
     app.config["WIKI_PAGES_DIR"] = original_pages_dir
-    import shutil
-
-    shutil.rmtree(temp_dir, ignore_errors=True)
 
 
 def test_scan_directory_empty(temp_pages_dir, app):
@@ -58,6 +55,58 @@ def test_scan_directory_finds_markdown_files(temp_pages_dir, app):
         assert "readme.txt" not in files
 
 
+def test_scan_directory_sorted_with_md_named_directory(temp_pages_dir, app):
+    """Test results are sorted and directories named *.md are descended into"""
+    with app.app_context():
+        os.makedirs(os.path.join(temp_pages_dir, "notes.md", "inner"), exist_ok=True)
+
+        with open(os.path.join(temp_pages_dir, "notes.md", "inner", "b.md"), "w") as f:
+            f.write("# B")
+
+        with open(os.path.join(temp_pages_dir, "a.md"), "w") as f:
+            f.write("# A")
+
+        files = FileScanner.scan_directory()
+
+        assert files == ["a.md", "notes.md/inner/b.md"]
+
+
+def test_scan_directory_parallel_matches_serial(temp_pages_dir, app):
+    """Test the thread-pool scan of wide trees finds the same files"""
+    with app.app_context():
+        for i in range(5):
+            os.makedirs(os.path.join(temp_pages_dir, f"s{i}", "sub"), exist_ok=True)
+            with open(os.path.join(temp_pages_dir, f"s{i}", "sub", "p.md"), "w") as f:
+                f.write("# Page")
+
+        with patch.dict(app.config, {"SYNC_SCAN_WORKERS": 1}):
+            serial = FileScanner.scan_directory()
+        with patch.dict(app.config, {"SYNC_SCAN_WORKERS": 4}), patch(
+            "app.sync.file_scanner.SCAN_PARALLEL_MIN_DIRS", 2
+        ):
+            parallel = FileScanner.scan_directory()
+
+        assert len(serial) == 5
+        assert parallel == serial
+
+
+def test_scan_directory_stats(temp_pages_dir, app):
+    """Test scanning returns each file's stat result in sorted path order"""
+    with app.app_context():
+        os.makedirs(os.path.join(temp_pages_dir, "section"), exist_ok=True)
+        for rel_path in ("b.md", "section/a.md"):
+            with open(os.path.join(temp_pages_dir, rel_path), "w") as f:
+                f.write("# Page")
+
+        file_stats = FileScanner.scan_directory_stats()
+
+        assert list(file_stats) == FileScanner.scan_directory()
+        for rel_path, st in file_stats.items():
+            full_path = os.path.join(temp_pages_dir, rel_path)
+            assert st.st_mtime_ns == os.stat(full_path).st_mtime_ns
+            assert st.st_size == 6
+
+
 def test_scan_directory_nested_structure(temp_pages_dir, app):
     """Test scanning nested directory structure"""
     with app.app_context():
@@ -104,11 +153,13 @@ def test_scan_file_absolute_path(temp_pages_dir, app):
         assert result == "test.md"
 
 
-def test_scan_file_absolute_path_outside_directory(temp_pages_dir, app):
+def test_scan_file_absolute_path_outside_directory(
+    temp_pages_dir, app, tmp_path_factory
+):
     """Test scanning absolute path outside pages directory"""
     with app.app_context():
         # Create file outside pages directory
-        outside_dir = tempfile.mkdtemp()
+        outside_dir = tmp_path_factory.mktemp("outside")
         file_path = os.path.join(outside_dir, "test.md")
         with open(file_path, "w") as f:
             f.write("# Test")
@@ -116,9 +167,36 @@ def test_scan_file_absolute_path_outside_directory(temp_pages_dir, app):
         result = FileScanner.scan_file(file_path)
         assert result is None
 
-        import shutil
 
-        shutil.rmtree(outside_dir, ignore_errors=True)
+def test_stat_file(temp_pages_dir, app):
+    """Test stat_file returns one stat result, or None for a missing file"""
+    with app.app_context():
+        file_path = os.path.join(temp_pages_dir, "test.md")
+        with open(file_path, "w") as f:
+            f.write("# Test")
+
+        st = FileScanner.stat_file("test.md")
+        assert st.st_size == 6
+        assert st.st_mtime_ns == os.stat(file_path).st_mtime_ns
+        assert FileScanner.stat_file("nonexistent.md") is None
+        assert FileScanner.stat_file("test.md/child.md") is None
+        assert FileScanner.stat_path(file_path).st_size == 6
+
+
+def test_scan_file_reuses_resolved_path(temp_pages_dir, app):
+    """Test path normalization is memoized but existence is checked every call"""
+    with app.app_context():
+        file_path = os.path.join(temp_pages_dir, "test.md")
+        with open(file_path, "w") as f:
+            f.write("# Test")
+
+        _resolve.cache_clear()
+        assert FileScanner.scan_file(file_path) == "test.md"
+        assert FileScanner.scan_file(file_path) == "test.md"
+        assert _resolve.cache_info().hits == 1
+
+        os.remove(file_path)
+        assert FileScanner.scan_file(file_path) is None
 
 
 def test_get_file_modification_time(temp_pages_dir, app):
@@ -139,3 +217,16 @@ def test_get_file_modification_time_not_exists(temp_pages_dir, app):
     with app.app_context():
         mtime = FileScanner.get_file_modification_time("nonexistent.md")
         assert mtime is None
+
+
+def test_get_file_modification_time_ns(temp_pages_dir, app):
+    """Test getting exact file modification time in nanoseconds"""
+    with app.app_context():
+        file_path = os.path.join(temp_pages_dir, "test.md")
+        with open(file_path, "w") as f:
+            f.write("# Test")
+        os.utime(file_path, ns=(1_700_000_000_123_456_789, 1_700_000_000_123_456_789))
+
+        mtime_ns = FileScanner.get_file_modification_time_ns("test.md")
+        assert mtime_ns == 1_700_000_000_123_456_789
+        assert FileScanner.get_file_modification_time_ns("nonexistent.md") is None
@@ -2,7 +2,7 @@
 
 import os
 import tempfile
-from unittest.mock import MagicMock, patch
+from unittest.mock import ANY, MagicMock, patch
 
 from app.sync.file_watcher import FileWatcher, MarkdownFileHandler
 from app.sync.sync_utility import SyncUtility
@@ -125,8 +125,9 @@ def test_markdown_file_handler_sync_file():
         # Sync the file
         handler._sync_file("test.md")
 
-        # Verify sync was called
-        mock_sync.sync_file.assert_called_once_with("test.md", force=False)
+        # Verify sync was called with the existence check's stat result
+        mock_sync.sync_file.assert_called_once_with("test.md", force=False, st=ANY)
+        assert mock_sync.sync_file.call_args.kwargs["st"].st_size == 6
 
 
 def test_markdown_file_handler_on_created():
@@ -0,0 +1,305 @@
+"""Tests for the watcher-invalidated sync status cache"""
+
+import os
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import pytest
+from app import db
+from app.models.page import Page
+from app.services.page_service import PageService
+from app.sync.sync_status_cache import (
+    FileHashCache,
+    SyncStatusCache,
+    _InvalidationHandler,
+)
+from tests._helpers import NS_PER_HOUR, seed_file
+from watchdog.events import FileDeletedEvent, FileModifiedEvent, FileMovedEvent
+
+
+@pytest.fixture
+def cache():
+    """Started cache watching a temporary pages directory"""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        cache = SyncStatusCache()
+        cache.start(tmpdir)
+        yield cache
+        cache.stop()
+
+
+def _wait_for_invalidation(cache, timeout=2.0, settle=0.2):
+    """Wait until the observer has delivered events and gone quiet"""
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if cache.drain():
+            # A single write can produce several events (create, modify, close)
+            time.sleep(settle)
+            cache.drain()
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def test_inactive_cache_always_misses():
+    """Test cache does not store entries until the observer is started"""
+    cache = SyncStatusCache()
+
+    cache.set("test.md", 1, {"file_mtime_ns": 1}, cache.epoch)
+
+    assert cache.active is False
+    assert cache.get("test.md", 1) is None
+
+
+def test_get_returns_cached_state(cache):
+    """Test cached state is returned for a matching version key"""
+    cache.set("test.md", 1, {"file_mtime_ns": 1}, cache.epoch)
+
+    assert cache.get("test.md", 1) == {"file_mtime_ns": 1}
+
+
+def test_get_misses_on_version_key_change(cache):
+    """Test a database change (new version key) misses the cache"""
+    cache.set("test.md", 1, {"file_mtime_ns": 1}, cache.epoch)
+
+    assert cache.get("test.md", 2) is None
+
+
+def test_invalidate_single_path(cache):
+    """Test invalidating one path leaves other entries cached"""
+    cache.set("a.md", 1, {"file_mtime_ns": 1}, cache.epoch)
+    cache.set("b.md", 1, {"file_mtime_ns": 2}, cache.epoch)
+
+    cache.invalidate("a.md")
+
+    assert cache.get("a.md", 1) is None
+    assert cache.get("b.md", 1) == {"file_mtime_ns": 2}
+
+
+def test_invalidate_all(cache):
+    """Test invalidate() with no path drops every entry"""
+    cache.set("a.md", 1, {"file_mtime_ns": 1}, cache.epoch)
+    cache.set("b.md", 1, {"file_mtime_ns": 2}, cache.epoch)
+
+    cache.invalidate()
+
+    assert cache.get("a.md", 1) is None
+    assert cache.get("b.md", 1) is None
+
+
+def test_set_discards_state_computed_before_invalidation(cache):
+    """Test state computed across a file event is not stored"""
+    epoch = cache.epoch
+    cache.invalidate("test.md")
+
+    cache.set("test.md", 1, {"file_mtime_ns": 1}, epoch)
+
+    assert cache.get("test.md", 1) is None
+
+
+def test_drain_returns_applied_count(cache):
+    """Test drain applies queued invalidations and reports how many"""
+    cache.invalidate("a.md")
+    cache.invalidate("b.md")
+
+    assert cache.drain() == 2
+    assert cache.drain() == 0
+
+
+def test_handler_invalidates_markdown_events():
+    """Test handler maps file events to relative page paths"""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        pages_abs = os.path.abspath(tmpdir)
+        cache = SyncStatusCache()
+        handler = _InvalidationHandler(cache, pages_abs)
+
+        handler.on_any_event(
+            FileModifiedEvent(os.path.join(pages_abs, "section", "page.md"))
+        )
+        handler.on_any_event(FileDeletedEvent(os.path.join(pages_abs, "notes.txt")))
+        handler.on_any_event(
+            FileMovedEvent(
+                os.path.join(pages_abs, "old.md"), os.path.join(pages_abs, "new.md")
+            )
+        )
+
+        invalidated = []
+        while not cache._pending.empty():
+            invalidated.append(cache._pending.get_nowait())
+
+        assert invalidated == ["section/page.md", "old.md", "new.md"]
+
+
+def test_file_write_invalidates_entry(cache):
+    """Test writing a watched file invalidates its cached entry"""
+    file_path = os.path.join(cache.pages_abs, "test.md")
+    with open(file_path, "w", encoding="utf-8") as f:
+        f.write("# Test")
+    _wait_for_invalidation(cache)
+
+    cache.set("test.md", 1, {"file_mtime_ns": 1}, cache.epoch)
+    with open(file_path, "w", encoding="utf-8") as f:
+        f.write("# Updated")
+
+    assert _wait_for_invalidation(cache)
+    assert cache.get("test.md", 1) is None
+
+
+def test_check_sync_conflict_uses_cache(app, cache):
+    """Test check_sync_conflict reuses cached state until the file changes"""
+    with app.app_context():
+        app.config["WIKI_PAGES_DIR"] = cache.pages_abs
+        user_id = uuid.uuid4()
+        page = Page(
+            title="Test",
+            slug="test",
+            content="# Test",
+            created_by=user_id,
+            updated_by=user_id,
+            file_path="test.md",
+            updated_at=datetime.now(timezone.utc) - timedelta(hours=1),
+        )
+        db.session.add(page)
+        db.session.commit()
+
+        with patch("app.services.page_service.sync_status_cache", cache):
+            # No file yet - "missing" is cached too
+            assert PageService.check_sync_conflict(page) is None
+
+            file_path = os.path.join(cache.pages_abs, "test.md")
+            with open(file_path, "w", encoding="utf-8") as f:
+                f.write("# Test")
+            assert _wait_for_invalidation(cache)
+
+            conflict = PageService.check_sync_conflict(page)
+            assert conflict is not None
+            assert conflict["file_newer"] is True
+            assert cache.get("test.md", (page.id, page.updated_at, page.version))
+
+
+def test_file_hash_cache_keyed_by_mtime_and_size():
+    """Test a file hash is only reused for the same modification time and size"""
+    cache = FileHashCache()
+    cache.set("/pages/test.md", 1, 10, "abc")
+
+    assert cache.get("/pages/test.md", 1, 10) == "abc"
+    assert cache.get("/pages/test.md", 2, 10) is None
+    assert cache.get("/pages/test.md", 1, 11) is None
+
+
+def test_file_hash_cache_evicts_least_recently_used():
+    """Test the file hash cache is bounded and evicts the oldest unused entry"""
+    cache = FileHashCache(max_entries=2)
+    cache.set("a.md", 1, 1, "a")
+    cache.set("b.md", 1, 1, "b")
+    cache.get("a.md", 1, 1)
+
+    cache.set("c.md", 1, 1, "c")
+
+    assert cache.get("a.md", 1, 1) == "a"
+    assert cache.get("b.md", 1, 1) is None
+    assert cache.get("c.md", 1, 1) == "c"
+
+
+def test_check_sync_conflict_reuses_file_hash(app):
+    """Test an unchanged file is not re-read for content comparison"""
+    with app.app_context(), tempfile.TemporaryDirectory() as tmpdir:
+        app.config["WIKI_PAGES_DIR"] = tmpdir
+        user_id = uuid.uuid4()
+        page = Page(
+            title="Test",
+            slug="test",
+            content="# Test",
+            created_by=user_id,
+            updated_by=user_id,
+            file_path="test.md",
+        )
+        db.session.add(page)
+        db.session.commit()
+
+        seed_file(
+            os.path.join(tmpdir, "test.md"),
+            "# Different",
+            time.time_ns() - NS_PER_HOUR,
+        )
+
+        hash_cache = FileHashCache()
+        with patch("app.services.page_service.file_hash_cache", hash_cache):
+            first = PageService.check_sync_conflict(page)
+            with patch("app.services.page_service.parse_frontmatter") as mock_parse:
+                second = PageService.check_sync_conflict(page)
+
+        assert first["content_different"] is True
+        assert second["content_different"] is True
+        mock_parse.assert_not_called()
+
+
+def test_check_sync_conflict_reuses_hash_on_page_instance(app):
+    """Test repeat checks on one Page instance reuse its cached file hash"""
+    with app.app_context(), tempfile.TemporaryDirectory() as tmpdir:
+        app.config["WIKI_PAGES_DIR"] = tmpdir
+        user_id = uuid.uuid4()
+        page = Page(
+            title="Test",
+            slug="test",
+            content="# Test",
+            created_by=user_id,
+            updated_by=user_id,
+            file_path="test.md",
+        )
+        db.session.add(page)
+        db.session.commit()
+
+        seed_file(
+            os.path.join(tmpdir, "test.md"),
+            "# Different",
+            time.time_ns() - NS_PER_HOUR,
+        )
+
+        PageService.check_sync_conflict(page)
+
+        # An empty process-wide cache must not force a re-read
+        with patch("app.services.page_service.file_hash_cache", FileHashCache()), patch(
+            "app.services.page_service.parse_frontmatter"
+        ) as mock_parse:
+            conflict = PageService.check_sync_conflict(page)
+
+        assert conflict["content_different"] is True
+        mock_parse.assert_not_called()
+
+
+def test_check_sync_conflict_does_not_cache_racy_mtime(app):
+    """Test a same-tick rewrite of a just-written file is still compared"""
+    with app.app_context(), tempfile.TemporaryDirectory() as tmpdir:
+        app.config["WIKI_PAGES_DIR"] = tmpdir
+        user_id = uuid.uuid4()
+        page = Page(
+            title="Test",
+            slug="test",
+            content="# Test",
+            created_by=user_id,
+            updated_by=user_id,
+            file_path="test.md",
+            updated_at=datetime.now(timezone.utc) - timedelta(hours=1),
+        )
+        db.session.add(page)
+        db.session.commit()
+
+        # Written just now, so its mtime can't vouch for its content
+        file_path = os.path.join(tmpdir, "test.md")
+        seed_file(file_path, "# Other")
+        mtime_ns = os.stat(file_path).st_mtime_ns
+
+        hash_cache = FileHashCache()
+        with patch("app.services.page_service.file_hash_cache", hash_cache):
+            assert PageService.check_sync_conflict(page)["content_different"]
+
+            # Same-size rewrite in the same timestamp tick of a coarse-mtime
+            # file system: the mtime doesn't change, but the match is found
+            seed_file(file_path, "# Test", mtime_ns)
+            conflict = PageService.check_sync_conflict(page)
+
+        assert conflict["content_different"] is False
+        assert hash_cache.get(file_path, mtime_ns, len("# Test")) is None
@@ -5,11 +5,13 @@ import tempfile
 import time
 import uuid
 from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
 
 import pytest
 from app import db
 from app.models.page import Page
 from app.sync.sync_utility import SyncUtility
+from tests._helpers import NS_PER_HOUR, seed_file
 
 
 @pytest.fixture
@@ -74,6 +76,62 @@ def test_resolve_parent_slug_none(app, sync_utility):
         assert parent_id is None
 
 
+def test_sync_all_resolves_parent_slugs_from_one_query(
+    temp_pages_dir, app, sync_utility, admin_user_id
+):
+    """Test sync_all resolves parent slugs from one slug map query"""
+    with app.app_context():
+        parent = Page(
+            title="Parent Page",
+            slug="parent-page",
+            content="# Parent",
+            created_by=admin_user_id,
+            updated_by=admin_user_id,
+            file_path="parent-page.md",
+        )
+        db.session.add(parent)
+        db.session.commit()
+
+        for name in ("a", "b"):
+            with open(
+                os.path.join(temp_pages_dir, f"{name}.md"), "w", encoding="utf-8"
+            ) as f:
+                f.write(
+                    f'---\ntitle: "Child {name}"\nslug: "child-{name}"\n'
+                    f'parent_slug: "parent-page"\n---\n\n# Child'
+                )
+
+        with patch.object(db.session, "query", wraps=db.session.query) as mock_query:
+            stats = sync_utility.sync_all()
+
+        assert stats["created"] == 2
+        assert mock_query.call_args_list.count(((Page.slug, Page.id),)) == 1
+        assert mock_query.call_args_list.count(((Page.id,),)) == 0
+        assert sync_utility._slug_ids is None
+
+        children = db.session.query(Page).filter(Page.slug.like("child-%")).all()
+        assert [c.parent_id for c in children] == [parent.id, parent.id]
+
+
+def test_sync_files_new_slugs_skip_page_lookup(
+    temp_pages_dir, app, sync_utility, admin_user_id
+):
+    """Test new files are created without a per-file page lookup by slug"""
+    with app.app_context():
+        for name in ("a", "b"):
+            with open(
+                os.path.join(temp_pages_dir, f"{name}.md"), "w", encoding="utf-8"
+            ) as f:
+                f.write(f'---\ntitle: "Page {name}"\nslug: "page-{name}"\n---\n\n# A')
+
+        stats = {"created": 0, "updated": 0, "skipped": 0, "errors": 0}
+        with patch.object(db.session, "query", wraps=db.session.query) as mock_query:
+            sync_utility._sync_files(["a.md", "b.md"], False, stats)
+
+        assert stats["created"] == 2
+        assert mock_query.call_args_list.count(((Page,),)) == 0
+
+
 def test_read_file(temp_pages_dir, app, sync_utility):
     """Test reading and parsing markdown file"""
     with app.app_context():
@@ -188,6 +246,36 @@ def test_should_sync_file_older_than_db(
         assert should_sync is False
 
 
+def test_should_sync_file_timestamps_ignore_local_timezone(
+    temp_pages_dir, app, sync_utility, admin_user_id
+):
+    """Test the newer-than-database check reads updated_at as UTC in any server TZ"""
+    with app.app_context():
+        page = Page(
+            title="Test",
+            slug="test",
+            content="# Test",
+            created_by=admin_user_id,
+            updated_by=admin_user_id,
+            file_path="test.md",
+            updated_at=datetime.now(timezone.utc) - timedelta(hours=1),
+        )
+        db.session.add(page)
+        db.session.commit()
+
+        with open(os.path.join(temp_pages_dir, "test.md"), "w") as f:
+            f.write("# Updated Test")
+
+        # Five hours behind UTC: a local-time reading would put updated_at in the future
+        try:
+            with patch.dict(os.environ, {"TZ": "Etc/GMT+5"}):
+                time.tzset()
+                should_sync = sync_utility.should_sync_file("test.md", page)
+        finally:
+            time.tzset()
+        assert should_sync is True
+
+
 def test_sync_file_create_new(temp_pages_dir, app, sync_utility, admin_user_id):
     """Test syncing new file creates page"""
     with app.app_context():
@@ -365,6 +453,31 @@ slug: "test"
         assert synced_page.title == "Forced Update"
 
 
+def test_sync_file_force_unchanged_skips_update(
+    temp_pages_dir, app, sync_utility, admin_user_id
+):
+    """Test a forced sync that would change nothing skips the update and version"""
+    with app.app_context():
+        file_path = os.path.join(temp_pages_dir, "test.md")
+        with open(file_path, "w", encoding="utf-8") as f:
+            f.write('---\ntitle: "Same"\nslug: "test"\n---\n\n# Same')
+
+        page, status = sync_utility.sync_file("test.md")
+        assert status is True
+        updated_at = page.updated_at
+
+        with patch(
+            "app.sync.sync_utility.VersionService.create_version"
+        ) as mock_version:
+            synced_page, status = sync_utility.sync_file("test.md", force=True)
+
+        assert status is None
+        assert synced_page.id == page.id
+        mock_version.assert_not_called()
+        db.session.expire_all()
+        assert db.session.get(Page, page.id).updated_at == updated_at
+
+
 def test_sync_file_auto_generate_slug(temp_pages_dir, app, sync_utility, admin_user_id):
     """Test syncing file without slug generates one from title"""
     with app.app_context():
@@ -458,3 +571,252 @@ def test_sync_directory(temp_pages_dir, app, sync_utility, admin_user_id):
         pages = db.session.query(Page).all()
         assert len(pages) == 1
         assert pages[0].slug == "page-1"
+
+
+def test_cleanup_orphaned_pages_deletes_only_missing_files(
+    temp_pages_dir, app, sync_utility, admin_user_id
+):
+    """Test orphan cleanup streams file paths and deletes pages whose file is gone"""
+    with app.app_context():
+        for slug in ("kept", "orphan"):
+            db.session.add(
+                Page(
+                    title=slug,
+                    slug=slug,
+                    content="# Page",
+                    created_by=admin_user_id,
+                    updated_by=admin_user_id,
+                    file_path=f"{slug}.md",
+                )
+            )
+        db.session.commit()
+
+        with open(os.path.join(temp_pages_dir, "kept.md"), "w") as f:
+            f.write("# Page")
+
+        with patch("app.sync.sync_utility.PRELOAD_CHUNK_SIZE", 1):
+            deleted = sync_utility._cleanup_orphaned_pages({"kept.md"})
+
+        assert deleted == 1
+        assert [p.slug for p in db.session.query(Page).all()] == ["kept"]
+
+
+def test_sync_all_replays_batched_updates_after_error(
+    temp_pages_dir, app, sync_utility, admin_user_id
+):
+    """Test a failing file does not lose the uncommitted updates batched before it"""
+    with app.app_context():
+        app.config["SYNC_COMMIT_BATCH_SIZE"] = 10
+        for name in ("a", "b", "c"):
+            db.session.add(
+                Page(
+                    title=f"Old {name}",
+                    slug=f"page-{name}",
+                    content="# Old",
+                    created_by=admin_user_id,
+                    updated_by=admin_user_id,
+                    file_path=f"{name}.md",
+                )
+            )
+            with open(
+                os.path.join(temp_pages_dir, f"{name}.md"), "w", encoding="utf-8"
+            ) as f:
+                f.write(f'---\ntitle: "New {name}"\nslug: "page-{name}"\n---\n\n# New')
+        db.session.commit()
+
+        original_sync_file = SyncUtility.sync_file
+
+        def failing_sync_file(self, file_path, **kwargs):
+            if file_path == "c.md":
+                raise ValueError("boom")
+            return original_sync_file(self, file_path, **kwargs)
+
+        with patch.object(SyncUtility, "sync_file", failing_sync_file):
+            stats = sync_utility.sync_all(force=True)
+
+        assert stats["updated"] == 2
+        assert stats["errors"] == 1
+
+        db.session.expire_all()
+        titles = {p.slug: p.title for p in db.session.query(Page).all()}
+        assert titles == {"page-a": "New a", "page-b": "New b", "page-c": "Old c"}
+
+
+def test_sync_all_replay_failure_rolls_back_only_that_file(
+    temp_pages_dir, app, sync_utility, admin_user_id
+):
+    """Test a file failing again during replay doesn't undo the other replayed files"""
+    with app.app_context():
+        app.config["SYNC_COMMIT_BATCH_SIZE"] = 10
+        for name in ("a", "b", "c"):
+            db.session.add(
+                Page(
+                    title=f"Old {name}",
+                    slug=f"page-{name}",
+                    content="# Old",
+                    created_by=admin_user_id,
+                    updated_by=admin_user_id,
+                    file_path=f"{name}.md",
+                )
+            )
+            with open(
+                os.path.join(temp_pages_dir, f"{name}.md"), "w", encoding="utf-8"
+            ) as f:
+                f.write(f'---\ntitle: "New {name}"\nslug: "page-{name}"\n---\n\n# New')
+        db.session.commit()
+
+        original_sync_file = SyncUtility.sync_file
+        calls = []
+
+        def failing_sync_file(self, file_path, **kwargs):
+            calls.append(file_path)
+            if file_path == "c.md":
+                raise ValueError("boom")
+            result = original_sync_file(self, file_path, **kwargs)
+            if file_path == "b.md" and calls.count("b.md") == 2:
+                # Fails after its update was flushed
+                raise ValueError("boom again")
+            return result
+
+        with patch.object(SyncUtility, "sync_file", failing_sync_file):
+            stats = sync_utility.sync_all(force=True)
+
+        assert stats["updated"] == 1
+        assert stats["errors"] == 2
+
+        db.session.expire_all()
+        titles = {p.slug: p.title for p in db.session.query(Page).all()}
+        assert titles == {"page-a": "New a", "page-b": "Old b", "page-c": "Old c"}
+
+
+def test_should_sync_file_unchanged_mtime_skips_read(
+    temp_pages_dir, app, sync_utility, admin_user_id
+):
+    """Test a file whose mtime matches the last sync is skipped without reading"""
+    with app.app_context():
+        file_path = os.path.join(temp_pages_dir, "test-page.md")
+        seed_file(
+            file_path,
+            '---\ntitle: "Test Page"\nslug: "test-page"\n---\n\n# Content',
+            time.time_ns() - NS_PER_HOUR,
+        )
+
+        page, status = sync_utility.sync_file("test-page.md")
+        assert status is True
+        assert page.file_mtime_ns == os.stat(file_path).st_mtime_ns
+
+        with patch.object(sync_utility, "_file_matches_content") as mock_compare:
+            assert sync_utility.should_sync_file("test-page.md", page) is False
+        mock_compare.assert_not_called()
+
+        # Any mtime change falls through to the content comparison
+        os.utime(file_path, ns=(page.file_mtime_ns + 1, page.file_mtime_ns + 1))
+        with patch.object(
+            sync_utility, "_file_matches_content", return_value=True
+        ) as mock_compare:
+            assert sync_utility.should_sync_file("test-page.md", page) is False
+        mock_compare.assert_called_once()
+
+
+def test_sync_all_skips_unchanged_files_without_sync_file(
+    temp_pages_dir, app, sync_utility, admin_user_id
+):
+    """Test sync_all skips files unchanged since their last sync before sync_file"""
+    with app.app_context():
+        for name in ("a", "b"):
+            seed_file(
+                os.path.join(temp_pages_dir, f"{name}.md"),
+                f'---\ntitle: "Page {name}"\nslug: "page-{name}"\n---\n\n# A',
+                time.time_ns() - NS_PER_HOUR,
+            )
+        assert sync_utility.sync_all()["created"] == 2
+
+        b_path = os.path.join(temp_pages_dir, "b.md")
+        mtime_ns = os.stat(b_path).st_mtime_ns + 1
+        os.utime(b_path, ns=(mtime_ns, mtime_ns))
+
+        with patch.object(
+            SyncUtility, "sync_file", autospec=True, return_value=(None, None)
+        ) as mock_sync_file:
+            stats = sync_utility.sync_all()
+
+        assert [c.args[1] for c in mock_sync_file.call_args_list] == ["b.md"]
+        assert stats["skipped"] == 2
+
+
+def test_should_sync_file_records_mtime_of_touched_identical_file(
+    temp_pages_dir, app, sync_utility, admin_user_id
+):
+    """Test a touched but identical file is skipped and takes the fast path next time"""
+    with app.app_context():
+        file_path = os.path.join(temp_pages_dir, "test-page.md")
+        seed_file(
+            file_path,
+            '---\ntitle: "Test Page"\nslug: "test-page"\n---\n\n# Content',
+            time.time_ns() - NS_PER_HOUR,
+        )
+
+        page, _ = sync_utility.sync_file("test-page.md")
+        updated_at = page.updated_at
+        mtime_ns = page.file_mtime_ns + 1
+        os.utime(file_path, ns=(mtime_ns, mtime_ns))
+
+        _, status = sync_utility.sync_file("test-page.md")
+        assert status is None
+
+        db.session.expire_all()
+        page = db.session.get(Page, page.id)
+        assert page.file_mtime_ns == mtime_ns
+        assert page.updated_at == updated_at
+
+
+def test_should_sync_file_does_not_trust_racy_mtime(
+    temp_pages_dir, app, sync_utility, admin_user_id
+):
+    """Test an mtime too recent to be trusted is not recorded for the fast path"""
+    with app.app_context():
+        page = Page(
+            title="Test",
+            slug="test",
+            content="# Test",
+            created_by=admin_user_id,
+            updated_by=admin_user_id,
+            file_path="test.md",
+            updated_at=datetime.now(timezone.utc) - timedelta(hours=1),
+        )
+        db.session.add(page)
+        db.session.commit()
+
+        # Identical to the page, but written just now
+        file_path = os.path.join(temp_pages_dir, "test.md")
+        seed_file(file_path, "# Test")
+        mtime_ns = os.stat(file_path).st_mtime_ns
+        assert sync_utility.should_sync_file("test.md", page) is False
+        assert page.file_mtime_ns is None
+
+        # Same-size edit in the same timestamp tick of a coarse-mtime file
+        # system: the mtime doesn't change, but the edit is still found
+        seed_file(file_path, "# Edit", mtime_ns)
+        assert sync_utility.should_sync_file("test.md", page) is True
+
+
+def test_read_ahead_yields_parsed_files_in_order(temp_pages_dir, app, sync_utility):
+    """Test the read-ahead keeps sync order and leaves failed reads to sync_file"""
+    with app.app_context():
+        app.config["SYNC_READ_AHEAD_WORKERS"] = 2
+        names = [f"page-{i:02d}.md" for i in range(12)]
+        for name in names:
+            with open(os.path.join(temp_pages_dir, name), "w", encoding="utf-8") as f:
+                f.write(f'---\ntitle: "{name}"\n---\n\n# Body')
+
+        to_sync = [
+            (name, os.path.join(temp_pages_dir, name), None)
+            for name in names + ["missing.md"]
+        ]
+        results = list(sync_utility._read_ahead(to_sync))
+
+        assert [r[:2] for r in results] == [item[:2] for item in to_sync]
+        for name, full_path, st, parsed in results[:-1]:
+            assert parsed == ({"title": name}, "# Body")
+            assert st.st_size == os.path.getsize(full_path)
+        assert results[-1][3] is None
@@ -271,9 +271,9 @@ slug: "idempotent"
         page2, status2 = sync_utility.sync_file("idempotent.md", force=False)
         assert status2 is None  # Skipped
 
-        # Third sync with force - should update
+        # Third sync with force - nothing differs, so nothing is updated
         page3, status3 = sync_utility.sync_file("idempotent.md", force=True)
-        assert status3 is False  # Updated
+        assert status3 is None  # Skipped
 
         # All should reference same page
         assert page1.id == page2.id == page3.id
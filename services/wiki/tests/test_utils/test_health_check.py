@@ -1,12 +1,23 @@
 """Tests for health check utility"""
 
 import os
+import sys
 import time
 from unittest.mock import MagicMock, patch
 
+import pytest
 from app.utils.health_check import get_health_status
 
 
+@pytest.fixture(autouse=True)
+def reset_process_info_cache():
+    """Start each test without a cached process snapshot or Process"""
+    with patch("app.utils.health_check._process_info_cache", None), patch(
+        "app.utils.health_check._process", None
+    ):
+        yield
+
+
 def test_get_health_status_basic():
     """Test basic health status without process info"""
     result = get_health_status(
@@ -22,14 +33,11 @@ def test_get_health_status_basic():
 
 
 @patch("app.utils.health_check.PSUTIL_AVAILABLE", True)
+@patch("app.utils.health_check._IS_WINDOWS", False)  # so open_files is called
 @patch("app.utils.health_check.psutil")
 @patch("app.utils.health_check.time.time")
-@patch("app.utils.health_check.platform.system")
-def test_get_health_status_with_psutil(mock_platform, mock_time, mock_psutil):
+def test_get_health_status_with_psutil(mock_time, mock_psutil):
     """Test health status with psutil available"""
-    # Mock platform to be non-Windows so open_files is called
-    mock_platform.return_value = "Linux"
-
     # Mock time to return consistent values
     current_time = 1000000.0
     mock_time.return_value = current_time
@@ -70,14 +78,24 @@ def test_get_health_status_with_psutil(mock_platform, mock_time, mock_psutil):
     assert result["process_info"]["threads"] == 8
     assert result["process_info"]["open_files"] == 2
 
+    # All metrics come from one oneshot() batch, each getter read once
+    assert mock_process.oneshot.call_count == 1
+    for getter in (
+        mock_process.create_time,
+        mock_process.memory_info,
+        mock_process.cpu_percent,
+        mock_process.memory_percent,
+        mock_process.num_threads,
+        mock_process.open_files,
+    ):
+        assert getter.call_count == 1
+
 
 @patch("app.utils.health_check.PSUTIL_AVAILABLE", True)
+@patch("app.utils.health_check._IS_WINDOWS", True)
 @patch("app.utils.health_check.psutil")
-@patch("app.utils.health_check.platform.system")
-def test_get_health_status_windows_skips_open_files(mock_platform, mock_psutil):
+def test_get_health_status_windows_skips_open_files(mock_psutil):
     """Test that open_files is skipped on Windows"""
-    mock_platform.return_value = "Windows"
-
     mock_process = MagicMock()
     mock_process.pid = 12345
     mock_process.create_time.return_value = time.time() - 3600
@@ -104,8 +122,9 @@ def test_get_health_status_windows_skips_open_files(mock_platform, mock_psutil):
 
 
 @patch("app.utils.health_check.PSUTIL_AVAILABLE", False)
-def test_get_health_status_without_psutil():
-    """Test health status when psutil is not available"""
+@patch("app.utils.health_check._read_proc_self_stat", return_value=None)
+def test_get_health_status_without_psutil(mock_read_proc):
+    """Test health status when neither psutil nor /proc is available"""
     result = get_health_status(
         service_name="test-service",
         version="1.0.0",
@@ -168,6 +187,20 @@ def test_get_health_status_psutil_exception(mock_psutil):
     assert result["process_info"]["open_files"] == 0
 
 
+@patch("app.utils.health_check.PSUTIL_AVAILABLE", None)
+@patch("app.utils.health_check.psutil", None)
+def test_get_health_status_imports_psutil_lazily():
+    """Test that psutil is only imported once process info is requested"""
+    import app.utils.health_check as health_check
+
+    get_health_status(service_name="test-service", include_process_info=False)
+    assert health_check.PSUTIL_AVAILABLE is None
+
+    get_health_status(service_name="test-service")
+    assert health_check.PSUTIL_AVAILABLE in (True, False)
+    assert (health_check.psutil is not None) == health_check.PSUTIL_AVAILABLE
+
+
 def test_get_health_status_with_additional_info():
     """Test health status with additional service-specific info"""
     additional_info = {
@@ -224,3 +257,129 @@ def test_get_health_status_standard_format():
     assert isinstance(process_info["memory_percent"], (int, float))
     assert isinstance(process_info["threads"], int)
     assert isinstance(process_info["open_files"], int)
+
+
+@patch("app.utils.health_check.PSUTIL_AVAILABLE", True)
+@patch("app.utils.health_check.psutil")
+def test_get_health_status_caches_process_info(mock_psutil):
+    """Test psutil is read once per TTL window while additional info stays fresh"""
+    mock_process = MagicMock()
+    mock_process.pid = 12345
+    mock_process.create_time.return_value = time.time() - 60
+    mock_process.memory_info.return_value = MagicMock(rss=100 * 1024 * 1024)
+    mock_process.cpu_percent.return_value = 1.0
+    mock_process.memory_percent.return_value = 1.0
+    mock_process.num_threads.return_value = 4
+    mock_process.open_files.return_value = []
+    mock_psutil.Process.return_value = mock_process
+
+    first = get_health_status("test-service", additional_info={"queue_size": 1})
+    first["process_info"]["pid"] = 0  # callers get a copy
+    second = get_health_status("test-service", additional_info={"queue_size": 2})
+
+    assert mock_psutil.Process.call_count == 1
+    assert second["process_info"]["pid"] == 12345
+    assert second["queue_size"] == 2
+
+    with patch("app.utils.health_check.PROCESS_INFO_TTL_SECONDS", 0):
+        get_health_status("test-service")
+    assert mock_psutil.Process.call_count == 2
+
+
+@patch("app.utils.health_check.PSUTIL_AVAILABLE", True)
+@patch("app.utils.health_check.psutil")
+def test_get_health_status_forked_worker_skips_parent_snapshot(mock_psutil):
+    """Test a process snapshot cached before a fork isn't served to the child"""
+    mock_psutil.Process.return_value.create_time.return_value = time.time()
+    mock_psutil.Process.return_value.memory_info.return_value = MagicMock(rss=0)
+
+    get_health_status("test-service")
+    mock_psutil.Process.return_value.pid = os.getpid() + 1
+    with patch("app.utils.health_check.os.getpid", return_value=os.getpid() + 1):
+        result = get_health_status("test-service")
+
+    assert mock_psutil.Process.return_value.oneshot.call_count == 2
+    assert result["process_info"]["pid"] == os.getpid() + 1
+
+
+@patch("app.utils.health_check.PSUTIL_AVAILABLE", True)
+@patch("app.utils.health_check.PROCESS_INFO_TTL_SECONDS", 0)
+@patch("app.utils.health_check.psutil")
+def test_get_health_status_reuses_process(mock_psutil):
+    """Test one psutil.Process serves every probe of the same process"""
+    mock_psutil.Process.return_value.pid = os.getpid()
+    mock_psutil.Process.return_value.create_time.return_value = time.time()
+
+    get_health_status("test-service")
+    get_health_status("test-service")
+
+    assert mock_psutil.Process.call_count == 1
+    assert mock_psutil.Process.return_value.oneshot.call_count == 2
+
+
+def test_get_health_status_runs_dependency_checks_concurrently():
+    """Test dependency checks overlap, and results land under dependencies"""
+
+    def slow_check():
+        time.sleep(0.1)
+        return {"status": "reachable"}
+
+    start = time.monotonic()
+    result = get_health_status(
+        service_name="test-service",
+        include_process_info=False,
+        dependency_checks={"db": slow_check, "cache": slow_check, "queue": slow_check},
+    )
+    elapsed = time.monotonic() - start
+
+    assert elapsed < 0.25
+    assert result["dependencies"] == {
+        "db": {"status": "reachable"},
+        "cache": {"status": "reachable"},
+        "queue": {"status": "reachable"},
+    }
+
+
+def test_get_health_status_dependency_timeout_and_errors():
+    """Test slow or failing checks are reported, and None results are left out"""
+
+    def failing_check():
+        raise RuntimeError("connection refused")
+
+    start = time.monotonic()
+    result = get_health_status(
+        service_name="test-service",
+        include_process_info=False,
+        dependency_checks={
+            "slow": lambda: time.sleep(0.5),
+            "failing": failing_check,
+            "skipped": lambda: None,
+        },
+        dependency_timeout=0.1,
+    )
+
+    assert time.monotonic() - start < 0.4
+    assert result["dependencies"] == {
+        "slow": {"status": "timeout"},
+        "failing": {"status": "error", "error": "connection refused"},
+    }
+    assert "dependencies" not in get_health_status(
+        "test-service",
+        include_process_info=False,
+        dependency_checks={"skipped": lambda: None},
+    )
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="reads /proc")
+@patch("app.utils.health_check.PSUTIL_AVAILABLE", False)
+@patch("app.utils.health_check._process_start", None)
+def test_get_health_status_fast_linux_path():
+    """Test process info is read from /proc/self/stat without psutil"""
+    time.sleep(0.02)
+    process_info = get_health_status("test-service")["process_info"]
+
+    assert process_info["pid"] == os.getpid()
+    assert process_info["uptime_seconds"] > 0
+    assert process_info["threads"] >= 1
+    assert process_info["memory_mb"] > 0
+    assert process_info["note"] == "psutil not available"
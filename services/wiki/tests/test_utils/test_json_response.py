@@ -0,0 +1,57 @@
+"""Tests for JSON response helper"""
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+from app.utils.json_response import json_response
+
+DATA = {
+    "status": "healthy",
+    "service": "wiki",
+    "process_info": {"pid": 1, "memory_mb": 12.5, "threads": 4},
+    "logs": [{"level": "INFO", "message": "Café ✓"}],
+}
+
+
+@patch("app.utils.json_response.ORJSON_AVAILABLE", False)
+def test_json_response_without_orjson(app):
+    """Test that jsonify is used when orjson isn't installed"""
+    with app.app_context():
+        response = json_response(DATA, 201)
+
+    assert response.status_code == 201
+    assert response.mimetype == "application/json"
+    assert response.get_json() == DATA
+
+
+def test_json_response_with_orjson_matches_jsonify(app):
+    """Test that the orjson body decodes to the same data, keys in the same order"""
+    pytest.importorskip("orjson")
+
+    with app.app_context():
+        fast = json_response(DATA)
+        with patch("app.utils.json_response.ORJSON_AVAILABLE", False):
+            fallback = json_response(DATA)
+
+    assert fast.status_code == fallback.status_code == 200
+    assert fast.mimetype == "application/json"
+    fast_data = json.loads(fast.data)
+    assert fast_data == json.loads(fallback.data)
+    assert list(fast_data) == list(json.loads(fallback.data))
+
+
+@patch("app.utils.json_response.ORJSON_AVAILABLE", True)
+@patch("app.utils.json_response.orjson")
+def test_json_response_falls_back_for_unsupported_types(mock_orjson, app):
+    """Test that data orjson can't serialize is handed to jsonify"""
+    mock_orjson.dumps = MagicMock(
+        side_effect=TypeError("Type is not JSON serializable")
+    )
+
+    with app.app_context():
+        response = json_response(DATA)
+
+    mock_orjson.dumps.assert_called_once()
+    assert response.status_code == 200
+    assert response.get_json() == DATA
@@ -1,11 +1,21 @@
 """Tests for in-memory log handler"""
 
 import logging
+import threading
 
 import pytest
 from app.utils.log_handler import InMemoryLogHandler, get_log_handler
 
 
+@pytest.fixture(autouse=True)
+def clean_test_logger():
+    """Detach handlers tests add to test_logger, so they don't pile up"""
+    logger = logging.getLogger("test_logger")
+    handlers = list(logger.handlers)
+    yield
+    logger.handlers[:] = handlers
+
+
 def test_in_memory_log_handler_initialization():
     """Test that log handler initializes correctly"""
     handler = InMemoryLogHandler(max_entries=100)
@@ -24,10 +34,10 @@ def test_in_memory_log_handler_emit():
     logger.error("Test error message")
 
     assert len(handler.logs) == 2
-    assert handler.logs[0]["level"] == "INFO"
-    assert handler.logs[1]["level"] == "ERROR"
-    assert "Test info message" in handler.logs[0]["message"]
-    assert "Test error message" in handler.logs[1]["message"]
+    assert handler.logs[0].levelname == "INFO"
+    assert handler.logs[1].levelname == "ERROR"
+    assert handler.logs[0].raw_message == "Test info message"
+    assert handler.logs[1].raw_message == "Test error message"
 
 
 def test_in_memory_log_handler_get_logs():
@@ -47,6 +57,9 @@ def test_in_memory_log_handler_get_logs():
     assert logs[0]["level"] == "ERROR"
     assert logs[1]["level"] == "WARNING"
 
+    # limit 0 still means every entry
+    assert len(handler.get_recent_logs(limit=0)) == 3
+
 
 def test_in_memory_log_handler_get_logs_with_level_filter():
     """Test filtering logs by level"""
@@ -68,6 +81,9 @@ def test_in_memory_log_handler_get_logs_with_level_filter():
     assert len(info_logs) == 2
     assert all(log["level"] == "INFO" for log in info_logs)
 
+    # Level names match regardless of case
+    assert handler.get_recent_logs(limit=100, level="error") == error_logs
+
 
 def test_in_memory_log_handler_max_entries():
     """Test that log handler respects max_entries limit"""
@@ -83,8 +99,32 @@ def test_in_memory_log_handler_max_entries():
     # Should only keep the most recent max_entries
     assert len(handler.logs) == 5
     # Should have the last 5 messages
-    assert "Message 9" in handler.logs[-1]["message"]
-    assert "Message 5" in handler.logs[0]["message"]
+    assert handler.logs[-1].raw_message == "Message 9"
+    assert handler.logs[0].raw_message == "Message 5"
+
+
+def test_in_memory_log_handler_concurrent_emit_and_read():
+    """Test that threads can log while recent logs are being read"""
+    handler = InMemoryLogHandler(max_entries=5000)
+    logger = logging.getLogger("test_logger")
+    logger.addHandler(handler)
+    logger.setLevel(logging.DEBUG)
+
+    def log_messages(thread_index):
+        for i in range(500):
+            logger.info("Thread %d message %d", thread_index, i)
+
+    threads = [threading.Thread(target=log_messages, args=(n,)) for n in range(4)]
+    for thread in threads:
+        thread.start()
+    while any(thread.is_alive() for thread in threads):
+        # Must not fail with "deque mutated during iteration"
+        handler.get_recent_logs(limit=0)
+    for thread in threads:
+        thread.join()
+
+    assert len(handler.logs) == 2000
+    assert len(handler.get_recent_logs(limit=0, level="INFO")) == 2000
 
 
 def test_in_memory_log_handler_log_format():
@@ -97,7 +137,7 @@ def test_in_memory_log_handler_log_format():
     logger.info("Test message")
 
     assert len(handler.logs) == 1
-    log_entry = handler.logs[0]
+    log_entry = handler.get_recent_logs()[0]
     assert "timestamp" in log_entry
     assert "level" in log_entry
     assert "message" in log_entry
@@ -108,6 +148,26 @@ def test_in_memory_log_handler_log_format():
     assert "process" in log_entry
     assert "thread" in log_entry
     assert "threadName" in log_entry
+    assert log_entry["message"].endswith("[INFO] test_logger: Test message")
+    assert log_entry["raw_message"] == "Test message"
+
+
+def test_in_memory_log_handler_formats_exceptions():
+    """Test that the formatted message keeps the traceback of logged exceptions"""
+    handler = InMemoryLogHandler(max_entries=100)
+    logger = logging.getLogger("test_logger")
+    logger.addHandler(handler)
+    logger.setLevel(logging.DEBUG)
+
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        logger.exception("Failed with %s", "details")
+
+    log_entry = handler.get_recent_logs()[0]
+    assert log_entry["raw_message"] == "Failed with details"
+    assert "Traceback" in log_entry["message"]
+    assert "ValueError: boom" in log_entry["message"]
 
 
 def test_get_log_handler_singleton():
@@ -1,32 +1,83 @@
 """Test markdown service"""
 
+import pytest
 from app.utils.markdown_service import (
     extract_internal_links,
     markdown_to_html,
     parse_frontmatter,
+    strip_frontmatter,
 )
 
 
-def test_parse_frontmatter_with_frontmatter():
-    """Test parsing content with frontmatter"""
-    content = """---
-title: Test Page
-slug: test-page
----
-# Content here
-"""
-    frontmatter, markdown = parse_frontmatter(content)
-    assert frontmatter["title"] == "Test Page"
-    assert frontmatter["slug"] == "test-page"
-    assert "# Content here" in markdown
-
-
-def test_parse_frontmatter_without_frontmatter():
-    """Test parsing content without frontmatter"""
-    content = "# Just markdown content"
+@pytest.mark.parametrize(
+    "content,expected_frontmatter,expected_markdown",
+    [
+        # Frontmatter
+        (
+            "---\ntitle: Test Page\nslug: test-page\n---\n# Content here\n",
+            {"title": "Test Page", "slug": "test-page"},
+            "# Content here\n",
+        ),
+        # No frontmatter: content is returned as is
+        ("# Just markdown content", {}, "# Just markdown content"),
+        # Custom fields (e.g., from AI system)
+        (
+            "---\ntitle: Test Page\nslug: test-page\ntags: [ai, content, wiki]\n"
+            "author: AI Assistant\ncategory: documentation\n---\n# Content here\n",
+            {
+                "title": "Test Page",
+                "slug": "test-page",
+                "tags": ["ai", "content", "wiki"],
+                "author": "AI Assistant",
+                "category": "documentation",
+            },
+            "# Content here\n",
+        ),
+        # All YAML fields are preserved, including nested ones
+        (
+            "---\ntitle: Test\nslug: test\ncustom_field_1: value1\n"
+            "custom_field_2: value2\nnested:\n  field: nested_value\n---\nContent\n",
+            {
+                "title": "Test",
+                "slug": "test",
+                "custom_field_1": "value1",
+                "custom_field_2": "value2",
+                "nested": {"field": "nested_value"},
+            },
+            "Content\n",
+        ),
+    ],
+    ids=["frontmatter", "no-frontmatter", "custom-fields", "all-fields"],
+)
+def test_parse_frontmatter(content, expected_frontmatter, expected_markdown):
+    """Test parsing content with and without frontmatter"""
     frontmatter, markdown = parse_frontmatter(content)
-    assert frontmatter == {}
-    assert markdown == content
+    assert frontmatter == expected_frontmatter
+    assert markdown == expected_markdown
+    assert strip_frontmatter(content) == expected_markdown
+
+
+@pytest.mark.parametrize(
+    "content,expected_link",
+    [
+        (
+            "Check out [this page](page-slug) for more info.",
+            {"text": "this page", "target": "page-slug", "anchor": None},
+        ),
+        (
+            "See [section](page-slug#section-anchor)",
+            {"text": "section", "target": "page-slug", "anchor": "section-anchor"},
+        ),
+        (
+            "See [page](/wiki/pages/my-page)",
+            {"text": "page", "target": "my-page", "anchor": None},
+        ),
+    ],
+    ids=["basic", "with-anchor", "wiki-format"],
+)
+def test_extract_internal_links(content, expected_link):
+    """Test extracting internal links in each supported format"""
+    assert extract_internal_links(content) == [expected_link]
 
 
 def test_markdown_to_html_basic():
@@ -38,73 +89,6 @@ def test_markdown_to_html_basic():
     assert "<strong>bold</strong>" in html
 
 
-def test_extract_internal_links_basic():
-    """Test extracting internal links"""
-    content = "Check out [this page](page-slug) for more info."
-    links = extract_internal_links(content)
-    assert len(links) == 1
-    assert links[0]["target"] == "page-slug"
-    assert links[0]["text"] == "this page"
-
-
-def test_extract_internal_links_with_anchor():
-    """Test extracting links with anchors"""
-    content = "See [section](page-slug#section-anchor)"
-    links = extract_internal_links(content)
-    assert len(links) == 1
-    assert links[0]["target"] == "page-slug"
-    assert links[0]["anchor"] == "section-anchor"
-
-
-def test_extract_internal_links_wiki_format():
-    """Test extracting links in /wiki/pages/ format"""
-    content = "See [page](/wiki/pages/my-page)"
-    links = extract_internal_links(content)
-    assert len(links) == 1
-    assert links[0]["target"] == "my-page"
-
-
-def test_parse_frontmatter_with_custom_fields():
-    """Test parsing frontmatter with custom fields (e.g., from AI system)"""
-    content = """---
-title: Test Page
-slug: test-page
-tags: [ai, content, wiki]
-author: AI Assistant
-category: documentation
----
-# Content here
-"""
-    frontmatter, markdown = parse_frontmatter(content)
-    assert frontmatter["title"] == "Test Page"
-    assert frontmatter["slug"] == "test-page"
-    assert frontmatter["tags"] == ["ai", "content", "wiki"]
-    assert frontmatter["author"] == "AI Assistant"
-    assert frontmatter["category"] == "documentation"
-    assert "# Content here" in markdown
-
-
-def test_parse_frontmatter_preserves_all_fields():
-    """Test that parse_frontmatter preserves all YAML fields"""
-    content = """---
-title: Test
-slug: test
-custom_field_1: value1
-custom_field_2: value2
-nested:
-  field: nested_value
----
-Content
-"""
-    frontmatter, markdown = parse_frontmatter(content)
-    assert frontmatter["title"] == "Test"
-    assert frontmatter["slug"] == "test"
-    assert frontmatter["custom_field_1"] == "value1"
-    assert frontmatter["custom_field_2"] == "value2"
-    assert frontmatter["nested"]["field"] == "nested_value"
-    assert "Content" in markdown
-
-
 def test_markdown_to_html_with_nested_lists():
     """Test markdown to HTML conversion with nested lists"""
     md = """- bullet 1
@@ -347,3 +331,18 @@ Text after.
         or before_table.strip() == ""
         or before_table.endswith("\n")
     )
+
+
+def test_parse_frontmatter_matches_pure_python_loader():
+    """Test the (possibly libyaml) loader parses like yaml.SafeLoader"""
+    import yaml
+
+    frontmatter_str = (
+        "title: Test\ndate: 2024-01-01\norder: 1.5\ndraft: yes\ntags: [a, b]"
+    )
+    frontmatter, _ = parse_frontmatter(f"---\n{frontmatter_str}\n---\n# Content")
+    assert frontmatter == yaml.load(frontmatter_str, Loader=yaml.SafeLoader)
+
+    frontmatter, markdown = parse_frontmatter("---\ntitle: [unclosed\n---\n# Content")
+    assert frontmatter == {}
+    assert markdown == "# Content"
@@ -55,3 +55,22 @@ def test_content_size_excludes_images():
     # Image syntax removal means sizes should be very close
     # Allow for some variance due to whitespace differences
     assert abs(size_with - size_without) < 0.1  # Within 0.1 KB
+
+
+def test_repeated_content_is_measured_once():
+    """Test recently measured content reuses the memoized results"""
+    from unittest.mock import patch
+
+    from app.utils import size_calculator
+
+    content = "# Memo\n\nSome words here " + "x" * 37
+    assert calculate_word_count(content) == 5
+    size_kb = calculate_content_size_kb(content)
+
+    with patch.object(size_calculator, "_count_words") as mock_count, patch.object(
+        size_calculator, "_content_size_kb"
+    ) as mock_size:
+        assert calculate_word_count(content) == 5
+        assert calculate_content_size_kb(content) == size_kb
+    mock_count.assert_not_called()
+    mock_size.assert_not_called()
@@ -16,6 +16,24 @@ ROLE_HIERARCHY = {
 # Valid roles
 VALID_ROLES = set(ROLE_HIERARCHY.keys())
 
+# Every (user_role, required_role) pair has_role() allows. With four roles
+# the whole decision table is 10 pairs, so a check is one set lookup and
+# invalid roles are simply absent.
+_ALLOWED_ROLE_PAIRS = frozenset(
+    (user_role, required_role)
+    for user_role, user_level in ROLE_HIERARCHY.items()
+    for required_role, required_level in ROLE_HIERARCHY.items()
+    if user_level >= required_level
+)
+
+# Role required for each permission checked by has_permission()
+_PERMISSION_TO_ROLE = {
+    "read": "viewer",
+    "play": "player",
+    "write": "writer",
+    "admin": "admin",
+}
+
 
 def has_role(user_role: str, required_role: str) -> bool:
     """
@@ -33,14 +51,8 @@ def has_role(user_role: str, required_role: str) -> bool:
         >>> has_role("player", "writer")  # False - player < writer
         >>> has_role("writer", "writer")  # True - writer >= writer
     """
-    user_level = ROLE_HIERARCHY.get(user_role, -1)
-    required_level = ROLE_HIERARCHY.get(required_role, -1)
-
-    # Invalid roles return False
-    if user_level == -1 or required_level == -1:
-        return False
-
-    return user_level >= required_level
+    # Invalid roles return False (they're in no allowed pair)
+    return (user_role, required_role) in _ALLOWED_ROLE_PAIRS
 
 
 def has_permission(user_role: str, permission: str) -> bool:
@@ -63,14 +75,7 @@ def has_permission(user_role: str, permission: str) -> bool:
         - "write" -> writer
         - "admin" -> admin
     """
-    permission_to_role = {
-        "read": "viewer",
-        "play": "player",
-        "write": "writer",
-        "admin": "admin",
-    }
-
-    required_role = permission_to_role.get(permission)
+    required_role = _PERMISSION_TO_ROLE.get(permission)
     if not required_role:
         return False
 
@@ -95,4 +100,5 @@ def can_access_resource(user_role: str, resource_role: str) -> bool:
         >>> can_access_resource("writer", "player")  # True - writer can access player resources
         >>> can_access_resource("viewer", "writer")  # False - viewer cannot access writer resources
     """
-    return has_role(user_role, resource_role)
+    # Same check as has_role(), inlined to save a call on every resource check
+    return (user_role, resource_role) in _ALLOWED_ROLE_PAIRS
@@ -2,18 +2,30 @@
 
 import time
 import uuid
+from unittest.mock import patch
 
 import jwt
+import pytest
 
+from shared.auth.tokens import validation
 from shared.auth.tokens.validation import (
     decode_token,
     get_token_role,
     get_token_user_id,
     is_token_expired,
     validate_jwt_token,
+    validate_jwt_tokens,
 )
 
 
+@pytest.fixture(autouse=True)
+def clear_validation_cache():
+    """Start each test without remembered validations"""
+    validation._validation_cache.clear()
+    yield
+    validation._validation_cache.clear()
+
+
 class TestValidateJWTToken:
     """Tests for validate_jwt_token function"""
 
@@ -53,6 +65,14 @@ class TestValidateJWTToken:
         result = validate_jwt_token(invalid_token, secret)
         assert result is None
 
+    def test_validate_malformed_token_skips_decode(self):
+        """Test that tokens not shaped like a JWT are rejected without decoding"""
+        with patch.object(jwt, "decode") as mock_decode:
+            for token in ["", "not-a-token", "a.b", "a.b.c.d", "a b.c.d", "ä.b.c"]:
+                assert validate_jwt_token(token, "test-secret-key") is None
+
+        mock_decode.assert_not_called()
+
     def test_validate_token_wrong_secret(self):
         """Test validation with wrong secret key"""
         secret = "test-secret-key"
@@ -86,6 +106,129 @@ class TestValidateJWTToken:
         assert result is None
 
 
+class TestValidationCache:
+    """Tests for the validate_jwt_token result cache"""
+
+    @staticmethod
+    def _token(secret="test-secret-key", expires_in=3600):
+        payload = {
+            "user_id": "123e4567-e89b-12d3-a456-426614174000",
+            "role": "admin",
+            "exp": int(time.time()) + expires_in,
+        }
+        return jwt.encode(payload, secret, algorithm="HS256")
+
+    def test_repeated_validation_decodes_once(self):
+        """Test that a token validated again is served from the cache"""
+        token = self._token()
+
+        with patch.object(jwt, "decode", wraps=jwt.decode) as mock_decode:
+            first = validate_jwt_token(token, "test-secret-key")
+            second = validate_jwt_token(token, "test-secret-key")
+
+        assert first == second
+        assert second["role"] == "admin"
+        assert mock_decode.call_count == 1
+
+    def test_cached_payload_is_a_copy(self):
+        """Test that changing a returned payload doesn't change later results"""
+        token = self._token()
+
+        validate_jwt_token(token, "test-secret-key")["role"] = "viewer"
+        assert validate_jwt_token(token, "test-secret-key")["role"] == "admin"
+
+    def test_cache_is_per_secret_and_algorithm(self):
+        """Test that a cached validation isn't reused for another secret or algorithm"""
+        token = self._token()
+
+        assert validate_jwt_token(token, "test-secret-key") is not None
+        assert validate_jwt_token(token, "wrong-secret-key") is None
+        assert validate_jwt_token(token, "test-secret-key", algorithm="HS512") is None
+
+    def test_cache_keys_hold_neither_token_nor_secret(self):
+        """Test that entries are keyed by a short digest, not the token itself"""
+        token = self._token()
+        validate_jwt_token(token, "test-secret-key")
+
+        (key,) = validation._validation_cache
+        assert len(key) == 16
+        assert token.encode() not in key
+        assert key != validation._validation_cache_key(
+            token, "rotated-secret-key", "HS256"
+        )
+
+    def test_invalid_tokens_are_not_cached(self):
+        """Test that failed validations are retried, not remembered"""
+        validate_jwt_token("invalid.token.here", "test-secret-key")
+        assert len(validation._validation_cache) == 0
+
+    def test_stale_entry_is_verified_again(self):
+        """Test that an entry past its expiry time is dropped and re-verified"""
+        token = self._token()
+        validate_jwt_token(token, "test-secret-key")
+        for key, (_, payload) in list(validation._validation_cache.items()):
+            validation._validation_cache[key] = (time.time() - 1, payload)
+
+        with patch.object(jwt, "decode", wraps=jwt.decode) as mock_decode:
+            assert validate_jwt_token(token, "test-secret-key") is not None
+        assert mock_decode.call_count == 1
+
+    def test_cache_disabled_with_zero_ttl(self):
+        """Test that a TTL of 0 verifies every time"""
+        token = self._token()
+
+        with patch.object(validation, "VALIDATION_CACHE_TTL_SECONDS", 0), patch.object(
+            jwt, "decode", wraps=jwt.decode
+        ) as mock_decode:
+            validate_jwt_token(token, "test-secret-key")
+            validate_jwt_token(token, "test-secret-key")
+
+        assert mock_decode.call_count == 2
+        assert len(validation._validation_cache) == 0
+
+
+class TestValidateJWTTokens:
+    """Tests for validate_jwt_tokens function"""
+
+    def test_validate_batch_in_order(self):
+        """Test that each token gets its own result, in order"""
+        secret = "test-secret-key"
+        valid = jwt.encode(
+            {"role": "admin", "exp": int(time.time()) + 3600}, secret, algorithm="HS256"
+        )
+        expired = jwt.encode(
+            {"role": "admin", "exp": int(time.time()) - 3600}, secret, algorithm="HS256"
+        )
+
+        results = validate_jwt_tokens(
+            [valid, "invalid.token.here", expired, valid], secret
+        )
+
+        assert [r is not None for r in results] == [True, False, False, True]
+        assert results[0] == results[3]
+        assert results[0] is not results[3]
+
+    def test_repeated_tokens_are_verified_once(self):
+        """Test that duplicates in a batch don't verify again"""
+        secret = "test-secret-key"
+        token = jwt.encode(
+            {"role": "admin", "exp": int(time.time()) + 3600}, secret, algorithm="HS256"
+        )
+
+        with patch.object(validation, "VALIDATION_CACHE_TTL_SECONDS", 0), patch.object(
+            jwt, "decode", wraps=jwt.decode
+        ) as mock_decode:
+            results = validate_jwt_tokens([token] * 5, secret)
+
+        assert len(results) == 5
+        assert all(r["role"] == "admin" for r in results)
+        assert mock_decode.call_count == 1
+
+    def test_validate_empty_batch(self):
+        """Test that an empty batch returns an empty list"""
+        assert validate_jwt_tokens([], "test-secret-key") == []
+
+
 class TestDecodeToken:
     """Tests for decode_token function"""
 
@@ -99,7 +242,7 @@ class TestDecodeToken:
         }
         token = jwt.encode(payload, secret, algorithm="HS256")
 
-        result = decode_token(token, secret)
+        result = decode_token(token)
         assert result is not None
         assert result["user_id"] == payload["user_id"]
         assert result["role"] == payload["role"]
@@ -115,16 +258,24 @@ class TestDecodeToken:
         token = jwt.encode(payload, secret, algorithm="HS256")
 
         # decode_token doesn't validate expiration
-        result = decode_token(token, secret)
+        result = decode_token(token)
         assert result is not None
         assert result["user_id"] == payload["user_id"]
 
     def test_decode_invalid_token(self):
         """Test decoding an invalid token"""
         invalid_token = "invalid.token.here"
-        result = decode_token(invalid_token, "secret")
+        result = decode_token(invalid_token)
         assert result is None
 
+    def test_decode_with_secret_is_deprecated(self):
+        """Test that the old (token, secret) form still decodes, with a warning"""
+        token = jwt.encode({"role": "admin"}, "test-secret-key", algorithm="HS256")
+
+        with pytest.warns(DeprecationWarning):
+            result = decode_token(token, "test-secret-key")
+        assert result == {"role": "admin"}
+
 
 class TestIsTokenExpired:
     """Tests for is_token_expired function"""
@@ -169,6 +320,15 @@ class TestGetTokenUserID:
         result = get_token_user_id(payload)
         assert result is None
 
+    def test_get_user_id_repeated(self):
+        """Test that repeated lookups of the same user ID parse consistently"""
+        user_id_str = "123e4567-e89b-12d3-a456-426614174000"
+        first = get_token_user_id({"user_id": user_id_str})
+        second = get_token_user_id({"user_id": user_id_str})
+        assert first == second == uuid.UUID(user_id_str)
+        assert get_token_user_id({"user_id": "not-a-valid-uuid"}) is None
+        assert get_token_user_id({"user_id": "not-a-valid-uuid"}) is None
+
 
 class TestGetTokenRole:
     """Tests for get_token_role function"""
@@ -12,10 +12,12 @@ from .validation import (
     get_token_user_id,
     is_token_expired,
     validate_jwt_token,
+    validate_jwt_tokens,
 )
 
 __all__ = [
     "validate_jwt_token",
+    "validate_jwt_tokens",
     "decode_token",
     "is_token_expired",
     "get_token_user_id",
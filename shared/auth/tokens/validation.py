@@ -6,10 +6,41 @@ that can be used by any service that needs to validate JWT tokens
 from the Auth Service.
 """
 
+import hashlib
+import re
+import threading
+import time
 import uuid
-from typing import Dict, Optional
+import warnings
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 
-import jwt
+# PyJWT is imported on first use (see _get_jwt): it takes tens of ms to
+# import (more with cryptography installed), which services that load this
+# package but validate nothing at startup shouldn't pay
+jwt = None
+
+# Successful validations are remembered so a bearer token reused across
+# requests skips signature verification and JSON decoding. Entries are keyed
+# by a 16-byte secret-keyed digest of (algorithm, token) - the entries hold
+# neither the token nor the secret, though _secret_digest's lru_cache keeps the
+# last few secrets as its keys - and are trusted until the token's exp or the
+# TTL, whichever is first. A TTL of 0 disables the cache.
+VALIDATION_CACHE_SIZE = 10_000
+VALIDATION_CACHE_TTL_SECONDS = 5.0
+_validation_cache: "OrderedDict[bytes, Tuple[float, Dict]]" = OrderedDict()
+_validation_cache_lock = threading.Lock()
+
+# Shape of a compact JWT: three base64url segments (padding tolerated).
+# validate_jwt_token rejects anything else before hashing or decoding - junk
+# input costs one regex match, and the standard-alphabet or whitespace-laden
+# variants PyJWT's lenient base64 decoding would accept aren't issued by us.
+_JWT_RE = re.compile(r"[A-Za-z0-9_=-]+\.[A-Za-z0-9_=-]+\.[A-Za-z0-9_=-]+", re.ASCII)
+
+# Options for decode_token; PyJWT merges them into its defaults without
+# modifying them, so one dict serves every call
+_NO_VERIFY_OPTIONS = {"verify_signature": False}
 
 
 def validate_jwt_token(
@@ -25,7 +56,79 @@ def validate_jwt_token(
 
     Returns:
         Decoded token payload dictionary if valid, None otherwise
+
+    A valid token's payload is remembered for up to
+    VALIDATION_CACHE_TTL_SECONDS (never past its exp), so repeat validations
+    of the same token skip verification.
+    """
+    if isinstance(token, str) and not _JWT_RE.fullmatch(token):
+        return None
+
+    key = None
+    if VALIDATION_CACHE_TTL_SECONDS > 0:
+        key = _validation_cache_key(token, secret, algorithm)
+    if key is None:
+        return _decode_and_verify(token, secret, algorithm)
+
+    now = time.time()
+    with _validation_cache_lock:
+        cached = _validation_cache.get(key)
+        if cached is not None:
+            if now < cached[0]:
+                _validation_cache.move_to_end(key)
+                # A copy, so callers can't change what later hits return
+                return dict(cached[1])
+            del _validation_cache[key]
+
+    payload = _decode_and_verify(token, secret, algorithm)
+    if payload is None:
+        return None
+
+    valid_until = now + VALIDATION_CACHE_TTL_SECONDS
+    exp = payload.get("exp")
+    if exp is not None:
+        valid_until = min(valid_until, exp)
+    with _validation_cache_lock:
+        _validation_cache[key] = (valid_until, dict(payload))
+        if len(_validation_cache) > VALIDATION_CACHE_SIZE:
+            _validation_cache.popitem(last=False)
+    return payload
+
+
+def validate_jwt_tokens(
+    tokens: List[str], secret: str, algorithm: str = "HS256"
+) -> List[Optional[Dict]]:
     """
+    Validate and decode several JWT tokens (e.g. a burst of WebSocket messages).
+
+    Each distinct token is verified once, through validate_jwt_token and its
+    cache; repeats within the batch reuse that result.
+
+    Args:
+        tokens: JWT token strings to validate
+        secret: Secret key used to sign the tokens
+        algorithm: JWT algorithm (default: HS256)
+
+    Returns:
+        One entry per token, in order: the decoded payload if valid, None otherwise
+    """
+    validated: Dict[str, Optional[Dict]] = {}
+    results = []
+    for token in tokens:
+        if token in validated:
+            payload = validated[token]
+            # Each entry gets its own dict, like separate calls would
+            results.append(dict(payload) if payload is not None else None)
+        else:
+            payload = validate_jwt_token(token, secret, algorithm)
+            validated[token] = payload
+            results.append(payload)
+    return results
+
+
+def _decode_and_verify(token: str, secret: str, algorithm: str) -> Optional[Dict]:
+    """validate_jwt_token without the cache"""
+    jwt = _get_jwt()
     try:
         payload = jwt.decode(token, secret, algorithms=[algorithm])
         return payload
@@ -35,7 +138,59 @@ def validate_jwt_token(
         return None
 
 
-def decode_token(token: str, secret: str, algorithm: str = "HS256") -> Optional[Dict]:
+def _get_jwt():
+    """Import PyJWT on first call and return the module"""
+    global jwt
+
+    if jwt is None:
+        import jwt
+    return jwt
+
+
+def _validation_cache_key(token, secret, algorithm: str) -> Optional[bytes]:
+    """
+    16-byte digest identifying a (token, secret, algorithm) validation.
+
+    BLAKE2b keyed with a digest of the secret, so entries are bound to it:
+    after a secret rotation no old entry can match.
+
+    Returns:
+        The digest, or None if token or secret isn't str/bytes (e.g. a key
+        object for an asymmetric algorithm), in which case nothing is cached
+    """
+    if isinstance(token, str):
+        token = token.encode("utf-8")
+    elif not isinstance(token, bytes):
+        return None
+    if not isinstance(secret, (str, bytes)) or not isinstance(algorithm, str):
+        return None
+
+    digest = hashlib.blake2b(key=_secret_digest(secret), digest_size=16)
+    encoded = algorithm.encode("utf-8")
+    # Length-prefixed, so different splits of the same bytes can't collide
+    digest.update(len(encoded).to_bytes(8, "big"))
+    digest.update(encoded)
+    digest.update(token)
+    return digest.digest()
+
+
+@lru_cache(maxsize=16)
+def _secret_digest(secret) -> bytes:
+    """
+    Digest of a str/bytes secret, for use as a BLAKE2b key.
+
+    Cached: a service validates against one or two secrets for its lifetime.
+    The lru_cache keeps the 16 most recent secrets as its keys, so they stay
+    in memory after a rotation until evicted.
+    """
+    if isinstance(secret, str):
+        secret = secret.encode("utf-8")
+    return hashlib.blake2b(secret, digest_size=32).digest()
+
+
+def decode_token(
+    token: str, secret: Optional[str] = None, algorithm: str = "HS256"
+) -> Optional[Dict]:
     """
     Decode a JWT token without validation (for debugging/inspection only).
 
@@ -44,16 +199,24 @@ def decode_token(token: str, secret: str, algorithm: str = "HS256") -> Optional[
 
     Args:
         token: JWT token string to decode
-        secret: Secret key (not used for validation, but required by jwt.decode)
+        secret: Deprecated and ignored - no key is needed when the signature
+            isn't checked. Passing one emits a DeprecationWarning.
         algorithm: JWT algorithm (default: HS256)
 
     Returns:
         Decoded token payload dictionary, None if decoding fails
     """
-    try:
-        payload = jwt.decode(
-            token, secret, algorithms=[algorithm], options={"verify_signature": False}
+    if secret is not None:
+        warnings.warn(
+            "decode_token() no longer uses secret; call decode_token(token, "
+            "algorithm=...) instead",
+            DeprecationWarning,
+            stacklevel=2,
         )
+
+    jwt = _get_jwt()
+    try:
+        payload = jwt.decode(token, algorithms=[algorithm], options=_NO_VERIFY_OPTIONS)
         return payload
     except jwt.InvalidTokenError:
         return None
@@ -73,9 +236,7 @@ def is_token_expired(token_payload: Dict) -> bool:
     if not exp:
         return True  # No expiration claim means invalid/expired
 
-    from time import time
-
-    return exp < int(time())
+    return exp < time.time()
 
 
 def get_token_user_id(token_payload: Dict) -> Optional[uuid.UUID]:
@@ -92,12 +253,29 @@ def get_token_user_id(token_payload: Dict) -> Optional[uuid.UUID]:
     if not user_id_str:
         return None
 
+    if isinstance(user_id_str, str):
+        return _parse_uuid(user_id_str)
+
     try:
         return uuid.UUID(user_id_str)
     except (ValueError, TypeError):
         return None
 
 
+@lru_cache(maxsize=4096)
+def _parse_uuid(value: str) -> Optional[uuid.UUID]:
+    """
+    Parse a UUID string, None if it isn't one.
+
+    Cached: the same few active user IDs arrive on every request, and UUID
+    objects are immutable, so sharing them is safe.
+    """
+    try:
+        return uuid.UUID(value)
+    except (ValueError, TypeError):
+        return None
+
+
 def get_token_role(token_payload: Dict) -> Optional[str]:
     """
     Extract role from token payload.
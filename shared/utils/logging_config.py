@@ -8,10 +8,20 @@ This module provides a centralized logging system with:
 - Automatic log cleanup
 """
 
+import atexit
 import logging
-from logging.handlers import RotatingFileHandler, TimedRotatingFileHandler
+import os
+import queue
+from fnmatch import fnmatch
+from functools import lru_cache
+from logging.handlers import (
+    QueueHandler,
+    QueueListener,
+    RotatingFileHandler,
+    TimedRotatingFileHandler,
+)
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 
 # Default log configuration
 DEFAULT_LOG_DIR = Path("logs")
@@ -21,6 +31,16 @@ DEFAULT_LOG_LEVEL = logging.INFO
 DEFAULT_WHEN = "midnight"  # Rotate at midnight
 DEFAULT_INTERVAL = 1  # Daily rotation
 
+# Formatter shared by every file handler (format strings parsed once)
+_DEFAULT_FORMATTER = logging.Formatter(
+    "%(asctime)s [%(levelname)8s] %(name)s:%(lineno)d - %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+
+# Loggers set up by setup_file_logger, by name. Repeat setups return these
+# without logging.getLogger, which takes logging's module-wide lock.
+_configured_loggers: Dict[str, logging.Logger] = {}
+
 
 def get_log_dir(base_path: Optional[Path] = None) -> Path:
     """
@@ -33,17 +53,33 @@ def get_log_dir(base_path: Optional[Path] = None) -> Path:
         Path to log directory
     """
     if base_path is None:
-        # Try to find project root by looking for common markers
-        current = Path(__file__).resolve()
-        while current != current.parent:
-            if (current / "requirements.txt").exists() or (current / ".git").exists():
-                return current / DEFAULT_LOG_DIR
-            current = current.parent
+        project_root = _find_project_root()
+        if project_root is not None:
+            return project_root / DEFAULT_LOG_DIR
         # Fallback to current directory
         return Path.cwd() / DEFAULT_LOG_DIR
     return base_path / DEFAULT_LOG_DIR
 
 
+@lru_cache(maxsize=None)
+def _find_project_root() -> Optional[Path]:
+    """
+    Find the project root by looking for common markers above this file.
+
+    Cached: the walk stats two paths per directory level, and the answer
+    doesn't change while the process runs.
+
+    Returns:
+        Project root path, or None if no marker was found
+    """
+    current = Path(__file__).resolve()
+    while current != current.parent:
+        if (current / "requirements.txt").exists() or (current / ".git").exists():
+            return current
+        current = current.parent
+    return None
+
+
 def setup_file_logger(
     name: str,
     log_dir: Optional[Path] = None,
@@ -53,10 +89,15 @@ def setup_file_logger(
     use_timed_rotation: bool = False,
     when: str = DEFAULT_WHEN,
     interval: int = DEFAULT_INTERVAL,
+    formatter: Optional[logging.Formatter] = None,
 ) -> logging.Logger:
     """
     Set up a file logger with rotation.
 
+    Records are queued by the logging thread and written to the file by a
+    background QueueListener, so callers don't wait on file I/O. The
+    listener is stopped (flushing queued records) at interpreter exit.
+
     Args:
         name: Logger name (also used as log file name)
         log_dir: Directory for log files (defaults to logs/ in project root)
@@ -66,10 +107,16 @@ def setup_file_logger(
         use_timed_rotation: Use time-based rotation instead of size-based
         when: Time rotation interval ('midnight', 'H', 'D', etc.)
         interval: Number of intervals between rotations
+        formatter: Formatter for the log file (defaults to the standard
+            Arcadium format)
 
     Returns:
         Configured logger instance
     """
+    logger = _configured_loggers.get(name)
+    if logger is not None and logger.handlers:
+        return logger
+
     logger = logging.getLogger(name)
 
     # Don't add handlers if logger already has them
@@ -105,13 +152,19 @@ def setup_file_logger(
         )
 
     # Set formatter
-    formatter = logging.Formatter(
-        "%(asctime)s [%(levelname)8s] %(name)s:%(lineno)d - %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-    )
-    handler.setFormatter(formatter)
+    handler.setFormatter(formatter or _DEFAULT_FORMATTER)
+
+    # File writes (and rotation) happen on the listener's thread
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, handler, respect_handler_level=True)
+    listener.start()
+    # atexit runs handlers last-registered-first, so this stops the listener
+    # before logging's own shutdown closes the file handler (and its
+    # reference keeps the listener alive until then)
+    atexit.register(listener.stop)
 
-    logger.addHandler(handler)
+    logger.addHandler(QueueHandler(log_queue))
+    _configured_loggers[name] = logger
 
     return logger
 
@@ -205,33 +258,44 @@ def cleanup_old_logs(
     deleted_count = 0
     cutoff_time = time.time() - (max_age_days * 24 * 60 * 60)
 
-    # Get all log files
-    log_files = list(log_dir.glob("*.log*"))
+    # Get all log files as (path, mtime, size), one scandir pass and one
+    # stat per file
+    log_files = []
+    with os.scandir(log_dir) as entries:
+        for entry in entries:
+            if not fnmatch(entry.name, "*.log*"):
+                continue
+            try:
+                if not entry.is_file():
+                    continue
+                st = entry.stat()
+            except OSError:
+                continue
+            log_files.append((entry.path, st.st_mtime, st.st_size))
 
     # Delete by age
-    for log_file in log_files:
-        if log_file.stat().st_mtime < cutoff_time:
+    remaining = []
+    for path, mtime, size in log_files:
+        if mtime < cutoff_time:
             try:
-                log_file.unlink()
+                os.unlink(path)
                 deleted_count += 1
+                continue
             except Exception:
                 pass
+        remaining.append((path, mtime, size))
 
     # Delete by total size if specified
     if max_total_size_mb:
         max_total_bytes = max_total_size_mb * 1024 * 1024
-        log_files = sorted(
-            [f for f in log_dir.glob("*.log*") if f.exists()],
-            key=lambda f: f.stat().st_mtime,
-        )
+        log_files = sorted(remaining, key=lambda f: f[1])
 
-        total_size = sum(f.stat().st_size for f in log_files)
+        total_size = sum(size for _, _, size in log_files)
 
         while total_size > max_total_bytes and log_files:
-            oldest = log_files.pop(0)
+            path, _, size = log_files.pop(0)
             try:
-                size = oldest.stat().st_size
-                oldest.unlink()
+                os.unlink(path)
                 total_size -= size
                 deleted_count += 1
             except Exception: